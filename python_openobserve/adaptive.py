@@ -0,0 +1,106 @@
+"""
+OpenObserve adaptive ingestion batch size module
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+# pylint: disable=too-many-arguments,too-many-instance-attributes
+import threading
+from typing import Any, Dict
+
+
+class AdaptiveBatchSize:
+    """
+    Per stream ingestion batch size controller
+
+    Batch size grows by growth factor after each full batch sent under
+    target_latency, shrinks in proportion when latency is over target, and is
+    halved when the server answers 413 (request too large) or the request
+    times out. Batch size stays within min_size and max_size.
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 1000,
+        *,
+        min_size: int = 10,
+        max_size: int = 50000,
+        target_latency: float = 1.0,
+        growth: float = 1.25,
+    ) -> None:
+        """Class __init__
+
+        Args:
+          initial_size: batch size of streams without history
+          min_size: minimum batch size
+          max_size: maximum batch size
+          target_latency: request duration in seconds not to exceed
+          growth: factor applied to batch size after a fast full batch
+        """
+        if not 1 <= min_size <= initial_size <= max_size:
+            raise ValueError("Expecting 1 <= min_size <= initial_size <= max_size")
+        if growth <= 1:
+            raise ValueError("Expecting growth > 1")
+        self.initial_size = initial_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.growth = growth
+        self.sizes: Dict[str, int] = {}
+        self.latencies: Dict[str, float] = {}
+        self.stats = {"grown": 0, "shrunk": 0, "too_large": 0, "timeouts": 0}
+        self._lock = threading.Lock()
+
+    def size(self, stream: str) -> int:
+        """Current batch size of stream"""
+        return self.sizes.get(stream, self.initial_size)
+
+    def record(self, stream: str, count: int, latency: float) -> None:
+        """Adjust batch size of stream after a successful request
+
+        Args:
+          stream: target stream
+          count: number of documents sent
+          latency: request duration in seconds
+        """
+        with self._lock:
+            size = self.size(stream)
+            self.latencies[stream] = latency
+            if latency > self.target_latency:
+                size = max(
+                    self.min_size, int(size * max(0.5, self.target_latency / latency))
+                )
+                self.stats["shrunk"] += 1
+            elif count >= size:
+                # only full batches tell a bigger one would still be fast enough
+                size = min(self.max_size, max(size + 1, int(size * self.growth)))
+                self.stats["grown"] += 1
+            self.sizes[stream] = size
+
+    def shrink(self, stream: str, reason: str) -> int:
+        """Halve batch size of stream after a too large or timed out request
+
+        Args:
+          stream: target stream
+          reason: too_large or timeouts
+
+        Returns:
+          new batch size
+        """
+        with self._lock:
+            self.stats[reason] += 1
+            self.stats["shrunk"] += 1
+            self.sizes[stream] = max(self.min_size, self.size(stream) // 2)
+            return self.sizes[stream]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current batch size and last latency per stream, and adjustment counts"""
+        with self._lock:
+            return {
+                "batch_size": dict(self.sizes),
+                "latency": dict(self.latencies),
+                **self.stats,
+            }
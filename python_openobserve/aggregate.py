@@ -0,0 +1,226 @@
+"""
+OpenObserve partial aggregation module
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+# pylint: disable=too-many-locals,too-few-public-methods
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from sqlglot import exp  # type: ignore
+
+from python_openobserve.sql import clause_int
+
+# aggregate functions whose partial results can be combined, and how
+decomposable_aggregates = {
+    exp.Count: "sum",
+    exp.Sum: "sum",
+    exp.Min: "min",
+    exp.Max: "max",
+    exp.Avg: "avg",
+}
+
+
+def is_aggregate(expression: Any) -> bool:
+    """Tell if parsed sql query groups or aggregates rows"""
+    return bool(expression.args.get("group")) or (
+        expression.find(exp.AggFunc) is not None
+    )
+
+
+def _combine(function: str, left: Any, right: Any) -> Any:
+    """Combine two partial values of an aggregate, None being sql NULL"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if function == "min":
+        return min(left, right)
+    if function == "max":
+        return max(left, right)
+    return left + right
+
+
+def _sort_key(name: str, descending: bool) -> Callable[[Dict], Tuple[bool, Any]]:
+    """Sort key of rows on column name, NULL values last whatever the direction"""
+    if descending:
+        return lambda row: (row[name] is not None, row[name])
+    return lambda row: (row[name] is None, row[name])
+
+
+class PartialAggregate:
+    """
+    Aggregate query split across partitions
+
+    sql is the query to run on each partition: decomposable aggregates are
+    replaced by partial ones (avg by sum and count), and HAVING, ORDER BY and
+    LIMIT are removed. GROUP BY expressions which are not selected are added
+    as hidden key columns. merge() combines partition results per group, then
+    applies ORDER BY, OFFSET and LIMIT of the original query.
+    Output columns are named by their alias, column name, or lower case sql.
+    """
+
+    def __init__(self, expression: Any) -> None:
+        """Class __init__
+
+        Args:
+          expression: sqlglot parsed aggregate query
+        """
+        if expression.args.get("having"):
+            raise ValueError("Can't split aggregate query with HAVING")
+        # output name, aggregate function or None for group keys, partial columns
+        self.columns: List[Tuple[str, Any, List[str]]] = []
+        partial_expressions = []
+        group = expression.args.get("group")
+        group_sqls = {x.sql() for x in group.expressions} if group else set()
+        # sql and output name of selected group keys
+        selected_keys = set()
+        for i, select in enumerate(expression.expressions):
+            name = self._output_name(select)
+            value = select.unalias()
+            if value.sql() in group_sqls or name in group_sqls:
+                self.columns.append((name, None, [name]))
+                selected_keys |= {value.sql(), name}
+                partial_expressions.append(exp.alias_(value, name, quoted=True))
+                continue
+            # unknown functions may be aggregates, anything else is refused
+            function = decomposable_aggregates.get(type(value))
+            if function is None or value.find(exp.Distinct) is not None:
+                raise ValueError(
+                    f"Can't split aggregate {value.sql()}, expecting GROUP BY "
+                    "expression or plain count, sum, min, max or avg"
+                )
+            if function == "avg":
+                partials = [f"_p{i}_sum", f"_p{i}_count"]
+                partial_expressions.append(
+                    exp.alias_(
+                        exp.Sum(this=value.this.copy()), partials[0], quoted=True
+                    )
+                )
+                partial_expressions.append(
+                    exp.alias_(
+                        exp.Count(this=value.this.copy()), partials[1], quoted=True
+                    )
+                )
+            else:
+                partials = [f"_p{i}"]
+                partial_expressions.append(
+                    exp.alias_(value.copy(), partials[0], quoted=True)
+                )
+            self.columns.append((name, function, partials))
+        # GROUP BY expressions which are not selected still split groups,
+        # they are returned as hidden partial key columns
+        self.hidden_keys: List[str] = []
+        for j, key in enumerate(group.expressions if group else []):
+            if key.sql() not in selected_keys:
+                self.hidden_keys.append(f"_g{j}")
+                partial_expressions.append(
+                    exp.alias_(key.copy(), self.hidden_keys[-1], quoted=True)
+                )
+
+        self.order = self._order(expression)
+        self.offset = self._int_arg(expression, "offset")
+        self.limit = self._int_arg(expression, "limit")
+        partial = expression.copy()
+        for arg in ("having", "order", "limit", "offset"):
+            partial.set(arg, None)
+        partial.set("expressions", partial_expressions)
+        group_keys = [
+            name for name, function, _ in self.columns if function is None
+        ] + self.hidden_keys
+        if group_keys:
+            # stable group order for paging through partition results
+            partial = partial.order_by(
+                *(exp.column(name, quoted=True) for name in group_keys)
+            )
+        self.sql = partial.sql()
+
+    @staticmethod
+    def _output_name(select: Any) -> str:
+        """Result column name of a select expression"""
+        if isinstance(select, (exp.Alias, exp.Column)):
+            return select.alias_or_name
+        return select.sql(normalize_functions="lower")
+
+    def _order(self, expression: Any) -> List[Tuple[str, bool]]:
+        """Output column and direction of each ORDER BY term"""
+        order = expression.args.get("order")
+        if order is None:
+            return []
+        names = {
+            select.unalias().sql(): self._output_name(select)
+            for select in expression.expressions
+        }
+        terms = []
+        for ordered in order.expressions:
+            key = ordered.this
+            if isinstance(key, exp.Column) and key.name in {
+                name for name, _, _ in self.columns
+            }:
+                name = key.name
+            elif key.sql() in names:
+                name = names[key.sql()]
+            else:
+                raise ValueError(
+                    f"Can't split aggregate query ordered by {key.sql()}, "
+                    "expecting a selected column"
+                )
+            terms.append((name, bool(ordered.args.get("desc"))))
+        return terms
+
+    @staticmethod
+    def _int_arg(expression: Any, arg: str) -> int:
+        """Integer value of LIMIT or OFFSET clause, 0 if absent"""
+        return clause_int(expression, arg) or 0
+
+    def merge(self, results: Iterable[Iterable[Dict]]) -> List[Dict]:
+        """Combine partial results of partitions into final rows
+
+        Args:
+          results: rows returned by the partition query for each partition
+        """
+        # combine function of each partial column, None for group keys
+        combines = [
+            None if function is None else "sum" if function == "avg" else function
+            for _, function, partials in self.columns
+            for _ in partials
+        ]
+        partial_names = [partial for _, _, p in self.columns for partial in p]
+        group_keys = [
+            name for name, function, _ in self.columns if function is None
+        ] + self.hidden_keys
+        groups: Dict[Tuple[Any, ...], List[Any]] = {}
+        for rows in results:
+            for row in rows:
+                values = [row.get(partial) for partial in partial_names]
+                key = tuple(row.get(name) for name in group_keys)
+                group = groups.setdefault(key, values)
+                if group is values:
+                    continue
+                for i, combine in enumerate(combines):
+                    if combine is not None:
+                        group[i] = _combine(combine, group[i], values[i])
+
+        merged = [self._finalize(values) for values in groups.values()]
+        for name, descending in reversed(self.order):
+            merged.sort(key=_sort_key(name, descending), reverse=descending)
+        merged = merged[self.offset :]
+        if self.limit:
+            merged = merged[: self.limit]
+        return merged
+
+    def _finalize(self, values: List[Any]) -> Dict:
+        """Build final row from combined partial values"""
+        row = {}
+        i = 0
+        for name, function, partials in self.columns:
+            if function == "avg":
+                total, count = values[i], values[i + 1]
+                row[name] = total / count if count else None
+            else:
+                row[name] = values[i]
+            i += len(partials)
+        return row
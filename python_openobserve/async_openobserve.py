@@ -0,0 +1,1347 @@
+"""
+OpenObserve asyncio API module
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+# pylint: disable=too-many-arguments,too-many-locals,broad-exception-raised,broad-exception-caught,duplicate-code,too-many-public-methods,too-many-lines
+import asyncio
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    TYPE_CHECKING,
+)
+
+import httpx  # type: ignore
+
+from python_openobserve.adaptive import AdaptiveBatchSize
+from python_openobserve.cache import SearchCache
+from python_openobserve.json_codec import JsonCodec, aiter_json_array
+from python_openobserve.openobserve import (
+    BULK_CHUNK_BYTES,
+    BULK_CHUNK_SIZE,
+    COMPRESSION_THRESHOLD,
+    OpenObserveBase,
+    export_mapping,
+    file_formats,
+    id_mapping,
+    key_mapping,
+    name_mapping,
+)
+from python_openobserve.spool import Spool
+from python_openobserve.sql import parse_sql
+
+if TYPE_CHECKING:
+    import pandas
+    import polars  # type: ignore
+    from python_openobserve.aggregate import PartialAggregate
+
+
+class AsyncOpenObserve(OpenObserveBase):
+    """
+    OpenObserve asyncio class based on OpenObserve REST API
+
+    Same options and methods as OpenObserve, network methods being coroutines
+    sharing one pooled httpx.AsyncClient. search_iter(), search_lazy() and
+    search_stream() are async generators.
+    """
+
+    _client: httpx.AsyncClient
+
+    # own signature, so argument errors name AsyncOpenObserve
+    def __init__(  # pylint: disable=useless-parent-delegation
+        self,
+        user: str,
+        password: str,
+        *,
+        organisation: str = "default",
+        host: str = "http://localhost:5080",
+        verify: bool = True,
+        timeout: int = 10,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        spool: Optional[Spool] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = COMPRESSION_THRESHOLD,
+        compression_level: Optional[int] = None,
+        json_codec: Optional[Union[str, JsonCodec]] = None,
+        adaptive_batch_size: Optional[AdaptiveBatchSize] = None,
+        search_cache: Optional[SearchCache] = None,
+    ) -> None:
+        """Class __init__, same arguments as OpenObserve"""
+        super().__init__(
+            user,
+            password,
+            organisation=organisation,
+            host=host,
+            verify=verify,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            spool=spool,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            compression_level=compression_level,
+            json_codec=json_codec,
+            adaptive_batch_size=adaptive_batch_size,
+            search_cache=search_cache,
+        )
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled async http client used by all requests"""
+        return httpx.AsyncClient(
+            verify=self.verify,
+            timeout=self.timeout,
+            limits=self.limits,
+        )
+
+    def __enter__(self) -> AsyncOpenObserve:
+        raise TypeError("AsyncOpenObserve must be used with 'async with'")
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    async def __aenter__(self) -> AsyncOpenObserve:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying http client and its pooled connections"""
+        await self._client.aclose()
+
+    async def index(self, index: str, document: dict) -> List[dict]:
+        """Index a document in OpenObserve"""
+        document = self._prepare_document(document)
+
+        response_json = await self._post_bulk(index, [self._dumps(document)], "index")
+        self._check_index_response(response_json, document)
+        return response_json
+
+    async def index_many(
+        self,
+        index: str,
+        documents: Iterable[dict],
+        *,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        chunk_bytes: int = BULK_CHUNK_BYTES,
+        verbosity: int = 0,
+    ) -> Dict[str, int]:
+        """Index many documents in OpenObserve, one request per chunk
+
+        Args:
+          index: target stream
+          documents: iterable or generator of documents, consumed lazily
+          chunk_size: maximum number of documents per request,
+                      replaced by adaptive batch size if configured
+          chunk_bytes: maximum serialized size of request body
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful and failed document counts summed over all requests,
+          and spooled count if a spool is configured
+        """
+        counts = {"successful": 0, "failed": 0}
+        for chunk in self._bulk_chunks(documents, chunk_size, chunk_bytes, index):
+            self._debug(f"index_many {index}: {len(chunk)} documents", verbosity, 2)
+            self._sum_status(await self._post_bulk(index, chunk), counts)
+        self._debug(f"index_many {index}: {counts}", verbosity, 1)
+        return counts
+
+    async def index_stream(
+        self,
+        index: str,
+        documents: Iterable[dict],
+        *,
+        buffer_bytes: int = 64 * 1024,
+        verbosity: int = 0,
+    ) -> Dict[str, int]:
+        """Index documents with one streamed request to the _multi endpoint
+
+        Note: the body can't be spooled or retried, use index_many() for that.
+
+        Args:
+          index: target stream
+          documents: iterable or generator of documents, consumed lazily
+          buffer_bytes: size of body chunks written to the connection
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful and failed document counts
+        """
+        headers = {**self.headers, "Content-Type": "application/x-ndjson"}
+        body = self._ndjson_body(documents, buffer_bytes)
+        if self.compression is not None:
+            # body size is unknown upfront, compression threshold doesn't apply
+            headers["Content-Encoding"] = self.compression
+            body = self._compress_stream(body)
+
+        async def content() -> AsyncIterator[bytes]:
+            # the async client only streams async iterables
+            for chunk in body:
+                yield chunk
+
+        res = await self._client.post(
+            self._stream_url(index, "_multi"),
+            headers=headers,
+            content=content(),
+            timeout=self.timeout,
+        )
+        counts = {"successful": 0, "failed": 0}
+        self._sum_status(self._handle_response(res, "index_stream"), counts)
+        self._debug(f"index_stream {index}: {counts}", verbosity, 1)
+        return counts
+
+    async def index_dataframe(
+        self,
+        index: str,
+        df: Any,
+        *,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        chunk_bytes: int = BULK_CHUNK_BYTES,
+        verbosity: int = 0,
+    ) -> Dict[str, int]:
+        """Index rows of a pandas or polars DataFrame, one request per chunk
+
+        Args:
+          index: target stream
+          df: pandas or polars DataFrame
+          chunk_size: maximum number of rows per request
+          chunk_bytes: maximum serialized size of request body
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful and failed row counts summed over all requests,
+          and spooled count if a spool is configured
+        """
+        counts = {"successful": 0, "failed": 0}
+        for body, count in self._dataframe_bodies(df, chunk_size, chunk_bytes):
+            self._debug(f"index_dataframe {index}: {count} rows", verbosity, 2)
+            self._sum_status(
+                await self._post_json(index, body, count, "index_dataframe"), counts
+            )
+        self._debug(f"index_dataframe {index}: {counts}", verbosity, 1)
+        return counts
+
+    async def ingest_file(
+        self,
+        index: str,
+        path: Union[str, Path],
+        *,
+        format: Optional[str] = None,  # pylint: disable=redefined-builtin
+        chunk_size: int = BULK_CHUNK_SIZE,
+        chunk_bytes: int = BULK_CHUNK_BYTES,
+        concurrency: int = 4,
+        verbosity: int = 0,
+    ) -> Dict[str, int]:
+        """Index a parquet, arrow/feather or ndjson file, one request per chunk
+
+        Up to concurrency requests are sent at the same time.
+
+        Args:
+          index: target stream
+          path: file path
+          format: parquet, arrow or ndjson, default: guessed from file suffix
+          chunk_size: maximum number of rows per request
+          chunk_bytes: maximum serialized size of request body
+          concurrency: maximum number of requests in flight
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful and failed row counts summed over all requests,
+          and spooled count if a spool is configured
+        """
+        path = Path(path)
+        file_format = format or file_formats.get(path.suffix.lower(), path.suffix)
+        if file_format not in file_formats.values():
+            raise ValueError(
+                f"Invalid file format {file_format} for {path}, "
+                f"expecting one of {sorted(set(file_formats.values()))}"
+            )
+        counts = {"successful": 0, "failed": 0}
+        pending: Deque[asyncio.Task] = deque()
+        try:
+            for body, count in self._file_bodies(
+                path, file_format, chunk_size, chunk_bytes
+            ):
+                self._debug(f"ingest_file {index}: {count} rows", verbosity, 2)
+                pending.append(
+                    asyncio.ensure_future(
+                        self._post_json(index, body, count, "ingest_file")
+                    )
+                )
+                if len(pending) >= concurrency:
+                    self._sum_status(await pending.popleft(), counts)
+            while pending:
+                self._sum_status(await pending.popleft(), counts)
+        finally:
+            for task in pending:
+                task.cancel()
+        self._debug(f"ingest_file {index} {path}: {counts}", verbosity, 1)
+        return counts
+
+    async def index_raw(
+        self,
+        index: str,
+        data: Union[str, bytes, bytearray, memoryview, Iterable[Any]],
+        *,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        chunk_bytes: int = BULK_CHUNK_BYTES,
+        verbosity: int = 0,
+    ) -> Dict[str, int]:
+        """Index already serialized json documents, one request per chunk
+
+        Args:
+          index: target stream
+          data: newline delimited json as str, bytes, bytearray or memoryview,
+                or iterable of json lines as bytes or str, consumed lazily
+          chunk_size: maximum number of documents per request,
+                      replaced by adaptive batch size if configured
+          chunk_bytes: maximum serialized size of request body
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful and failed document counts summed over all requests,
+          and spooled count if a spool is configured
+        """
+        counts = {"successful": 0, "failed": 0}
+        for chunk in self._raw_chunks(
+            self._raw_lines(data), chunk_size, chunk_bytes, index
+        ):
+            self._debug(f"index_raw {index}: {len(chunk)} documents", verbosity, 2)
+            self._sum_status(await self._post_bulk(index, chunk, "index_raw"), counts)
+        self._debug(f"index_raw {index}: {counts}", verbosity, 1)
+        return counts
+
+    async def bulk(self, body: bytes, verbosity: int = 0) -> Dict:
+        """Send an Elasticsearch compatible bulk request to the _bulk endpoint
+
+        Args:
+          body: newline delimited json of action and source lines
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          bulk response with one entry per action in items
+        """
+        content, headers = self._request_body(
+            body, {**self.headers, "Content-Type": "application/x-ndjson"}
+        )
+        res = await self._client.post(
+            self.openobserve_url.replace("[STREAM]", "_bulk"),
+            headers=headers,
+            content=content,
+            timeout=self.timeout,
+        )
+        response_json = cast(Dict, self._handle_response(res, "bulk"))
+        self._debug(
+            f"bulk: {len(response_json.get('items', []))} item(s), "
+            f"errors: {response_json.get('errors')}",
+            verbosity,
+            2,
+        )
+        return response_json
+
+    async def _ingest_chunk(
+        self, index: str, chunk: List[Tuple[dict, bytes]]
+    ) -> List[Tuple[Optional[int], Any]]:
+        """Post documents to the _bulk endpoint, return (status, error) of each
+
+        status is None when the request failed before the server answered.
+        """
+        content, headers = self._ingest_body(index, chunk)
+        try:
+            res = await self._client.post(
+                self.openobserve_url.replace("[STREAM]", "_bulk"),
+                headers=headers,
+                content=content,
+                timeout=self.timeout,
+            )
+        except httpx.TransportError as exc:
+            return [(None, str(exc))] * len(chunk)
+        return self._ingest_statuses(res, len(chunk))
+
+    async def ingest(
+        self,
+        index: str,
+        documents: Iterable[dict],
+        *,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        chunk_bytes: int = BULK_CHUNK_BYTES,
+        max_retries: int = 0,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        verbosity: int = 0,
+    ) -> Dict[str, Any]:
+        """Index documents with a status per document, retrying failed ones only
+
+        Args:
+          index: target stream
+          documents: iterable or generator of documents, consumed lazily
+          chunk_size: maximum number of documents per request
+          chunk_bytes: maximum serialized size of request body
+          max_retries: number of retries of failed documents
+          initial_backoff: seconds before first retry
+          max_backoff: maximum seconds between retries
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful, failed and retried document counts, spooled count if a
+          spool is configured, and errors listing document, status and error
+          of each failed document
+        """
+        result = self._ingest_result()
+        for chunk in self._ingest_chunks(index, documents, chunk_size, chunk_bytes):
+            await self._ingest_retry(
+                index,
+                chunk,
+                result,
+                max_retries=max_retries,
+                initial_backoff=initial_backoff,
+                max_backoff=max_backoff,
+            )
+        self._debug(
+            f"ingest {index}: "
+            + str({key: val for key, val in result.items() if key != "errors"}),
+            verbosity,
+            1,
+        )
+        return result
+
+    async def _ingest_retry(
+        self,
+        index: str,
+        chunk: List[Tuple[dict, bytes]],
+        result: Dict[str, Any],
+        *,
+        max_retries: int,
+        initial_backoff: float,
+        max_backoff: float,
+    ) -> None:
+        """Send chunk with ingest(), retrying retryable failures, update result"""
+        for attempt in range(max_retries + 1):
+            if attempt:
+                await asyncio.sleep(
+                    min(max_backoff, initial_backoff * 2 ** (attempt - 1))
+                )
+                result["retried"] += len(chunk)
+            retry = self._ingest_sort(
+                chunk, await self._ingest_chunk(index, chunk), result
+            )
+            if not retry:
+                return
+            chunk = [entry for entry, _, _ in retry]
+        self._ingest_give_up(index, retry, result)
+
+    async def _post_bulk(
+        self, index: str, documents: List[bytes], action: str = "index_many"
+    ) -> Any:
+        """Post serialized documents to stream ingestion endpoint
+
+        With adaptive batch size, batches rejected as too large (413) are split
+        in halves sent again.
+        """
+        response_json = await self._post_json(
+            index,
+            self._json_array(documents),
+            len(documents),
+            action,
+            split=len(documents) > 1,
+        )
+        if response_json is not None:
+            return response_json
+        half = len(documents) // 2
+        return {
+            "status": (await self._post_bulk(index, documents[:half], action))["status"]
+            + (await self._post_bulk(index, documents[half:], action))["status"]
+        }
+
+    async def _post_json(
+        self,
+        index: str,
+        body: bytes,
+        count: int,
+        action: str = "index_many",
+        *,
+        split: bool = False,
+    ) -> Any:
+        """Post json array body of count documents to stream ingestion endpoint
+
+        Spool and adaptive batch size are handled like OpenObserve._post_json().
+        """
+        content, headers = self._request_body(body)
+        res: Optional[httpx.Response] = None
+        started = time.monotonic()
+        try:
+            res = await self._client.post(
+                self._stream_url(index),
+                headers=headers,
+                content=content,
+                timeout=self.timeout,
+            )
+        except httpx.TransportError as exc:
+            self._post_json_error(index, exc)
+        return self._post_json_result(
+            index, body, count, res, started=started, action=action, split=split
+        )
+
+    async def replay_spool(self, verbosity: int = 0) -> int:
+        """Send spooled batches again, in order, once the server is back
+
+        Batches rejected with a non retryable status are dropped.
+
+        Args:
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          number of batches replayed
+        """
+        if self.spool is None:
+            return 0
+
+        async def send(stream: str, body: bytes) -> None:
+            content, headers = self._request_body(body)
+            res = await self._client.post(
+                self._stream_url(stream),
+                headers=headers,
+                content=content,
+                timeout=self.timeout,
+            )
+            self._replay_response(stream, res, verbosity)
+
+        count = await self.spool.replay_async(send)
+        self._debug(f"replay_spool replayed {count} batch(es)", verbosity, 1)
+        return count
+
+    async def search(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int] = 0,
+        end_time: Union[datetime, int] = 0,
+        query_size: int = 1000,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
+    ) -> List[Dict]:
+        """
+        OpenObserve search function
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          query_size: maximum number of results returned (default: 1000)
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
+        """
+        query = self._search_query(
+            sql, start_time, end_time, query_size, verbosity, validate=validate
+        )
+        response_json = await self._post_search(
+            query, timeout, "search", validate=validate
+        )
+        return self._search_hits(
+            response_json, verbosity, timestamp_conversion_auto, timestamp_columns
+        )
+
+    async def _post_search(
+        self,
+        query: dict,
+        timeout: int,
+        action: str = "search",
+        *,
+        cache: bool = True,
+        validate: bool = True,
+    ) -> Any:
+        """Post search query, using search cache if configured and cache is set"""
+        key, cached = (
+            self._cached_search(query, validate=validate) if cache else (None, None)
+        )
+        if cached is not None:
+            return cached
+        content, headers = self._request_body(self._dumps(query))
+        res = await self._client.post(
+            f"{self.openobserve_url.replace('/[STREAM]', '')}/_search",
+            content=content,
+            headers=headers,
+            timeout=timeout,
+        )
+        response_json = self._handle_response(res, action)
+        if key is not None:
+            self.search_cache.put(key, res.content)  # type: ignore[union-attr]
+        return response_json
+
+    async def search_iter(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int] = 0,
+        end_time: Union[datetime, int] = 0,
+        page_size: int = 1000,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
+    ) -> AsyncIterator[Dict]:
+        """Search and lazily yield all hits, one request per page
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          page_size: number of hits per request
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout of each request
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
+        """
+        if page_size < 1:
+            raise ValueError("Expecting page_size >= 1")
+        query = self._search_query(
+            sql, start_time, end_time, page_size, verbosity, validate=validate
+        )
+        async for hit in self._search_pages(
+            query,
+            timeout,
+            verbosity,
+            timestamp_conversion_auto,
+            timestamp_columns,
+            validate=validate,
+        ):
+            yield hit
+
+    async def _search_pages(
+        self,
+        query: dict,
+        timeout: int,
+        verbosity: int,
+        timestamp_conversion_auto: bool,
+        timestamp_columns: Union[List[str], None],
+        *,
+        cache: bool = True,
+        validate: bool = True,
+    ) -> AsyncIterator[Dict]:
+        """Yield hits of search query page by page until a short page"""
+        page_size = query["query"]["size"]
+        while True:
+            hits = self._search_hits(
+                await self._post_search(
+                    query, timeout, "search_iter", cache=cache, validate=validate
+                ),
+                verbosity,
+                timestamp_conversion_auto,
+                timestamp_columns,
+            )
+            self._debug(
+                f"search_iter: {len(hits)} hits from {query['query']['from']}",
+                verbosity,
+                2,
+            )
+            for hit in hits:
+                yield hit
+            if len(hits) < page_size:
+                return
+            query["query"]["from"] += len(hits)
+            # release page before requesting the next one
+            del hits
+
+    async def search_lazy(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int] = 0,
+        end_time: Union[datetime, int] = 0,
+        query_size: int = 1000,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
+    ) -> AsyncIterator[Dict]:
+        """Search and yield hits one at a time while the response is received
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          query_size: maximum number of results returned (default: 1000)
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
+        """
+        query = self._search_query(
+            sql, start_time, end_time, query_size, verbosity, validate=validate
+        )
+        content, headers = self._request_body(self._dumps(query))
+        async with self._client.stream(
+            "POST",
+            f"{self.openobserve_url.replace('/[STREAM]', '')}/_search",
+            content=content,
+            headers=headers,
+            timeout=timeout,
+        ) as res:
+            if res.status_code != httpx.codes.OK:
+                await res.aread()
+                raise Exception(
+                    f"Openobserve search_lazy returned {res.status_code}. Text: {res.text}"
+                )
+            metadata: Dict[str, Any] = {}
+            async for hit in aiter_json_array(res.aiter_bytes(), "hits", metadata):
+                yield self._convert_hit(
+                    hit, timestamp_conversion_auto, timestamp_columns
+                )
+            self._debug(f"search_lazy: {metadata}", verbosity, 2)
+
+    async def search_stream(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int] = 0,
+        end_time: Union[datetime, int] = 0,
+        query_size: int = 1000,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Search with the streaming endpoint, yield events as they arrive
+
+        Events are (event, data) tuples like OpenObserve.search_stream().
+        Closing the generator cancels the search and closes the connection.
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          query_size: maximum number of results returned (default: 1000)
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
+        """
+        query = self._search_query(
+            sql, start_time, end_time, query_size, verbosity, validate=validate
+        )
+        content, headers = self._request_body(
+            self._dumps(query), {**self.headers, "Accept": "text/event-stream"}
+        )
+        async with self._client.stream(
+            "POST",
+            f"{self.openobserve_url.replace('/[STREAM]', '')}/_search_stream",
+            content=content,
+            headers=headers,
+            timeout=timeout,
+        ) as res:
+            if res.status_code != httpx.codes.OK:
+                await res.aread()
+                raise Exception(
+                    f"Openobserve search_stream returned {res.status_code}. "
+                    f"Text: {res.text}"
+                )
+            block: List[str] = []
+            async for line in res.aiter_lines():
+                if line:
+                    block.append(line)
+                    continue
+                parsed = self._sse_event(block)
+                block = []
+                if parsed is None:
+                    continue
+                item = self._search_stream_event(
+                    *parsed, verbosity, timestamp_conversion_auto, timestamp_columns
+                )
+                if item is None:
+                    return
+                yield item
+
+    async def search_partitioned(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int],
+        end_time: Union[datetime, int],
+        partitions: int = 4,
+        concurrency: int = 4,
+        query_size: int = 1000,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+    ) -> List[Dict]:
+        """Search a long interval as concurrent searches of sub-intervals
+
+        Sub-intervals are searched and merged like
+        OpenObserve.search_partitioned(), at most concurrency at a time.
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          partitions: number of sub-intervals
+          concurrency: maximum number of requests in flight
+          query_size: maximum number of results returned
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout of each request
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+
+        Returns:
+          merged hits
+        """
+        # pylint: disable=import-outside-toplevel
+        from python_openobserve.aggregate import PartialAggregate, is_aggregate
+
+        expression = parse_sql(sql)
+        if is_aggregate(expression):
+            return (
+                await self._search_partitioned_aggregate(
+                    PartialAggregate(expression),
+                    self._time_partitions(start_time, end_time, partitions),
+                    concurrency=concurrency,
+                    page_size=query_size,
+                    verbosity=verbosity,
+                    timeout=timeout,
+                    timestamp_conversion_auto=timestamp_conversion_auto,
+                    timestamp_columns=timestamp_columns,
+                )
+            )[:query_size]
+        sql, intervals, merge = self._partitioned_plan(
+            expression,
+            sql,
+            start_time,
+            end_time,
+            partitions=partitions,
+            query_size=query_size,
+            verbosity=verbosity,
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def search(interval: Tuple[int, int]) -> List[Dict]:
+            # sub-intervals are not cached, neighbouring ones would share keys
+            query = self._search_query(
+                sql, *interval, merge["offset"] + merge["count"], verbosity
+            )
+            async with semaphore:
+                response_json = await self._post_search(
+                    query, timeout, "search_partitioned", cache=False
+                )
+            return self._search_hits(
+                response_json,
+                verbosity,
+                timestamp_conversion_auto,
+                timestamp_columns,
+            )
+
+        results = await asyncio.gather(*[search(x) for x in intervals])
+        return list(self._partitioned_merge(results, **merge))
+
+    async def _search_partitioned_aggregate(
+        self,
+        aggregate: PartialAggregate,
+        intervals: List[Tuple[int, int]],
+        *,
+        concurrency: int,
+        page_size: int,
+        **kwargs: Any,
+    ) -> List[Dict]:
+        """Run partial aggregate query on each sub-interval and combine results"""
+        self._debug(
+            f"search_partitioned: {intervals} partial sql: {aggregate.sql}",
+            kwargs["verbosity"],
+            1,
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def search(interval: Tuple[int, int]) -> List[Dict]:
+            query = self._search_query(
+                aggregate.sql, *interval, page_size, kwargs["verbosity"]
+            )
+            async with semaphore:
+                return [
+                    hit
+                    async for hit in self._search_pages(
+                        query,
+                        kwargs["timeout"],
+                        kwargs["verbosity"],
+                        kwargs["timestamp_conversion_auto"],
+                        kwargs["timestamp_columns"],
+                        cache=False,
+                    )
+                ]
+
+        return aggregate.merge(await asyncio.gather(*[search(x) for x in intervals]))
+
+    async def _execute_api_request(
+        self,
+        endpoint: str,
+        *,
+        verbosity: int = 0,
+        method: str = "GET",
+        params: Union[dict, None] = None,
+        json_data: Union[dict, None] = None,
+    ) -> List[Dict]:
+        """Execute API request with proper error handling and debugging"""
+        url = self._object_url(endpoint)
+        self._debug(url, verbosity)
+
+        if method == "GET":
+            res = await self._client.get(
+                url,
+                headers=self.headers,
+                params=params,
+                timeout=self.timeout,
+            )
+        elif method == "POST":
+            res = await self._client.post(
+                url,
+                headers=self.headers,
+                json=json_data,
+                timeout=self.timeout,
+            )
+        elif method == "PUT":
+            res = await self._client.put(
+                url,
+                headers=self.headers,
+                json=json_data,
+                timeout=self.timeout,
+            )
+        else:
+            raise ValueError(f"Unsupported method: {method}")
+
+        return self._handle_response(res, f"{method}_{endpoint.split('/')[0]}")
+
+    async def search2df(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int] = 0,
+        end_time: Union[datetime, int] = 0,
+        query_size: int = 1000,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
+    ) -> pandas.DataFrame:
+        """
+        OpenObserve search function with pandas dataframe output
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          query_size: maximum number of results returned (default: 1000)
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
+        """
+        res_json_hits = await self.search(
+            sql,
+            start_time=start_time,
+            end_time=end_time,
+            query_size=query_size,
+            verbosity=verbosity,
+            timeout=timeout,
+            timestamp_conversion_auto=timestamp_conversion_auto,
+            validate=validate,
+        )
+        return self._hits2df(res_json_hits, timestamp_columns)
+
+    async def search2df_polars(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int] = 0,
+        end_time: Union[datetime, int] = 0,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
+    ) -> polars.DataFrame:
+        """
+        OpenObserve search function with polars dataframe output
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
+        """
+        res_json_hits = await self.search(
+            sql,
+            start_time=start_time,
+            end_time=end_time,
+            verbosity=verbosity,
+            timeout=timeout,
+            timestamp_conversion_auto=timestamp_conversion_auto,
+            validate=validate,
+        )
+        return self._hits2df_polars(res_json_hits, timestamp_columns)
+
+    async def list_objects(self, object_type: str, verbosity: int = 0) -> List[Dict]:
+        """List available objects for given type"""
+        return await self._execute_api_request(object_type, verbosity=verbosity)
+
+    async def list_objects2df(
+        self, object_type: str, verbosity: int = 0
+    ) -> pandas.DataFrame:
+        """
+        List available objects for given type
+        Output: Dataframe
+        """
+        res_json = await self.list_objects(object_type=object_type, verbosity=verbosity)
+        return self._objects2df(object_type, res_json)
+
+    async def config_export(
+        self,
+        file_path: str,
+        verbosity: int = 0,
+        *,
+        outformat: str = "json",
+        split: bool = False,
+        flat: bool = False,
+        strip: bool = False,
+    ):
+        """Export OpenObserve configuration aka all object types to json/csv/xlsx
+
+        Args:
+          file_path: target file path or prefix
+          verbosity: how verbose to run from 0/less to 5/more
+          outformat: json, csv, or xlsx
+          split: separate list of objects json in one file per object
+          flat: put all files in a flat directory or tree hierarchy
+          strip: remove variables data like stats or updated_at fields
+        """
+        if outformat not in ("csv", "xlsx") and split is True and flat is True:
+            raise NotImplementedError(
+                "config_export of split json files in a flat directory"
+            )
+
+        # Collect all configuration data
+        data = {
+            name: (api_path, await self.list_objects(api_path, verbosity=verbosity))
+            for name, api_path in export_mapping.items()
+        }
+        self._config_export_write(
+            data,
+            file_path,
+            verbosity,
+            outformat=outformat,
+            split=split,
+            strip=strip,
+        )
+
+    async def create_object(
+        self, object_type: str, object_json: dict, verbosity: int = 0
+    ):
+        """Create object
+
+        Args:
+          object_type: what kind of openobserve object to export
+          object_json: json source object to create
+          verbosity: how verbose to run from 0/less to 5/more
+        """
+        url = self._object_url(object_type, folder_id=object_json.get("folder_id"))
+        self._debug(f"Create object {object_type} url: {url}", verbosity, level=1)
+        self._debug(f"Create object json input: {object_json}", verbosity, level=2)
+
+        res = await self._client.post(
+            url,
+            json=object_json,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self._debug(f"Return {res.status_code}. Text: {res.text}", verbosity, level=1)
+        self._handle_response(res, f"create_object_{object_type}")
+
+        self._debug("Create object completed", verbosity)
+        return True
+
+    async def update_object(
+        self, object_type: str, object_json: dict, verbosity: int = 0
+    ):
+        """Update object
+
+        Args:
+          object_type: what kind of openobserve object to export
+          object_json: json source object to create
+          verbosity: how verbose to run from 0/less to 5/more
+        """
+        key_id = id_mapping.get(object_type, "id")
+        url = self._object_url(
+            object_type, object_json[key_id], object_json.get("folder_id")
+        )
+        self._debug(f"Update object {object_type} url: {url}", verbosity, level=1)
+        self._debug(f"Update object json input: {object_json}", verbosity, level=2)
+
+        res = await self._client.put(
+            url,
+            json=object_json,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self._debug(f"Return {res.status_code}. Text: {res.text}", verbosity, level=3)
+        self._handle_response(res, f"update_object_{object_type}")
+
+        self._debug("Update object completed", verbosity)
+        return True
+
+    async def create_update_object_by_name(
+        self,
+        object_type: str,
+        object_json: dict,
+        verbosity: int = 0,
+        overwrite: bool = False,
+    ):
+        """Create/Update object by name
+        It will first list all objects of given type and erase all those matching exact name.
+
+        Args:
+          object_type: what kind of openobserve object
+          object_json: json source object to create/update
+          verbosity: how verbose to run from 0/less to 5/more
+          overwrite: overwrite an existing object - known upstream bug
+        """
+        key = key_mapping.get(object_type, "list")
+        key_id = id_mapping.get(object_type, "id")
+        key_name = name_mapping.get(object_type, "name")
+        object_name = object_json[key_name]
+        count_update = 0
+        current = await self.list_objects(object_type, verbosity)
+        self._debug(f"Create/Update by name objects list: {current}", verbosity, 4)
+        for obj in current[key]:  # type: ignore[call-overload]
+            if key_name in obj and object_name.strip() == obj[key_name].strip():
+                if overwrite:
+                    object_json[key_id] = obj[key_id]
+                    self._debug(
+                        f"Create/Update by name matching object: {obj}", verbosity, 3
+                    )
+                    await self.update_object(object_type, object_json, verbosity)
+                    count_update += 1
+                    break
+
+                self._debug("  .. matching object but overwrite is false", verbosity, 1)
+                return False
+        self._debug(
+            f"Create/update by name updated {count_update} object(s).", verbosity, 1
+        )
+        if count_update == 0:
+            await self.create_object(object_type, object_json, verbosity)
+            self._debug("Create/update by name created 1 object(s).", verbosity, 1)
+        return True
+
+    async def delete_object(self, object_type: str, object_id: str, verbosity: int = 0):
+        """Delete object
+
+        Args:
+          object_type: what kind of openobserve object to export
+          object_id: object id (sometimes name) to delete
+          verbosity: how verbose to run from 0/less to 5/more
+        """
+        url = self._object_url(object_type, object_id)
+        self._debug(f"Delete object {object_type} url: {url}", verbosity, level=1)
+
+        res = await self._client.delete(
+            url,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self._debug(f"Return {res.status_code}. Text: {res.text}", verbosity, level=3)
+        self._handle_response(res, f"delete_object_{object_type}")
+
+        self._debug("Delete object completed", verbosity)
+        return True
+
+    async def delete_object_by_name(
+        self, object_type: str, object_name: str, verbosity: int = 0
+    ):
+        """Delete object by name
+        It will first list all objects of given type and erase all those matching exact name.
+
+        Args:
+          object_type: what kind of openobserve object to export
+          object_name: object name to delete
+          verbosity: how verbose to run from 0/less to 5/more
+        """
+        key = key_mapping.get(object_type, "list")
+        key_id = id_mapping.get(object_type, "id")
+        key_name = name_mapping.get(object_type, "name")
+        count_delete = 0
+        current = await self.list_objects(object_type, verbosity)
+        self._debug(f"Delete by name objects list: {current}", verbosity, 3)
+        for obj in current[key]:  # type: ignore[call-overload]
+            if "name" in obj and object_name == obj[key_name]:
+                self._debug(f"Delete by name matching object: {obj}", verbosity)
+                await self.delete_object(object_type, obj[key_id], verbosity)
+                count_delete += 1
+        self._debug(f"Delete by name deleted {count_delete} object(s).", verbosity, 1)
+        return True
+
+    async def import_objects_split(
+        self,
+        object_type: str,
+        json_data: dict,
+        file_path: str,
+        *,
+        overwrite: bool = False,
+        verbosity: int = 0,
+        force: bool = False,
+    ) -> bool:
+        """
+        Import OpenObserve configuration from split json files
+
+        Args:
+          object_type: what kind of openobserve object to import
+          json_data: source json (this one or file_path, leave other empty string)
+          file_path: source file path or prefix (json_data or this one)
+          overwrite: overwrite an existing object - known upstream bug
+          verbosity: how verbose to run from 0/less to 5/more
+          force: skip controls like ksuid
+        """
+        import_json = self._load_import_object(
+            object_type, json_data, file_path, verbosity=verbosity, force=force
+        )
+        if import_json is None:
+            return False
+        try:
+            res = await self.create_object(
+                object_type, import_json, verbosity=verbosity
+            )
+            self._debug(f"Create returns {res}.", verbosity, level=0)
+
+            if res:
+                return res
+
+            if overwrite:
+                self._debug(
+                    "Overwrite enabled. Updating object",
+                    verbosity,
+                    level=0,
+                )
+                res = await self.update_object(
+                    object_type, import_json, verbosity=verbosity
+                )
+                self._debug(f"Update returns {res}.", verbosity, level=0)
+                return res
+
+        except Exception as exc:
+            raise Exception(f"Exception: {exc}") from exc
+        return False
+
+    async def import_objects(
+        self,
+        object_type: str,
+        file_path: str,
+        *,
+        overwrite: bool = False,
+        verbosity: int = 0,
+        split: bool = False,
+    ) -> bool:
+        """Import objects from json file
+        Note: API does not import list of objects, need to do one by one.
+
+        Args:
+          object_type: what kind of openobserve object to import
+          file_path: source file path or prefix (json_data or this one)
+          overwrite: overwrite an existing object - known upstream bug
+          verbosity: how verbose to run from 0/less to 5/more
+          split: separate list of objects json in one file per object
+        """
+        if split is True:
+            for file in self._import_split_files(file_path, verbosity):
+                await self.import_objects_split(
+                    object_type,
+                    {},
+                    file,
+                    overwrite=overwrite,
+                    verbosity=verbosity,
+                )
+            return True
+
+        json_list, id_key = self._load_import_list(object_type, file_path, verbosity)
+
+        # Process each object
+        for json_object in json_list:
+            object_id = json_object.get(id_key, "unknown")
+            self._debug(f"Try to create {object_type} {object_id}...", verbosity)
+            self._debug(json_object, verbosity, level=2)
+
+            try:
+                res = await self.create_object(
+                    object_type, json_object, verbosity=verbosity
+                )
+                self._debug(f"Create returns {res}.", verbosity)
+                return res
+            except Exception:
+                if overwrite and "name" in json_object:
+                    print(f"Overwrite enabled. Updating object {json_object['name']}")
+                    res = await self.update_object(
+                        object_type, json_object, verbosity=verbosity
+                    )
+                    self._debug(f"Update returns {res}.", verbosity)
+        return True
+
+    async def config_import(
+        self,
+        object_type: str,
+        file_path: str,
+        *,
+        overwrite: bool = False,
+        verbosity: int = 0,
+        split: bool = False,
+    ):
+        """Import OpenObserve configuration from json files
+
+        Args:
+          object_type: what kind of openobserve object to import
+          file_path: source file path or prefix (json_data or this one)
+          overwrite: overwrite an existing object - known upstream bug
+          verbosity: how verbose to run from 0/less to 5/more
+          split: separate list of objects json in one file per object
+        """
+        for item, item_path, item_split in self._config_import_plan(
+            object_type, file_path, split
+        ):
+            await self.import_objects(
+                item,
+                item_path,
+                overwrite=overwrite,
+                verbosity=verbosity,
+                split=item_split,
+            )
@@ -0,0 +1,269 @@
+"""
+OpenObserve background bulk indexer module
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+# pylint: disable=too-many-arguments,too-many-instance-attributes,broad-exception-raised,broad-exception-caught,protected-access
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Any, Callable
+
+from python_openobserve.openobserve import (
+    BULK_CHUNK_BYTES,
+    BULK_CHUNK_SIZE,
+    OpenObserve,
+)
+
+# queue full policies of BulkIndexer.add()
+overflow_policies = ("block", "drop_oldest", "raise", "spool")
+
+# worker wake up item, sent by flush()
+_WAKEUP = None
+# worker stop item, sent by close()
+_STOP = object()
+# worker flush interval reached without item
+_TIMEOUT = object()
+
+
+class BulkIndexer:
+    """
+    Background bulk indexer
+
+    add() queues documents and returns right away. A worker thread batches them
+    per stream and sends each batch with one request when it reaches chunk_size
+    documents, chunk_bytes serialized bytes or flush_interval seconds.
+    """
+
+    def __init__(
+        self,
+        client: OpenObserve,
+        *,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        chunk_bytes: int = BULK_CHUNK_BYTES,
+        flush_interval: float = 1.0,
+        queue_size: int = 10000,
+        overflow: str = "block",
+        on_error: Optional[Callable[[str, List[bytes], Exception], Any]] = None,
+        replay_interval: float = 30.0,
+        verbosity: int = 0,
+    ) -> None:
+        """Class __init__
+
+        Args:
+          client: OpenObserve instance used to send batches
+          chunk_size: maximum number of documents per request,
+                      replaced by client adaptive batch size if configured
+          chunk_bytes: maximum serialized size of request body
+          flush_interval: maximum seconds a document waits before being sent
+          queue_size: maximum number of documents waiting for the worker
+          overflow: when queue is full, block, drop_oldest document, raise queue.Full,
+                    or spool document to client spool
+          on_error: called with stream, serialized documents and exception of failed batches
+          replay_interval: seconds between replays of client spool
+          verbosity: how verbose to run from 0/less to 5/more
+        """
+        if overflow not in overflow_policies:
+            raise ValueError(
+                f"Invalid overflow policy {overflow}, expecting one of {overflow_policies}"
+            )
+        if overflow == "spool" and client.spool is None:
+            raise ValueError("Overflow policy spool requires a client with a spool")
+        self.client = client
+        self.chunk_size = chunk_size
+        self.chunk_bytes = chunk_bytes
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.on_error = on_error
+        self.replay_interval = replay_interval
+        self.verbosity = verbosity
+        self.stats = {
+            "successful": 0,
+            "failed": 0,
+            "dropped": 0,
+            "spooled": 0,
+            "errors": 0,
+        }
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._flush_now = threading.Event()
+        self._closed = False
+        # per stream serialized documents and their total size
+        self._buffers: Dict[str, List[bytes]] = {}
+        self._sizes: Dict[str, int] = {}
+        self._thread = threading.Thread(
+            target=self._run, name="openobserve-bulk-indexer", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> BulkIndexer:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def add(self, stream: str, document: dict) -> None:
+        """Queue a document for given stream
+
+        Args:
+          stream: target stream
+          document: document to index
+        """
+        if self._closed:
+            raise Exception("BulkIndexer is closed")
+        self._put((stream, document))
+
+    def flush(self) -> None:
+        """Send all queued and buffered documents and wait for completion"""
+        if self._closed:
+            # close() already sent everything and stopped the worker
+            return
+        self._queue.put(_WAKEUP)
+        self._queue.join()
+
+    def close(self) -> None:
+        """Flush remaining documents and stop worker thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _put(self, item: Any) -> None:
+        """Put item in queue applying overflow policy"""
+        if self.overflow == "block":
+            self._queue.put(item)
+        elif self.overflow == "raise":
+            self._queue.put_nowait(item)
+        elif self.overflow == "spool":
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                stream, document = item
+                self.client.spool.append(  # type: ignore[union-attr]
+                    stream,
+                    self.client._json_array([self.client._encode_document(document)]),
+                )
+                with self._lock:
+                    self.stats["spooled"] += 1
+        else:
+            while True:
+                try:
+                    self._queue.put_nowait(item)
+                    return
+                except queue.Full:
+                    try:
+                        dropped = self._queue.get_nowait()
+                    except queue.Empty:
+                        continue
+                    self._queue.task_done()
+                    if dropped is _WAKEUP:
+                        # keep flush() request, worker flushes once queue is drained
+                        self._flush_now.set()
+                    else:
+                        with self._lock:
+                            self.stats["dropped"] += 1
+
+    def _run(self) -> None:
+        """Worker loop: batch queued documents and send them"""
+        deadline = time.monotonic() + self.flush_interval
+        replay_deadline = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = _TIMEOUT
+
+            if item is _STOP:
+                self._send_all()
+                self._queue.task_done()
+                return
+            if item is not _WAKEUP and item is not _TIMEOUT:
+                self._buffer(*item)
+
+            if (
+                item is _WAKEUP
+                or (self._flush_now.is_set() and self._queue.empty())
+                or time.monotonic() >= deadline
+            ):
+                self._flush_now.clear()
+                self._send_all()
+                deadline = time.monotonic() + self.flush_interval
+            if self.client.spool is not None and time.monotonic() >= replay_deadline:
+                self._replay()
+                replay_deadline = time.monotonic() + self.replay_interval
+            if item is _WAKEUP:
+                self._queue.task_done()
+
+    def _buffer(self, stream: str, document: dict) -> None:
+        """Serialize document into stream buffer, sending buffer when full"""
+        try:
+            encoded = self.client._encode_document(document)
+        except Exception as exc:
+            self.client._debug(
+                f"BulkIndexer can't serialize document {document}: {exc}",
+                self.verbosity,
+                0,
+            )
+            self.stats["errors"] += 1
+            self._queue.task_done()
+            return
+        buffer = self._buffers.setdefault(stream, [])
+        if buffer and self._sizes[stream] + len(encoded) + 1 > self.chunk_bytes:
+            self._send(stream)
+            buffer = self._buffers.setdefault(stream, [])
+        buffer.append(encoded)
+        self._sizes[stream] = self._sizes.get(stream, 2) + len(encoded) + 1
+        if (
+            len(buffer) >= self.client._chunk_size(stream, self.chunk_size)
+            or self._sizes[stream] >= self.chunk_bytes
+        ):
+            self._send(stream)
+
+    def _replay(self) -> None:
+        """Replay client spool if it has pending batches"""
+        try:
+            if self.client.spool.pending():  # type: ignore[union-attr]
+                self.client.replay_spool(self.verbosity)
+        except Exception as exc:
+            self.client._debug(
+                f"BulkIndexer spool replay failed: {exc}", self.verbosity, 1
+            )
+
+    def _send_all(self) -> None:
+        """Send buffers of all streams"""
+        for stream in list(self._buffers):
+            self._send(stream)
+
+    def _send(self, stream: str) -> None:
+        """Send buffer of given stream with one request"""
+        documents = self._buffers.pop(stream, [])
+        self._sizes.pop(stream, None)
+        if not documents:
+            return
+        try:
+            response_json = self.client._post_bulk(stream, documents, "bulk_indexer")
+            self.client._sum_status(response_json, self.stats)
+        except Exception as exc:
+            self.stats["errors"] += 1
+            self.stats["failed"] += len(documents)
+            self.client._debug(
+                f"BulkIndexer {stream} batch of {len(documents)} failed: {exc}",
+                self.verbosity,
+                0,
+            )
+            if self.on_error is not None:
+                try:
+                    self.on_error(stream, documents, exc)
+                except Exception as exc2:
+                    self.client._debug(
+                        f"BulkIndexer on_error failed: {exc2}", self.verbosity, 0
+                    )
+        finally:
+            for _ in documents:
+                self._queue.task_done()
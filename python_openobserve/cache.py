@@ -0,0 +1,126 @@
+"""
+OpenObserve search result cache module
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from python_openobserve.sql import normalize_sql
+
+
+class SearchCache:
+    """
+    LRU search response cache bounded by total size and entry age
+
+    Responses are cached by client url, normalized sql, time range aligned on
+    bucket seconds, offset and size. Queries whose time range only differs
+    by jitter within a bucket (like datetime.now()) share the response of
+    the first one, which may be up to bucket seconds older.
+    Least recently used responses are evicted beyond max_bytes, and responses
+    older than ttl seconds are not served.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 300.0,
+        bucket: float = 60.0,
+    ) -> None:
+        """Class __init__
+
+        Args:
+          max_bytes: maximum total size of cached responses
+          ttl: seconds a response is served from cache
+          bucket: seconds search start and end times are aligned on
+        """
+        if max_bytes < 1 or ttl <= 0 or bucket <= 0:
+            raise ValueError("Expecting max_bytes >= 1, ttl > 0 and bucket > 0")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.bucket = int(bucket * 1000000)
+        self.size = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+        # key -> (expiry, response bytes), least recently used first
+        self._entries: OrderedDict[Tuple[Any, ...], Tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(
+        self, url: str, query: dict, *, normalize: bool = True
+    ) -> Optional[Tuple[Any, ...]]:
+        """Return cache key of search query, its time range aligned on bucket
+
+        The query itself is left unchanged.
+
+        Args:
+          url: openobserve url of the client, including organisation
+          query: search query body
+          normalize: key on sqlglot normalized sql rather than sql as is
+
+        Returns:
+          cache key, or None if the time range is shorter than a bucket and
+          the query can't be cached
+        """
+        body = query["query"]
+        start_time = body["start_time"] - body["start_time"] % self.bucket
+        end_time = body["end_time"] - body["end_time"] % self.bucket
+        if end_time <= start_time:
+            return None
+        return (
+            url,
+            normalize_sql(body["sql"]) if normalize else body["sql"],
+            start_time,
+            end_time,
+            body.get("from", 0),
+            body["size"],
+        )
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[bytes]:
+        """Return cached response of key, None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                self.stats["expired"] += 1
+                entry = None
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def put(self, key: Tuple[Any, ...], content: bytes) -> None:
+        """Cache response of key, evicting least recently used responses"""
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, content)
+            self.size += len(content)
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats["evictions"] += 1
+
+    def _remove(self, key: Tuple[Any, ...]) -> None:
+        """Remove entry of key, lock must be held"""
+        self.size -= len(self._entries.pop(key)[1])
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        """Number and total size of cached responses, and cache counters"""
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.size, **self.stats}
@@ -0,0 +1,118 @@
+"""
+OpenObserve logging handler module
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+# pylint: disable=too-many-arguments,broad-exception-caught,protected-access
+import logging
+from datetime import datetime
+from typing import Optional
+
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.bulk import BulkIndexer
+
+# LogRecord attributes not copied as extra fields
+_RECORD_ATTRIBUTES = set(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+
+class OpenObserveHandler(logging.Handler):
+    """
+    Logging handler sending records to OpenObserve in batches
+
+    emit() only queues the record, a BulkIndexer worker thread sends them.
+    Records are flushed on logging shutdown.
+    """
+
+    def __init__(
+        self,
+        client: OpenObserve,
+        stream: str,
+        *,
+        level: int = logging.NOTSET,
+        chunk_size: int = 1000,
+        flush_interval: float = 1.0,
+        queue_size: int = 10000,
+        overflow: str = "drop_oldest",
+        indexer: Optional[BulkIndexer] = None,
+    ) -> None:
+        """Class __init__
+
+        Args:
+          client: OpenObserve instance used to send records
+          stream: target stream
+          level: handler logging level
+          chunk_size: maximum number of records per request
+          flush_interval: maximum seconds a record waits before being sent
+          queue_size: maximum number of records waiting to be sent
+          overflow: when queue is full, block, drop_oldest record, or raise queue.Full
+          indexer: existing BulkIndexer to use instead of creating one
+        """
+        super().__init__(level)
+        self.stream = stream
+        self._own_indexer = indexer is None
+        self.indexer = indexer or BulkIndexer(
+            client,
+            chunk_size=chunk_size,
+            flush_interval=flush_interval,
+            queue_size=queue_size,
+            overflow=overflow,
+        )
+
+    def record2dict(self, record: logging.LogRecord) -> dict:
+        """Convert log record to flat document with _timestamp in microseconds"""
+        document = {
+            "_timestamp": int(record.created * 1000000),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": self.format(record),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "process": record.process,
+        }
+        if record.exc_info and record.exc_text:
+            document["exception"] = record.exc_text
+        for key, value in record.__dict__.items():
+            if key in _RECORD_ATTRIBUTES or key in document:
+                continue
+            if value is None or isinstance(
+                value, (str, int, float, bool, datetime, dict)
+            ):
+                document[key] = value
+            else:
+                document[key] = repr(value)
+        return document
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue log record"""
+        # ignore records of the worker itself (http client logs)
+        if record.thread == self.indexer._thread.ident:
+            return
+        try:
+            self.indexer.add(self.stream, self.record2dict(record))
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Send queued records and wait for completion"""
+        if not self.indexer._closed:
+            self.indexer.flush()
+
+    def close(self) -> None:
+        """Flush queued records and stop worker if owned"""
+        try:
+            if self._own_indexer:
+                self.indexer.close()
+            else:
+                self.flush()
+        finally:
+            super().close()
@@ -0,0 +1,302 @@
+"""
+OpenObserve Elasticsearch compatible bulk helpers module
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals,broad-exception-caught,protected-access
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from python_openobserve.openobserve import OpenObserve
+
+# bulk operations supported by the _bulk endpoint
+op_types = ("index", "create", "delete")
+# action fields moved from the document to the action line
+_META_FIELDS = ("_index", "_id")
+
+# (action line, source) of one bulk action, source is None for delete
+BulkAction = Tuple[Dict[str, dict], Optional[dict]]
+
+
+class BulkIndexError(Exception):
+    """Raised when documents failed to index, errors holds the failed items"""
+
+    def __init__(self, message: str, errors: List[dict]) -> None:
+        super().__init__(message, errors)
+        self.errors = errors
+
+
+def expand_action(data: dict, index: Optional[str] = None) -> BulkAction:
+    """Split an Elasticsearch style action dict into action line and source
+
+    Args:
+      data: document with optional _op_type, _index, _id and _source fields
+      index: default target stream when data has no _index
+    """
+    data = dict(data)
+    op_type = data.pop("_op_type", "index")
+    if op_type not in op_types:
+        raise ValueError(
+            f"Invalid bulk operation {op_type}, expecting one of {op_types}"
+        )
+    meta = {key: data.pop(key) for key in _META_FIELDS if key in data}
+    meta.setdefault("_index", index)
+    if meta["_index"] is None:
+        raise ValueError("Bulk action has no _index and no default index was given")
+    if op_type == "delete":
+        return {op_type: meta}, None
+    return {op_type: meta}, data.pop("_source", data)
+
+
+def _chunk_actions(
+    client: OpenObserve,
+    actions: Iterable[dict],
+    chunk_size: int,
+    max_chunk_bytes: int,
+    index: Optional[str],
+) -> Iterator[List[Tuple[BulkAction, bytes]]]:
+    """Serialize actions into chunks bounded by count and ndjson bytes
+
+    A single action larger than max_chunk_bytes is sent alone.
+    """
+    chunk: List[Tuple[BulkAction, bytes]] = []
+    size = 0
+    for data in actions:
+        action, source = expand_action(data, index)
+        lines = client._dumps(action) + b"\n"
+        if source is not None:
+            lines += client._encode_document(source) + b"\n"
+        if chunk and (len(chunk) >= chunk_size or size + len(lines) > max_chunk_bytes):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(((action, source), lines))
+        size += len(lines)
+    if chunk:
+        yield chunk
+
+
+def _item_status(item: dict) -> Any:
+    """Http status of a bulk response item"""
+    return next(iter(item.values())).get("status")
+
+
+def _process_bulk_chunk(
+    client: OpenObserve,
+    chunk: List[Tuple[BulkAction, bytes]],
+    raise_on_exception: bool,
+) -> List[Tuple[bool, dict]]:
+    """Send one chunk and return (ok, item) for each of its actions
+
+    Failed items get the source of the document under data.
+    """
+    try:
+        response_json = client.bulk(b"".join(lines for _, lines in chunk))
+        items = response_json.get("items", [])
+    except Exception as exc:
+        if raise_on_exception:
+            raise
+        items = [
+            {
+                op_type: {**meta, "status": "N/A", "error": str(exc), "exception": exc}
+                for op_type, meta in action.items()
+            }
+            for (action, _), _ in chunk
+        ]
+    # actions without item were not processed
+    items = list(items) + [
+        {
+            op_type: {**meta, "status": "N/A", "error": "no item in bulk response"}
+            for op_type, meta in action.items()
+        }
+        for (action, _), _ in chunk[len(items) :]
+    ]
+    results = []
+    for ((_, source), _), item in zip(chunk, items):
+        status = _item_status(item)
+        ok = isinstance(status, int) and 200 <= status < 300
+        if not ok and source is not None:
+            next(iter(item.values()))["data"] = source
+        results.append((ok, item))
+    return results
+
+
+def _process_bulk_chunk_retry(
+    client: OpenObserve,
+    chunk: List[Tuple[BulkAction, bytes]],
+    raise_on_error: bool,
+    raise_on_exception: bool,
+    max_retries: int,
+    initial_backoff: float,
+    max_backoff: float,
+) -> List[Tuple[bool, dict]]:
+    """Send one chunk, retrying actions rejected with 429 with exponential backoff"""
+    results: List[Tuple[bool, dict]] = []
+    for attempt in range(max_retries + 1):
+        if attempt:
+            time.sleep(min(max_backoff, initial_backoff * 2 ** (attempt - 1)))
+        retry = []
+        for entry, (ok, item) in zip(
+            chunk, _process_bulk_chunk(client, chunk, raise_on_exception)
+        ):
+            if not ok and attempt < max_retries and _item_status(item) == 429:
+                retry.append(entry)
+            else:
+                results.append((ok, item))
+        if not retry:
+            break
+        chunk = retry
+    errors = [item for ok, item in results if not ok]
+    if errors and raise_on_error:
+        raise BulkIndexError(f"{len(errors)} document(s) failed to index.", errors)
+    return results
+
+
+def streaming_bulk(
+    client: OpenObserve,
+    actions: Iterable[dict],
+    *,
+    chunk_size: int = 500,
+    max_chunk_bytes: int = 100 * 1024 * 1024,
+    raise_on_error: bool = True,
+    raise_on_exception: bool = True,
+    max_retries: int = 0,
+    initial_backoff: float = 2,
+    max_backoff: float = 600,
+    yield_ok: bool = True,
+    index: Optional[str] = None,
+) -> Iterator[Tuple[bool, dict]]:
+    """Send actions in chunks to the _bulk endpoint, yield per action results
+
+    Args:
+      client: OpenObserve instance used to send requests
+      actions: iterable or generator of action dicts, consumed lazily
+      chunk_size: maximum number of actions per request
+      max_chunk_bytes: maximum serialized size of request body
+      raise_on_error: raise BulkIndexError with failed items at end of a chunk
+      raise_on_exception: raise request errors, else report all chunk actions as failed
+      max_retries: number of retries of actions rejected with 429
+      initial_backoff: seconds before first retry, doubled on each retry
+      max_backoff: maximum seconds between retries
+      yield_ok: also yield successful actions
+      index: default target stream of actions without _index
+
+    Returns:
+      generator of (ok, item) tuples, item being the bulk response entry
+    """
+    for chunk in _chunk_actions(client, actions, chunk_size, max_chunk_bytes, index):
+        results = _process_bulk_chunk_retry(
+            client,
+            chunk,
+            raise_on_error,
+            raise_on_exception,
+            max_retries,
+            initial_backoff,
+            max_backoff,
+        )
+        yield from _filter_ok(results, yield_ok)
+
+
+def bulk(
+    client: OpenObserve,
+    actions: Iterable[dict],
+    *,
+    stats_only: bool = False,
+    **kwargs: Any,
+) -> Tuple[int, Any]:
+    """Send actions to the _bulk endpoint and summarize results
+
+    Takes the same keyword arguments as streaming_bulk().
+
+    Args:
+      client: OpenObserve instance used to send requests
+      actions: iterable or generator of action dicts, consumed lazily
+      stats_only: return failed count instead of failed items
+
+    Returns:
+      number of successful actions and list of failed items, or failed count
+    """
+    success, failed = 0, 0
+    errors = []
+    for ok, item in streaming_bulk(client, actions, **kwargs):
+        if ok:
+            success += 1
+        else:
+            failed += 1
+            if not stats_only:
+                errors.append(item)
+    return success, failed if stats_only else errors
+
+
+def parallel_bulk(
+    client: OpenObserve,
+    actions: Iterable[dict],
+    *,
+    thread_count: int = 4,
+    chunk_size: int = 500,
+    max_chunk_bytes: int = 100 * 1024 * 1024,
+    queue_size: int = 4,
+    raise_on_error: bool = True,
+    raise_on_exception: bool = True,
+    max_retries: int = 0,
+    initial_backoff: float = 2,
+    max_backoff: float = 600,
+    yield_ok: bool = True,
+    index: Optional[str] = None,
+) -> Iterator[Tuple[bool, dict]]:
+    """Send chunks of actions to the _bulk endpoint from a thread pool
+
+    Results are yielded in action order. At most thread_count + queue_size
+    chunks are serialized ahead of the results being consumed.
+
+    Args:
+      client: OpenObserve instance used to send requests, shared by threads
+      actions: iterable or generator of action dicts, consumed lazily
+      thread_count: number of threads sending requests
+      queue_size: number of chunks waiting for a free thread
+      see streaming_bulk() for other arguments
+
+    Returns:
+      generator of (ok, item) tuples, item being the bulk response entry
+    """
+    pending: Deque[Future] = deque()
+    with ThreadPoolExecutor(
+        max_workers=thread_count, thread_name_prefix="openobserve-bulk"
+    ) as executor:
+        try:
+            chunks = _chunk_actions(client, actions, chunk_size, max_chunk_bytes, index)
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(
+                        _process_bulk_chunk_retry,
+                        client,
+                        chunk,
+                        raise_on_error,
+                        raise_on_exception,
+                        max_retries,
+                        initial_backoff,
+                        max_backoff,
+                    )
+                )
+                while len(pending) >= thread_count + queue_size:
+                    yield from _filter_ok(pending.popleft().result(), yield_ok)
+            while pending:
+                yield from _filter_ok(pending.popleft().result(), yield_ok)
+        finally:
+            # stop sending on error or early exit of the consumer
+            for future in pending:
+                future.cancel()
+
+
+def _filter_ok(
+    results: List[Tuple[bool, dict]], yield_ok: bool
+) -> Iterator[Tuple[bool, dict]]:
+    """Yield failed results, and successful ones if yield_ok"""
+    for ok, item in results:
+        if not ok or yield_ok:
+            yield ok, item
@@ -0,0 +1,287 @@
+"""
+OpenObserve json codec module
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+# pylint: disable=no-member
+import codecs
+import json
+import re
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+    Union,
+)
+
+try:
+    import orjson  # type: ignore
+
+    HAVE_MODULE_ORJSON = True
+except ImportError:
+    HAVE_MODULE_ORJSON = False
+
+try:
+    import msgspec  # type: ignore
+
+    HAVE_MODULE_MSGSPEC = True
+except ImportError:
+    HAVE_MODULE_MSGSPEC = False
+
+
+def datetime2int(value: Any) -> int:
+    """Encode datetime to OpenObserve integer microseconds since epoch
+
+    Args:
+      value: datetime to encode, any other type is refused
+    """
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1000000)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JsonCodec:
+    """
+    Standard library json codec
+
+    dumps() returns compact utf-8 bytes and encodes datetimes at any depth to
+    integer microseconds. loads() decodes bytes or str.
+    """
+
+    name = "json"
+    # dumps() encodes datetimes itself, documents need no conversion pass
+    native_datetime = True
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize object to compact utf-8 json"""
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), default=datetime2int
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Deserialize json bytes or str"""
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson codec, also serializing numpy arrays and scalars"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not HAVE_MODULE_ORJSON:
+            raise ValueError("Json codec orjson requires orjson module")
+        # datetimes go through datetime2int instead of rfc 3339 strings
+        self.option = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=datetime2int, option=self.option)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """
+    msgspec codec
+
+    msgspec always encodes datetimes as rfc 3339 strings, so top level datetime
+    fields of documents are converted before encoding.
+    """
+
+    name = "msgspec"
+    native_datetime = False
+
+    def __init__(self) -> None:
+        if not HAVE_MODULE_MSGSPEC:
+            raise ValueError("Json codec msgspec requires msgspec module")
+        self.encoder = msgspec.json.Encoder(enc_hook=datetime2int)
+        self.decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self.decoder.decode(data)
+
+
+# available codecs by name, fastest first
+json_codecs: Dict[str, Type[JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JsonCodec,
+}
+
+
+def get_codec(codec: Optional[Union[str, JsonCodec]] = None) -> JsonCodec:
+    """Return json codec instance
+
+    Args:
+      codec: codec instance, codec name, or None for the fastest available one
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None:
+        if HAVE_MODULE_ORJSON:
+            return OrjsonCodec()
+        if HAVE_MODULE_MSGSPEC:
+            return MsgspecCodec()
+        return JsonCodec()
+    if codec not in json_codecs:
+        raise ValueError(
+            f"Invalid json codec {codec}, expecting one of {tuple(json_codecs)}"
+        )
+    return json_codecs[codec]()
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# yielded by _json_array_items() when its buffer needs the next chunk
+_MORE = object()
+
+
+class _StreamBuffer:
+    """Text buffer of a stream of utf-8 bytes chunks, fed by the caller
+
+    Parsing methods are generators yielding _MORE until enough text was fed.
+    """
+
+    def __init__(self) -> None:
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+
+    def feed(self, chunk: bytes) -> bool:
+        """Append chunk, dropping consumed text, return if text was added"""
+        text = self.decoder.decode(chunk)
+        if not text:
+            return False
+        self.text = self.text[self.pos :] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> Generator[Any, None, str]:
+        """Next non whitespace character"""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            yield _MORE
+
+    def expect(self, char: str) -> Generator[Any, None, None]:
+        """Consume next non whitespace character, which must be char"""
+        if (yield from self.peek()) != char:
+            raise ValueError(
+                f"Expecting {char!r} in json stream, got {self.text[self.pos]!r}"
+            )
+        self.pos += 1
+
+    def value(self, decoder: json.JSONDecoder) -> Generator[Any, None, Any]:
+        """Decode next json value"""
+        yield from self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+                # a value ending the buffer, like a number, may continue in next
+                # chunk, as may a number cut before its fraction or exponent
+                if end < len(self.text) and not (
+                    isinstance(value, (int, float)) and self.text[end] in ".eE+-"
+                ):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                pass
+            yield _MORE
+
+
+def _json_array_items(
+    buffer: _StreamBuffer, key: str, metadata: Optional[Dict[str, Any]]
+) -> Iterator[Any]:
+    """Yield items of array key of the json object fed to buffer, or _MORE"""
+    decoder = json.JSONDecoder()
+    yield from buffer.expect("{")
+    if (yield from buffer.peek()) == "}":
+        return
+    while True:
+        name = yield from buffer.value(decoder)
+        yield from buffer.expect(":")
+        if name == key:
+            yield from buffer.expect("[")
+            if (yield from buffer.peek()) == "]":
+                buffer.pos += 1
+            else:
+                while True:
+                    yield (yield from buffer.value(decoder))
+                    if (yield from buffer.peek()) == "]":
+                        buffer.pos += 1
+                        break
+                    yield from buffer.expect(",")
+        else:
+            value = yield from buffer.value(decoder)
+            if metadata is not None:
+                metadata[name] = value
+        if (yield from buffer.peek()) == "}":
+            return
+        yield from buffer.expect(",")
+
+
+def iter_json_array(
+    chunks: Iterable[bytes], key: str, metadata: Optional[Dict[str, Any]] = None
+) -> Iterator[Any]:
+    """Incrementally decode items of an array in a streamed json object
+
+    Items are yielded one at a time while chunks are read, so memory is
+    bounded by one item and one chunk instead of the whole document.
+
+    Args:
+      chunks: utf-8 bytes of a json object, as received
+      key: top level key of the array
+      metadata: dict receiving the other top level keys and values
+    """
+    chunks = iter(chunks)
+    buffer = _StreamBuffer()
+    for item in _json_array_items(buffer, key, metadata):
+        if item is not _MORE:
+            yield item
+            continue
+        if not any(buffer.feed(chunk) for chunk in chunks):
+            raise ValueError("Truncated json stream")
+
+
+async def aiter_json_array(
+    chunks: AsyncIterable[bytes], key: str, metadata: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[Any]:
+    """Asynchronous version of iter_json_array(), reading an async iterable
+
+    Args:
+      chunks: utf-8 bytes of a json object, as received
+      key: top level key of the array
+      metadata: dict receiving the other top level keys and values
+    """
+    stream = aiter(chunks)
+    buffer = _StreamBuffer()
+    for item in _json_array_items(buffer, key, metadata):
+        if item is not _MORE:
+            yield item
+            continue
+        while True:
+            try:
+                chunk = await anext(stream)
+            except StopAsyncIteration:
+                raise ValueError("Truncated json stream") from None
+            if buffer.feed(chunk):
+                break
@@ -7,20 +7,49 @@ SPDX-License-Identifier: GPL-3.0-or-later
 
 from __future__ import annotations
 
-# pylint: disable=too-many-arguments,bare-except,broad-exception-raised,broad-exception-caught,too-many-public-methods,too-many-lines
+# pylint: disable=too-many-arguments,bare-except,broad-exception-raised,broad-exception-caught,too-many-public-methods,too-many-lines,too-many-instance-attributes,too-many-locals
 import base64
+import gzip
+import heapq
+import itertools
 import json
+import mmap
+import zlib
 
 # import glob
 import os
 import sys
 import re
-from datetime import datetime
-from typing import List, Dict, Union, Optional, Any, cast
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import (
+    List,
+    Dict,
+    Deque,
+    Tuple,
+    Union,
+    Optional,
+    Any,
+    Iterable,
+    Iterator,
+    cast,
+    TYPE_CHECKING,
+)
 from pathlib import Path
 
 import httpx  # type: ignore
-import sqlglot  # type: ignore
+
+from python_openobserve.adaptive import AdaptiveBatchSize
+from python_openobserve.cache import SearchCache
+from python_openobserve.json_codec import JsonCodec, get_codec, iter_json_array
+from python_openobserve.spool import Spool
+from python_openobserve.sql import clause_int, normalize_sql, parse_sql
+
+if TYPE_CHECKING:
+    from python_openobserve.aggregate import PartialAggregate
 
 try:
     import pandas
@@ -40,6 +69,50 @@ except ImportError:
     print("Can't import polars. some functions may be unavailable.")
     HAVE_MODULE_POLARS = False
 
+try:
+    import pyarrow  # type: ignore
+    import pyarrow.ipc  # type: ignore
+    import pyarrow.parquet  # type: ignore
+
+    HAVE_MODULE_PYARROW = True
+except ImportError:
+    HAVE_MODULE_PYARROW = False
+
+try:
+    import zstandard  # type: ignore
+
+    HAVE_MODULE_ZSTANDARD = True
+except ImportError:
+    HAVE_MODULE_ZSTANDARD = False
+
+# index_many() default chunk bounds: documents per request and request body bytes
+BULK_CHUNK_SIZE = 1000
+BULK_CHUNK_BYTES = 10 * 1024 * 1024
+# http status of ingestion requests worth sending again later
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# request body compression encodings and default minimum body size to compress
+compression_methods = ("gzip", "zstd")
+COMPRESSION_THRESHOLD = 1024
+# ingest_file() formats by file suffix
+file_formats = {
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+# search_stream() event names by server-sent event name
+sse_events = {
+    "search_response_hits": "hits",
+    "search_response_metadata": "metadata",
+}
+# lines of index_raw() and ndjson files
+RAW_LINE = re.compile(rb"[^\r\n]+")
+# flatten() key cache: (parent key, separator, keys) -> flattened keys
+FLATTEN_CACHE_SIZE = 4096
+_flatten_cache: Dict[Tuple[str, str, Tuple[Any, ...]], Tuple[Any, ...]] = {}
+
 key_mapping = {
     "dashboards": "dashboards",
     "users": "data",
@@ -57,6 +130,19 @@ id_mapping = {
     "streams": "stream_name",
     "users": "email_id",
 }
+# object types served by the v2 api
+api_v2_mapping = ("alerts", "folders", "folders/alerts", "folders/dashboards")
+# object types exported by config_export(): output name -> api path
+export_mapping = {
+    "functions": "functions",
+    "pipelines": "pipelines",
+    "alerts": "alerts",
+    "alerts-destinations": "alerts/destinations",
+    "alerts-templates": "alerts/templates",
+    "dashboards": "dashboards",
+    "streams": "streams",
+    "users": "users",
+}
 name_mapping = {
     "alerts": "name",
     "alerts/destinations": "name",
@@ -71,16 +157,57 @@ name_mapping = {
 
 
 def flatten(dictionary: dict, parent_key="", separator="."):
-    """Flatten dictionary
+    """Flatten dictionary recursively, nested keys joined with separator
+
+    Flattened keys are cached per parent key and key set, so documents of an
+    already seen shape are flattened without building key strings again.
 
     Args:
       dictionary: input dictionary to flatten
+      parent_key: prefix of flattened keys
+      separator: separator between nested keys
+    """
+    items: dict = {}
+    _flatten_into(items, dictionary, parent_key, separator)
+    return items
+
+
+def _flatten_into(items: dict, dictionary: dict, parent_key: str, separator: str):
+    """Add flattened items of dictionary to items"""
+    if not parent_key:
+        # top level keys are kept as is, nothing to build
+        for key, value in dictionary.items():
+            if isinstance(value, dict) and value:
+                _flatten_into(items, value, key, separator)
+            else:
+                items[key] = value
+        return
+    cache_key = (parent_key, separator, tuple(dictionary))
+    new_keys = _flatten_cache.get(cache_key)
+    if new_keys is None:
+        new_keys = tuple(f"{parent_key}{separator}{key}" for key in cache_key[2])
+        if len(_flatten_cache) >= FLATTEN_CACHE_SIZE:
+            _flatten_cache.clear()
+        _flatten_cache[cache_key] = new_keys
+    for new_key, value in zip(new_keys, dictionary.values()):
+        if isinstance(value, dict) and value:
+            _flatten_into(items, value, new_key, separator)
+        else:
+            items[new_key] = value
+
+
+def local_time_offsets(hours: Iterable[int]) -> Dict[int, int]:
+    """Microseconds to add to epoch of naive datetimes read as UTC, to read
+    them as local time like datetime.timestamp(), per hour since epoch
+
+    Args:
+      hours: hours since epoch of naive datetimes read as UTC
     """
-    items = []
-    for key, value in dictionary.items():
-        new_key = parent_key + separator + key if parent_key else key
-        items.append((new_key, value))
-    return dict(items)
+    epoch = datetime(1970, 1, 1)
+    return {
+        hour: int((epoch + timedelta(hours=hour)).timestamp() - hour * 3600) * 1000000
+        for hour in hours
+    }
 
 
 def is_ksuid(input_string: str) -> bool:
@@ -105,11 +232,15 @@ def is_name(input_string: str) -> bool:
     return False
 
 
-class OpenObserve:
+class OpenObserveBase(ABC):  # pylint: disable=too-few-public-methods
     """
-    OpenObserve class based on OpenObserve REST API
+    OpenObserve shared configuration, request building and conversion helpers
+
+    Base of OpenObserve and AsyncOpenObserve, without network calls.
     """
 
+    _client: Any
+
     def __init__(
         self,
         user: str,
@@ -119,17 +250,27 @@ class OpenObserve:
         host: str = "http://localhost:5080",
         verify: bool = True,
         timeout: int = 10,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        spool: Optional[Spool] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = COMPRESSION_THRESHOLD,
+        compression_level: Optional[int] = None,
+        json_codec: Optional[Union[str, JsonCodec]] = None,
+        adaptive_batch_size: Optional[AdaptiveBatchSize] = None,
+        search_cache: Optional[SearchCache] = None,
     ) -> None:
-        """Class __init__
+        """Store configuration shared by both clients
 
-        Args:
-          user: openobserve instance username
-          password: openobserve instance matching password
-          organisation: openobserve instance organisation (default, _meta...)
-          host: url of openobserve instance
-          verify: validate certificate
-          timeout: default http timeout
+        See OpenObserve.__init__() for arguments.
         """
+        if compression is not None and compression not in compression_methods:
+            raise ValueError(
+                f"Invalid compression {compression}, expecting one of {compression_methods}"
+            )
+        if compression == "zstd" and not HAVE_MODULE_ZSTANDARD:
+            raise ValueError("Compression zstd requires zstandard module")
         bas64encoded_creds = base64.b64encode(
             f"{user}:{password}".encode("utf-8")
         ).decode("utf-8")
@@ -141,6 +282,24 @@ class OpenObserve:
         }
         self.verify = verify
         self.timeout = timeout
+        self.spool = spool
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+        self.json_codec = get_codec(json_codec)
+        self.adaptive_batch_size = adaptive_batch_size
+        self.search_cache = search_cache
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # one pooled client per instance so connections and TLS sessions are reused
+        self._client = self._create_client()
+
+    @abstractmethod
+    def _create_client(self) -> Any:
+        """Create the pooled http client used by all requests"""
 
     def _debug(self, msg: Any, verbosity: int, level: int = 1) -> None:
         """Print debug messages if verbosity level is sufficient"""
@@ -150,6 +309,41 @@ class OpenObserve:
 
             pprint(msg)
 
+    def _compress(self, body: bytes) -> bytes:
+        """Encode body with configured compression"""
+        if self.compression == "gzip":
+            return gzip.compress(
+                body, compresslevel=self.compression_level or 6, mtime=0
+            )
+        # compressor instances are not thread safe, create one per body
+        return zstandard.ZstdCompressor(level=self.compression_level or 3).compress(
+            body
+        )
+
+    def _request_body(
+        self, body: bytes, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """Compress request body if enabled and large enough, return body and headers"""
+        headers = headers or self.headers
+        if self.compression is None or len(body) < self.compression_threshold:
+            return body, headers
+        return self._compress(body), {**headers, "Content-Encoding": self.compression}
+
+    def _compress_stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Incrementally encode a streamed body with configured compression"""
+        encoder: Any
+        if self.compression == "gzip":
+            encoder = zlib.compressobj(self.compression_level or 6, zlib.DEFLATED, 31)
+        else:
+            encoder = zstandard.ZstdCompressor(
+                level=self.compression_level or 3
+            ).compressobj()
+        for chunk in chunks:
+            data = encoder.compress(chunk)
+            if data:
+                yield data
+        yield encoder.flush()
+
     def _handle_response(
         self, res: httpx.Response, action: str = "request"
     ) -> List[Dict]:
@@ -158,7 +352,8 @@ class OpenObserve:
             raise Exception(
                 f"Openobserve {action} returned {res.status_code}. Text: {res.text}"
             )
-        return res.json()
+        # decode straight from the response bytes
+        return self.json_codec.loads(res.content)
 
     # pylint: disable=invalid-name
     def __timestampConvert(self, timestamp: datetime, verbosity: int = 0) -> int:
@@ -201,56 +396,502 @@ class OpenObserve:
                 flatdict[key] = self.__timestampConvert(val)
         return flatdict
 
-    def index(self, index: str, document: dict) -> List[dict]:
-        """Index a document in OpenObserve"""
-        assert isinstance(document, dict), "document must be a dict"
-        document = self.__datetime2Str(flatten(document))
+    def _object_url(
+        self,
+        object_type: str,
+        object_id: Optional[str] = None,
+        folder_id: Optional[str] = None,
+    ) -> str:
+        """Build api url for given object type, optional object id and alert folder"""
+        if object_id is None:
+            url = self.openobserve_url.replace("[STREAM]", object_type)
+        else:
+            url = self.openobserve_url.replace("[STREAM]", f"{object_type}/{object_id}")
+        if object_type in api_v2_mapping:
+            url = url.replace("/api", "/api/v2")
+        if object_type == "alerts" and folder_id is not None:
+            url = f"{url}?folder={folder_id}"
+        return url
 
-        res = httpx.post(
-            f"{self.openobserve_url.replace('[STREAM]', index)}/_json",
-            headers=self.headers,
-            json=[document],
-            verify=self.verify,
-            timeout=self.timeout,
-        )
-        response_json = self._handle_response(res, "index")
+    def _prepare_document(self, document: dict) -> dict:
+        """Flatten document and convert its datetime fields before ingestion
 
-        if response_json["status"][0]["failed"] > 0:  # type: ignore[call-overload]
+        Datetime conversion is left to the json codec when it supports it.
+        """
+        assert isinstance(document, dict), "document must be a dict"
+        document = flatten(document)
+        if self.json_codec.native_datetime:
+            return document
+        return self.__datetime2Str(document)
+
+    def _check_index_response(self, response_json: Any, document: dict) -> None:
+        """Raise if ingestion response reports failed documents"""
+        if response_json["status"][0]["failed"] > 0:
             raise Exception(
                 "Openobserve index failed. "
-                f"{response_json['status'][0]['error']}"  # type: ignore[call-overload]
+                f"{response_json['status'][0]['error']}"
                 f". document: {document}"
             )
-        return response_json
 
-    def search(
+    def _stream_url(self, stream: str, endpoint: str = "_json") -> str:
+        """Build ingestion url for given stream and endpoint"""
+        return f"{self.openobserve_url.replace('[STREAM]', stream)}/{endpoint}"
+
+    def _dumps(self, obj: Any) -> bytes:
+        """Serialize object to compact utf-8 json with the json codec"""
+        return self.json_codec.dumps(obj)
+
+    def _encode_document(self, document: dict) -> bytes:
+        """Prepare and serialize one document for a json array request body"""
+        return self._dumps(self._prepare_document(document))
+
+    def _chunk_size(self, stream: str, chunk_size: int) -> int:
+        """Batch size of stream, from adaptive batch size if configured"""
+        if self.adaptive_batch_size is None:
+            return chunk_size
+        return self.adaptive_batch_size.size(stream)
+
+    def _bulk_chunks(
         self,
-        sql: str,
-        *,
-        start_time: Union[datetime, int] = 0,
-        end_time: Union[datetime, int] = 0,
-        query_size: int = 1000,
-        verbosity: int = 0,
-        timeout: int = 300,
-        timestamp_conversion_auto: bool = False,
-        timestamp_columns: Union[List[str], None] = None,
-    ) -> List[Dict]:
+        documents: Iterable[dict],
+        chunk_size: int,
+        chunk_bytes: int,
+        stream: Optional[str] = None,
+    ) -> Iterator[List[bytes]]:
+        """Serialize documents into chunks bounded by count and json array bytes
+
+        A single document larger than chunk_bytes is sent alone. If stream is
+        given, adaptive batch size of stream replaces chunk_size when configured.
         """
-        OpenObserve search function
-        https://openobserve.ai/docs/api/search/search/
-        https://github.com/openobserve/openobserve/commit/3ccf0be93391885136377b41a4cc2a36d80f904a
+        return self._raw_chunks(
+            (self._encode_document(document) for document in documents),
+            chunk_size,
+            chunk_bytes,
+            stream,
+        )
+
+    def _sum_status(self, response_json: Any, counts: Dict[str, int]) -> None:
+        """Add successful/failed/spooled counts of ingestion response to counts"""
+        for status in response_json["status"]:
+            counts["successful"] += status.get("successful", 0)
+            counts["failed"] += status.get("failed", 0)
+            if "spooled" in status:
+                counts["spooled"] = counts.get("spooled", 0) + status["spooled"]
+
+    def _ndjson_body(
+        self, documents: Iterable[dict], buffer_bytes: int
+    ) -> Iterator[bytes]:
+        """Lazily serialize documents to newline delimited json
+
+        Lines are grouped up to buffer_bytes to limit socket writes.
+        """
+        buffer: List[bytes] = []
+        size = 0
+        for document in documents:
+            line = self._encode_document(document) + b"\n"
+            buffer.append(line)
+            size += len(line)
+            if size >= buffer_bytes:
+                yield b"".join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield b"".join(buffer)
+
+    def _dataframe_bodies(
+        self, df: Any, chunk_size: int, chunk_bytes: int
+    ) -> Iterator[Tuple[bytes, int]]:
+        """Serialize pandas or polars dataframe to json array bodies of rows
+
+        Datetime columns are converted to epoch microseconds by the dataframe
+        library, naive ones as local time. Rows are serialized chunk by chunk
+        from the columnar data. Chunks larger than chunk_bytes are split in
+        halves. pandas dataframes go through polars when available, with
+        pyarrow unless all columns are numpy numbers, booleans or naive
+        datetimes. Otherwise pandas json output is used, or the json codec
+        for dataframes with float columns as pandas json output is limited to
+        15 significant digits.
+
+        Returns:
+          generator of (body, row count)
+        """
+        if (
+            HAVE_MODULE_POLARS
+            and HAVE_MODULE_PANDAS
+            and isinstance(df, pandas.DataFrame)
+            and (
+                HAVE_MODULE_PYARROW
+                # polars.from_pandas needs pyarrow for non numpy columns
+                or all(
+                    not pandas.api.types.is_extension_array_dtype(dtype)
+                    and dtype.kind in "biufM"
+                    for dtype in df.dtypes
+                )
+            )
+        ):
+            df = polars.from_pandas(df)
+        if HAVE_MODULE_POLARS and isinstance(df, polars.DataFrame):
+            naive = [
+                name
+                for name, dtype in df.schema.items()
+                if isinstance(dtype, polars.Datetime) and dtype.time_zone is None
+            ]
+            df = df.with_columns(polars.col(polars.Datetime).dt.epoch("us"))
+            for name in naive:
+                hours = df[name] // 3600000000
+                offsets = local_time_offsets(hours.drop_nulls().unique().to_list())
+                df = df.with_columns(
+                    df[name] + hours.replace_strict(offsets, return_dtype=polars.Int64)
+                )
+
+            def serialize(chunk: Any) -> bytes:
+                return chunk.write_json().encode("utf-8")
+
+        elif HAVE_MODULE_PANDAS and isinstance(df, pandas.DataFrame):
+            converted = {}
+            for name, column in df.items():
+                if pandas.api.types.is_datetime64_any_dtype(column):
+                    aware = column.dt.tz is not None
+                    utc = column.dt.tz_convert(None) if aware else column
+                    epoch = pandas.Series(
+                        utc.dt.as_unit("us").to_numpy().view("int64"),
+                        index=column.index,
+                    )
+                    if not aware:
+                        hours = epoch // 3600000000
+                        offsets = local_time_offsets(
+                            hours[column.notna()].unique().tolist()
+                        )
+                        epoch += hours.map(offsets).fillna(0).astype("int64")
+                    converted[name] = epoch.astype("Int64").mask(column.isna())
+            df = df.assign(**converted)
+
+            if any(pandas.api.types.is_float_dtype(dtype) for dtype in df.dtypes):
+
+                def serialize(chunk: Any) -> bytes:
+                    return self._dumps(
+                        chunk.astype(object)
+                        .where(chunk.notna(), None)
+                        .to_dict(orient="records")
+                    )
+
+            else:
+
+                def serialize(chunk: Any) -> bytes:
+                    return chunk.to_json(orient="records", force_ascii=False).encode(
+                        "utf-8"
+                    )
+
+        else:
+            raise Exception(
+                "index_dataframe expects a pandas or polars DataFrame, "
+                f"got {type(df).__name__}"
+            )
+
+        def split(start: int, length: int) -> Iterator[Tuple[bytes, int]]:
+            body = serialize(df[start : start + length])
+            if len(body) > chunk_bytes and length > 1:
+                yield from split(start, length // 2)
+                yield from split(start + length // 2, length - length // 2)
+            else:
+                yield body, length
+
+        for start in range(0, len(df), chunk_size):
+            yield from split(start, min(chunk_size, len(df) - start))
+
+    def _raw_lines(
+        self,
+        data: Union[str, bytes, bytearray, memoryview, mmap.mmap, Iterable[Any]],
+    ) -> Iterator[bytes]:
+        """Split serialized json lines without parsing them, skipping blank lines
 
         Args:
-          sql: input sql query
-          start_time: start of search interval, either datetime, either int/epoch
-          end_time: end of search interval, either datetime, either int/epoch
-          query_size: maximum number of results returned (default: 1000)
-                      See also ZO_QUERY_DEFAULT_LIMIT
-          verbosity: how verbose to run from 0/less to 5/more
-          timeout: http timeout
-          timestamp_conversion_auto: try to convert automatically column containing time as name
-          timestamp_columns: convert given columns to timestamp
+          data: newline delimited json as str or a bytes-like object, or
+                iterable of one json document per bytes, bytes-like or str item
+        """
+        if isinstance(data, str):
+            # a str is one ndjson payload, not an iterable of documents
+            data = data.encode("utf-8")
+        if isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)):
+            # regex runs on the buffer, only each line is copied
+            for match in RAW_LINE.finditer(data):
+                line = match.group().strip()
+                if line:
+                    yield line
+            return
+        for item in data:
+            line = item.encode("utf-8") if isinstance(item, str) else bytes(item)
+            line = line.strip()
+            if line:
+                yield line
+
+    def _raw_chunks(
+        self,
+        lines: Iterable[bytes],
+        chunk_size: int,
+        chunk_bytes: int,
+        stream: Optional[str] = None,
+    ) -> Iterator[List[bytes]]:
+        """Group serialized documents into chunks bounded by count and json array bytes
+
+        If stream is given, adaptive batch size of stream replaces chunk_size
+        when configured.
+        """
+        if stream is not None:
+            chunk_size = self._chunk_size(stream, chunk_size)
+        chunk: List[bytes] = []
+        size = 2
+        for line in lines:
+            if chunk and (
+                len(chunk) >= chunk_size or size + len(line) + 1 > chunk_bytes
+            ):
+                yield chunk
+                chunk, size = [], 2
+                if stream is not None:
+                    chunk_size = self._chunk_size(stream, chunk_size)
+            chunk.append(line)
+            size += len(line) + 1
+        if chunk:
+            yield chunk
+
+    def _ndjson_file_bodies(
+        self, path: Path, chunk_size: int, chunk_bytes: int
+    ) -> Iterator[Tuple[bytes, int]]:
+        """Group lines of a memory mapped ndjson file into json array bodies
+
+        Lines are sent as is, without being parsed.
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for chunk in self._raw_chunks(
+                    self._raw_lines(mm), chunk_size, chunk_bytes
+                ):
+                    yield self._json_array(chunk), len(chunk)
+
+    def _arrow_file_batches(
+        self, path: Path, file_format: str, chunk_size: int
+    ) -> Iterator[Any]:
+        """Read record batches of a parquet or arrow ipc file, memory mapped"""
+        if not HAVE_MODULE_PYARROW:
+            raise Exception(f"ingest_file {file_format} requires pyarrow module")
+        if file_format == "parquet":
+            yield from pyarrow.parquet.ParquetFile(path, memory_map=True).iter_batches(
+                batch_size=chunk_size
+            )
+            return
+        with pyarrow.memory_map(str(path)) as source:
+            try:
+                reader = pyarrow.ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    yield reader.get_batch(i)
+            except pyarrow.ArrowInvalid:
+                # not a random access file, try stream format
+                source.seek(0)
+                yield from pyarrow.ipc.open_stream(source)
+
+    def _file_bodies(
+        self, path: Path, file_format: str, chunk_size: int, chunk_bytes: int
+    ) -> Iterator[Tuple[bytes, int]]:
+        """Serialize file content to json array bodies of rows"""
+        if file_format == "ndjson":
+            yield from self._ndjson_file_bodies(path, chunk_size, chunk_bytes)
+            return
+        for batch in self._arrow_file_batches(path, file_format, chunk_size):
+            df = polars.from_arrow(batch) if HAVE_MODULE_POLARS else batch.to_pandas()
+            yield from self._dataframe_bodies(df, chunk_size, chunk_bytes)
+
+    def _ingest_result(self) -> Dict[str, Any]:
+        """Initial ingest() result"""
+        result: Dict[str, Any] = {"successful": 0, "failed": 0, "retried": 0}
+        if self.spool is not None:
+            result["spooled"] = 0
+        result["errors"] = []
+        return result
+
+    def _ingest_chunks(
+        self,
+        index: str,
+        documents: Iterable[dict],
+        chunk_size: int,
+        chunk_bytes: int,
+    ) -> Iterator[List[Tuple[dict, bytes]]]:
+        """Serialize documents of ingest() into chunks of (document, json)
+
+        Chunks are bounded by count and _bulk request body bytes.
+        """
+        # bytes of action line and newlines sent with each document
+        overhead = len(self._dumps({"index": {"_index": index}})) + 2
+        chunk: List[Tuple[dict, bytes]] = []
+        size = 0
+        for document in documents:
+            encoded = self._encode_document(document)
+            if chunk and (
+                len(chunk) >= chunk_size or size + len(encoded) + overhead > chunk_bytes
+            ):
+                yield chunk
+                chunk, size = [], 0
+            chunk.append((document, encoded))
+            size += len(encoded) + overhead
+        if chunk:
+            yield chunk
+
+    def _ingest_body(
+        self, index: str, chunk: List[Tuple[dict, bytes]]
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """Build _bulk request body and headers of an ingest() chunk"""
+        action = self._dumps({"index": {"_index": index}}) + b"\n"
+        return self._request_body(
+            b"".join(action + encoded + b"\n" for _, encoded in chunk),
+            {**self.headers, "Content-Type": "application/x-ndjson"},
+        )
+
+    def _ingest_statuses(
+        self, res: httpx.Response, count: int
+    ) -> List[Tuple[Optional[int], Any]]:
+        """Return (status, error) of each of count documents of a _bulk response"""
+        if res.status_code != httpx.codes.OK:
+            return [(res.status_code, res.text)] * count
+        results: List[Tuple[Optional[int], Any]] = []
+        for item in self.json_codec.loads(res.content).get("items", []):
+            info = next(iter(item.values()))
+            results.append((info.get("status"), info.get("error")))
+        # documents without item were not processed
+        results += [(None, "no item in bulk response")] * (count - len(results))
+        return results
+
+    def _ingest_sort(
+        self,
+        chunk: List[Tuple[dict, bytes]],
+        statuses: List[Tuple[Optional[int], Any]],
+        result: Dict[str, Any],
+    ) -> List[Tuple[Tuple[dict, bytes], Optional[int], Any]]:
+        """Count successful and failed documents of chunk in ingest() result
+
+        Returns:
+          retryable documents with their status and error
+        """
+        retry = []
+        for entry, (status, error) in zip(chunk, statuses):
+            if isinstance(status, int) and 200 <= status < 300:
+                result["successful"] += 1
+            elif status is None or status in RETRY_STATUS_CODES:
+                retry.append((entry, status, error))
+            else:
+                result["failed"] += 1
+                result["errors"].append(
+                    {"document": entry[0], "status": status, "error": error}
+                )
+        return retry
+
+    def _ingest_give_up(
+        self,
+        index: str,
+        retry: List[Tuple[Tuple[dict, bytes], Optional[int], Any]],
+        result: Dict[str, Any],
+    ) -> None:
+        """Spool documents still failing after the last retry, or report them"""
+        if self.spool is not None:
+            self.spool.append(index, self._json_array([x for (_, x), _, _ in retry]))
+            result["spooled"] += len(retry)
+            return
+        for entry, status, error in retry:
+            result["failed"] += 1
+            result["errors"].append(
+                {"document": entry[0], "status": status, "error": error}
+            )
+
+    def _json_array(self, documents: List[bytes]) -> bytes:
+        """Join serialized documents into a json array body"""
+        return b"[" + b",".join(documents) + b"]"
+
+    def _post_json_error(self, index: str, exc: httpx.TransportError) -> None:
+        """Handle transport error of an ingestion request
+
+        Timeouts shrink the adaptive batch size of the stream, and the error is
+        raised again unless a spool is configured.
+        """
+        if self.adaptive_batch_size is not None and isinstance(
+            exc, httpx.TimeoutException
+        ):
+            self.adaptive_batch_size.shrink(index, "timeouts")
+        if self.spool is None:
+            raise exc
+
+    def _post_json_result(
+        self,
+        index: str,
+        body: bytes,
+        count: int,
+        res: Optional[httpx.Response],
+        *,
+        started: float,
+        action: str,
+        split: bool,
+    ) -> Any:
+        """Handle response of an ingestion request sent at monotonic time started
+
+        res is None after a transport error, when a spool is configured.
+        Adjusts the adaptive batch size and spools the body on retryable
+        failure if configured, see _post_json().
+        """
+        if res is not None and self.adaptive_batch_size is not None:
+            if res.status_code == httpx.codes.REQUEST_ENTITY_TOO_LARGE:
+                self.adaptive_batch_size.shrink(index, "too_large")
+                if split:
+                    return None
+            elif res.status_code == httpx.codes.OK:
+                self.adaptive_batch_size.record(
+                    index, count, time.monotonic() - started
+                )
+        if self.spool is not None and (
+            res is None or res.status_code in RETRY_STATUS_CODES
+        ):
+            self.spool.append(index, body)
+            return {
+                "status": [
+                    {
+                        "name": index,
+                        "successful": 0,
+                        "failed": 0,
+                        "spooled": count,
+                    }
+                ]
+            }
+        return self._handle_response(cast(httpx.Response, res), action)
+
+    def _replay_response(
+        self, stream: str, res: httpx.Response, verbosity: int
+    ) -> None:
+        """Check response of a replayed spool batch
+
+        Raises on retryable status, keeping the batch spooled, and drops the
+        batch on other failures.
         """
+        if res.status_code in RETRY_STATUS_CODES:
+            raise Exception(
+                f"Openobserve replay_spool returned {res.status_code}. Text: {res.text}"
+            )
+        if res.status_code != httpx.codes.OK:
+            self._debug(
+                f"replay_spool dropped batch for {stream}, "
+                f"returned {res.status_code}. Text: {res.text}",
+                verbosity,
+                0,
+            )
+
+    def _search_query(
+        self,
+        sql: str,
+        start_time: Union[datetime, int],
+        end_time: Union[datetime, int],
+        query_size: int,
+        verbosity: int,
+        *,
+        query_from: int = 0,
+        validate: bool = True,
+    ) -> dict:
+        """Validate search input and build search query body"""
         if isinstance(start_time, datetime):
             start_time = self.__timestampConvert(start_time, verbosity)
         elif not isinstance(start_time, int):
@@ -264,38 +905,1481 @@ class OpenObserve:
 
         self._debug(f"Query Time start {start_time} end {end_time}", verbosity, 1)
 
-        # Verify SQL syntax
-        try:
-            sqlglot.transpile(sql)
-        except sqlglot.errors.ParseError as e:
-            raise e
+        if validate:
+            # Verify SQL syntax, raising sqlglot ParseError
+            normalize_sql(sql)
 
         query = {
             "query": {
                 "sql": sql,
                 "start_time": start_time,
                 "end_time": end_time,
+                "from": query_from,
                 "size": query_size,
             }
         }
         self._debug(query, verbosity)
+        return query
+
+    def _search_hits(
+        self,
+        response_json: Any,
+        verbosity: int,
+        timestamp_conversion_auto: bool,
+        timestamp_columns: Union[List[str], None],
+    ) -> List[Dict]:
+        """Extract hits from search response with optional timestamp conversion"""
+        res_hits = response_json["hits"]
+        self._debug(res_hits, verbosity, 3)
+
+        if timestamp_conversion_auto or timestamp_columns is not None:
+            # timestamp back convert
+            res_hits = [self.__intts2datetime(x, timestamp_columns) for x in res_hits]
+        return res_hits
+
+    def _convert_hit(
+        self,
+        hit: Dict,
+        timestamp_conversion_auto: bool,
+        timestamp_columns: Union[List[str], None],
+    ) -> Dict:
+        """Convert timestamp columns of one hit if requested"""
+        if timestamp_conversion_auto or timestamp_columns is not None:
+            return self.__intts2datetime(hit, timestamp_columns)
+        return hit
+
+    def _cached_search(
+        self, query: dict, *, validate: bool = True
+    ) -> Tuple[Optional[Tuple], Any]:
+        """Return search cache key of query and cached response if any
+
+        Key is None when search cache is not configured or query can't be
+        cached. sql is normalized for the key only if it was validated.
+        """
+        if self.search_cache is None:
+            return None, None
+        key = self.search_cache.key(self.openobserve_url, query, normalize=validate)
+        if key is None:
+            return None, None
+        cached = self.search_cache.get(key)
+        return key, None if cached is None else self.json_codec.loads(cached)
+
+    def _sse_event(self, lines: List[str]) -> Optional[Tuple[str, Any]]:
+        """Parse lines of one server-sent event
+
+        Returns:
+          (event, data) with json data decoded, None if there is no data
+        """
+        event, data = "message", []
+        for line in lines:
+            field, _, value = line.partition(":")
+            if field == "event":
+                event = value.strip()
+            elif field == "data":
+                data.append(value[1:] if value.startswith(" ") else value)
+        if not data:
+            return None
+        text = "\n".join(data)
+        try:
+            return event, self.json_codec.loads(text)
+        except ValueError:
+            return event, text
+
+    def _sse_events(self, lines: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+        """Parse server-sent events, return (event, data) with json data decoded"""
+        block: List[str] = []
+        for line in lines:
+            if line:
+                block.append(line)
+                continue
+            parsed = self._sse_event(block)
+            if parsed is not None:
+                yield parsed
+            block = []
+
+    def _search_stream_event(
+        self,
+        event: str,
+        data: Any,
+        verbosity: int,
+        timestamp_conversion_auto: bool,
+        timestamp_columns: Union[List[str], None],
+    ) -> Optional[Tuple[str, Any]]:
+        """Map a search_stream() server-sent event to (event, data)
+
+        Returns None on end event and raises on error event.
+        """
+        self._debug(f"search_stream event: {event}", verbosity, 2)
+        event = sse_events.get(event, event)
+        if event == "end":
+            return None
+        if event == "error":
+            raise Exception(f"Openobserve search_stream returned error. Text: {data}")
+        if event == "hits":
+            data = self._search_hits(
+                data, verbosity, timestamp_conversion_auto, timestamp_columns
+            )
+        return event, data
+
+    def _time_partitions(
+        self,
+        start_time: Union[datetime, int],
+        end_time: Union[datetime, int],
+        partitions: int,
+    ) -> List[Tuple[int, int]]:
+        """Split search interval into contiguous sub-intervals of equal length"""
+        if isinstance(start_time, datetime):
+            start_time = self.__timestampConvert(start_time)
+        if isinstance(end_time, datetime):
+            end_time = self.__timestampConvert(end_time)
+        if partitions < 1:
+            raise ValueError("Expecting partitions >= 1")
+        if end_time <= start_time:
+            raise ValueError("Partitioned search requires end_time > start_time")
+        partitions = min(partitions, end_time - start_time)
+        bounds = [
+            start_time + (end_time - start_time) * n // partitions
+            for n in range(partitions + 1)
+        ]
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def _merge_order(self, expression: Any) -> Tuple[str, bool]:
+        """Return result column and direction hits of parsed sql are sorted by
+
+        Search results are sorted by _timestamp descending unless sql orders
+        them by a column.
+        """
+        # pylint: disable=import-outside-toplevel
+        from sqlglot import exp  # type: ignore
+
+        order = expression.args.get("order")
+        if order is not None and order.expressions:
+            ordered = order.expressions[0]
+            if isinstance(ordered.this, exp.Column):
+                return ordered.this.name, bool(ordered.args.get("desc"))
+        return "_timestamp", True
+
+    def _hidden_order(self, expression: Any) -> Optional[Tuple[Any, bool]]:
+        """Return ORDER BY expression and direction of parsed sql if hits don't
+        include its value, None otherwise
+        """
+        # pylint: disable=import-outside-toplevel
+        from sqlglot import exp  # type: ignore
+
+        order = expression.args.get("order")
+        if order is None or not order.expressions:
+            return None
+        ordered = order.expressions[0]
+        if isinstance(ordered.this, exp.Column) and (
+            expression.is_star or ordered.this.name in expression.named_selects
+        ):
+            return None
+        return ordered.this, bool(ordered.args.get("desc"))
+
+    def _partitioned_plan(
+        self,
+        expression: Any,
+        sql: str,
+        start_time: Union[datetime, int],
+        end_time: Union[datetime, int],
+        *,
+        partitions: int,
+        query_size: int,
+        verbosity: int,
+    ) -> Tuple[str, List[Tuple[int, int]], Dict[str, Any]]:
+        """Plan a partitioned search of non aggregate sql and its parsed expression
+
+        An ORDER BY value which is not selected is added to the sub-interval
+        sql as hidden column _o1, merged on then removed.
+
+        Returns:
+          sql of sub-interval searches, sub-intervals in merge order, and
+          keyword arguments of _partitioned_merge()
+        """
+        # pylint: disable=import-outside-toplevel
+        from sqlglot import exp  # type: ignore
+
+        column, descending = self._merge_order(expression)
+        hidden = self._hidden_order(expression)
+        # LIMIT and OFFSET apply to merged hits, each sub-interval returns
+        # enough hits to fill them
+        limit = clause_int(expression, "limit")
+        offset = clause_int(expression, "offset") or 0
+        count = query_size if limit is None else min(limit, query_size)
+        if limit is not None or offset or hidden is not None:
+            partition = expression.copy()
+            partition.set("limit", None)
+            partition.set("offset", None)
+            if hidden is not None:
+                column, descending = "_o1", hidden[1]
+                partition.select(
+                    exp.alias_(hidden[0].copy(), column, quoted=True), copy=False
+                )
+            sql = partition.sql()
+        intervals = self._time_partitions(start_time, end_time, partitions)
+        if descending:
+            # most recent sub-interval first, so ties keep result order
+            intervals.reverse()
+        self._debug(f"search_partitioned: {intervals} sql: {sql}", verbosity, 1)
+        return (
+            sql,
+            intervals,
+            {
+                "column": column,
+                "descending": descending,
+                "hidden": hidden is not None,
+                "offset": offset,
+                "count": count,
+            },
+        )
+
+    def _partitioned_merge(
+        self,
+        results: List[List[Dict]],
+        *,
+        column: str,
+        descending: bool,
+        hidden: bool,
+        offset: int,
+        count: int,
+    ) -> Iterator[Dict]:
+        """Merge sorted hits of sub-interval searches, see _partitioned_plan()"""
+        merged: Iterator[Dict]
+        if column != "_timestamp" or all(column in hits[0] for hits in results if hits):
+            # NULL sorts after any value, as in the server: last ascending,
+            # first descending
+            merged = heapq.merge(
+                *results,
+                key=lambda hit: (hit.get(column) is None, hit.get(column)),
+                reverse=descending,
+            )
+        else:
+            # default _timestamp order not returned, sub-intervals are
+            # already in order
+            merged = itertools.chain.from_iterable(results)
+        merged = itertools.islice(merged, offset, offset + count)
+        if not hidden:
+            return merged
+        return ({k: v for k, v in hit.items() if k != column} for hit in merged)
+
+    def _hits2df(
+        self, res_json_hits: List[Dict], timestamp_columns: Union[List[str], None]
+    ) -> pandas.DataFrame:
+        """Normalize search hits to pandas dataframe with timestamp columns"""
+        return self._df_timestamps(
+            pandas.json_normalize(res_json_hits), timestamp_columns
+        )
+
+    def _df_timestamps(
+        self, df_res: pandas.DataFrame, timestamp_columns: Union[List[str], None]
+    ) -> pandas.DataFrame:
+        """Convert _timestamp and given columns of dataframe to timestamps"""
+        if timestamp_columns is not None:
+            for col in list(
+                set(df_res.columns) & set(["_timestamp"] + timestamp_columns)
+            ):
+                try:
+                    # ensure timestamp format
+                    if col in ["_timestamp"] + timestamp_columns:
+                        df_res[col] = pandas.to_datetime(df_res[col])
+                except Exception as err:
+                    raise Exception(
+                        err,
+                        "query",
+                        f"query column type conversion: {col} -> {df_res[col]}",
+                    ) from err
+        return df_res
+
+    def _hits2df_polars(
+        self, res_json_hits: List[Dict], timestamp_columns: Union[List[str], None]
+    ) -> polars.DataFrame:
+        """Normalize search hits to polars dataframe with timestamp columns"""
+        df_res = polars.json_normalize(res_json_hits)
+
+        if timestamp_columns is not None:
+            for col in list(
+                set(df_res.columns) & set(["_timestamp"] + timestamp_columns)
+            ):
+                try:
+                    # ensure timestamp format
+                    if col in ["_timestamp"] + timestamp_columns:
+                        df_res = df_res.with_columns(polars.col(col).str.to_datetime())
+                except Exception as err:
+                    raise Exception(
+                        err,
+                        "query",
+                        f"query column type conversion: {col} -> {df_res[col]}",
+                    ) from err
+        return df_res
+
+    # pylint: disable=too-many-branches,too-many-locals
+    def export_objects_split(
+        self,
+        object_type: str,
+        json_data: list[dict],
+        file_path: str,
+        *,
+        verbosity: int = 0,
+        flat: bool = False,
+        strip: bool = False,
+    ):
+        """
+        Export OpenObserve json configuration to split json files
+
+        Args:
+          object_type: what kind of openobserve object to export
+          json_data: object data to be exported
+          file_path: target file path or prefix
+          verbosity: how verbose to run from 0/less to 5/more
+          flat: put all files in a flat directory or tree hierarchy
+          strip: remove variables data like stats or updated_at fields
+        """
+        key = "list"
+        key2 = "name"
+        if object_type == "dashboards":
+            key = "dashboards"
+            key2 = "dashboard_id"
+        if object_type == "users":
+            key = "data"
+            key2 = "email"
+        self._debug(json_data, verbosity, 3)
+        if flat is True:
+            dst_path = f"{file_path}{object_type}-"
+        else:
+            dst_path = f"{file_path}{object_type}/"
+            Path(dst_path).mkdir(parents=True, exist_ok=True)
+        if object_type in ("alerts/destinations", "alerts/templates"):
+            self._debug("json_list set to alerts type", verbosity, 2)
+            json_list = cast(List[Dict], json_data)
+        else:
+            try:
+                json_list = cast(List[Dict], json_data[key])  # type: ignore[call-overload]
+                self._debug(f"json_list set to key {key}: {json_list}", verbosity, 2)
+            except:
+                json_list = cast(List[Dict], [json_data])
+                self._debug(f"json_list set to array: {json_list}", verbosity, 2)
+        for json_object in json_list:
+            self._debug(
+                f"Export json {object_type} {json_object[key2]}...", verbosity, 0
+            )
+            if strip:
+                keys_to_remove = [
+                    # alerts
+                    "last_triggered_at",
+                    "last_satisfied_at",
+                    "updated_at",
+                    "last_edited_by",
+                    # streams
+                    "stats",
+                ]
+                # data = json.loads(json_object)
+                data2 = {
+                    k: v for k, v in json_object.items() if k not in keys_to_remove
+                }
+                # json_object = json.dumps(data2)
+                json_object = data2
+            self._debug(f"json {json_object}", verbosity, 2)
+            try:
+                with open(
+                    f"{dst_path}{json_object[key2]}.json",
+                    "w",
+                    encoding="utf-8",
+                ) as f:
+                    json.dump(json_object, f, ensure_ascii=False, indent=4)
+            except Exception as err:
+                self._debug(
+                    f"Exception on json {object_type} {json_object[key2]}: {err}.",
+                    verbosity,
+                    0,
+                )
+        return True
+
+    def _objects2df(self, object_type: str, res_json: Any) -> pandas.DataFrame:
+        """Normalize list of objects to pandas dataframe"""
+        key = key_mapping.get(object_type, "list")
+
+        if object_type in ["alerts/destinations", "alerts/templates"]:
+            return pandas.json_normalize(res_json)
+        if key in res_json:
+            return pandas.json_normalize(res_json[key])
+
+        raise Exception(
+            (
+                f"list_objects2df: can't normalize data {res_json} "
+                f"for object type {object_type} and key {key}"
+            )
+        )
+
+    def _config_export_write(
+        self,
+        data: Dict[str, Any],
+        file_path: str,
+        verbosity: int = 0,
+        *,
+        outformat: str = "json",
+        split: bool = False,
+        strip: bool = False,
+    ):
+        """Write collected configuration data to json/csv/xlsx
+
+        Args:
+          data: output name -> (api path, list_objects() output)
+          file_path: target file path or prefix
+          verbosity: how verbose to run from 0/less to 5/more
+          outformat: json, csv, or xlsx
+          split: separate list of objects json in one file per object
+          strip: remove variables data like stats or updated_at fields
+        """
+        if outformat in ("csv", "xlsx"):
+            dfs = {
+                name: self._objects2df(api_path, object_data)
+                for name, (api_path, object_data) in data.items()
+            }
+
+            # Export based on format
+            if outformat == "csv":
+                for name, df in dfs.items():
+                    df.to_csv(f"{file_path}{name}.csv")
+            elif outformat == "xlsx":
+                for name, df in dfs.items():
+                    df.to_excel(f"{file_path}{name}.xlsx")
+        elif split is True:
+            # split json
+            for api_path, object_data in data.values():
+                self.export_objects_split(
+                    api_path,
+                    object_data,
+                    file_path,
+                    verbosity=verbosity,
+                    strip=strip,
+                )
+        else:  # default json
+            for name, (_, object_data) in data.items():
+                with open(f"{file_path}{name}.json", "w", encoding="utf-8") as f:
+                    json.dump(object_data, f, ensure_ascii=False, indent=4)
+
+    def _load_import_object(
+        self,
+        object_type: str,
+        json_data: dict,
+        file_path: str,
+        *,
+        verbosity: int = 0,
+        force: bool = False,
+    ) -> Optional[dict]:
+        """
+        Load and validate one object to import, either given or from json file
+
+        Args:
+          object_type: what kind of openobserve object to import
+          json_data: source json (this one or file_path, leave other empty string)
+          file_path: source file path or prefix (json_data or this one)
+          verbosity: how verbose to run from 0/less to 5/more
+          force: skip controls like ksuid
+        """
+        key2 = name_mapping.get(object_type, "name")
+        file = Path(file_path)
+        if (json_data is None or not json_data) and file.exists():
+            with open(file_path, "r", encoding="utf-8") as json_file:
+                self._debug(
+                    f"Load json data to import from file {file_path}",
+                    verbosity,
+                    level=0,
+                )
+                json_data = json.loads(json_file.read())
+        elif json_data is None:
+            self._debug(
+                "Fatal! import_objects_split(): input json_data None and file_path not exist",
+                verbosity,
+                level=0,
+            )
+            return None
+        self._debug(f"json_data: {json_data}", verbosity, level=3)
+        if (
+            not force
+            and object_type in ("alerts")
+            and "id" in json_data
+            and not is_ksuid(json_data["id"])
+        ):
+            raise Exception(f"Invalid input: {json_data['id']} is not a ksuid")
+        if (
+            not force
+            and object_type in ("alerts")
+            and key2 in json_data
+            and not is_name(json_data[key2])
+        ):
+            raise Exception(f"Invalid input: {json_data[key2]} is not a valid name")
+        if object_type == "pipelines":
+            self._debug(
+                f"Try to create {object_type} {json_data['source']['stream_name']}...",
+                verbosity,
+                level=0,
+            )
+        elif key2 in json_data:
+            self._debug(
+                f"Try to create {object_type} {json_data[key2]}...", verbosity, level=0
+            )
+        elif "name" in json_data:
+            self._debug(
+                f"Try to create {object_type} {json_data['name']}...",
+                verbosity,
+                level=0,
+            )
+        else:
+            self._debug(f"Try to create {object_type}...", verbosity, level=0)
+        return json_data
+
+    def _import_split_files(self, file_path: str, verbosity: int = 0) -> List[str]:
+        """List json files to import from split directory"""
+        self._debug(f"import_objects: search files in {file_path}", verbosity, level=2)
+        files = []
+        # functions
+        # for file in glob.iglob(file_path + "functions/*.json"):
+        for file in os.listdir(f"{file_path}"):
+            if not file.endswith(".json"):
+                continue
+            self._debug(f"import_objects: file {file}", verbosity, level=1)
+            files.append(f"{file_path}/{file}")
+        return files
+
+    def _load_import_list(
+        self, object_type: str, file_path: str, verbosity: int = 0
+    ) -> tuple[List[Dict], str]:
+        """Load list of objects to import from json file and matching id key"""
+        # Determine key mappings based on object type
+        key_mappings = {
+            "dashboards": ("dashboards", "dashboardId"),
+            "users": ("data", "email"),
+            "alerts/destinations": (None, "name"),
+            "alerts/templates": (None, "name"),
+        }
+        list_key, id_key = key_mappings.get(object_type, ("list", "name"))
+
+        with open(file_path, "r", encoding="utf-8") as json_file:
+            json_data = json.load(json_file)
+            self._debug(json_data, verbosity, level=3)
+
+        # Handle special cases or use standard list extraction
+        if object_type in ["alerts/destinations", "alerts/templates"]:
+            json_list = json_data
+        else:
+            try:
+                json_list = json_data[list_key] if list_key else [json_data]
+            except:
+                json_list = [json_data]
+        return json_list, cast(str, id_key)
+
+    def _config_import_plan(
+        self, object_type: str, file_path: str, split: bool = False
+    ) -> List[tuple[str, str, bool]]:
+        """List (object type, file path, split) to import for config_import()"""
+        importable_types = [
+            "functions",
+            "pipelines",
+            "alerts",
+            "alerts/destinations",
+            "alerts/templates",
+            "dashboards",
+            # 'streams' and 'users' are not supported by the API
+            # No CreateStream, only CreateStreamSettings
+            # self.import_objects('streams', f"{file_path}streams.json", overwrite, verbosity)
+            # "Return 400. Text:
+            # Json deserialize error: missing field `password` at line 1" = Extra field required
+            # self.import_objects('users', f"{file_path}users.json", overwrite, verbosity)
+        ]
+
+        if object_type == "all" and split is True:
+            return [(item, f"{file_path}{item}", split) for item in importable_types]
+        if object_type == "all":
+            return [
+                (item, f"{file_path}{item.replace('/', '-')}.json", False)
+                for item in importable_types
+            ]
+        return [(object_type, file_path, False)]
+
+
+class OpenObserve(OpenObserveBase):
+    """
+    OpenObserve class based on OpenObserve REST API
+    """
+
+    _client: httpx.Client
+
+    def __init__(
+        self,
+        user: str,
+        password: str,
+        *,
+        organisation: str = "default",
+        host: str = "http://localhost:5080",
+        verify: bool = True,
+        timeout: int = 10,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        spool: Optional[Spool] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = COMPRESSION_THRESHOLD,
+        compression_level: Optional[int] = None,
+        json_codec: Optional[Union[str, JsonCodec]] = None,
+        adaptive_batch_size: Optional[AdaptiveBatchSize] = None,
+        search_cache: Optional[SearchCache] = None,
+    ) -> None:
+        """Class __init__
+
+        Args:
+          user: openobserve instance username
+          password: openobserve instance matching password
+          organisation: openobserve instance organisation (default, _meta...)
+          host: url of openobserve instance
+          verify: validate certificate
+          timeout: default http timeout
+          max_connections: maximum number of concurrent connections in the pool
+          max_keepalive_connections: maximum number of idle connections kept alive
+          keepalive_expiry: seconds an idle connection is kept alive
+          spool: on-disk spool keeping ingestion batches failing on server outage
+          compression: encode ingestion and search request bodies with gzip or zstd
+          compression_threshold: bodies smaller than this many bytes are sent as is
+          compression_level: encoder level (default: gzip 6, zstd 3)
+          json_codec: request and response json codec instance or name
+                      (orjson, msgspec, json), default: fastest available
+          adaptive_batch_size: per stream batch size controller used by
+                               index_many() and BulkIndexer instead of chunk_size
+          search_cache: search response cache used by search(), search2df()
+                        and search_iter()
+        """
+        super().__init__(
+            user,
+            password,
+            organisation=organisation,
+            host=host,
+            verify=verify,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            spool=spool,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            compression_level=compression_level,
+            json_codec=json_codec,
+            adaptive_batch_size=adaptive_batch_size,
+            search_cache=search_cache,
+        )
+
+    def _create_client(self) -> httpx.Client:
+        """Create the pooled http client used by all requests"""
+        return httpx.Client(
+            verify=self.verify,
+            timeout=self.timeout,
+            limits=self.limits,
+        )
+
+    def __enter__(self) -> OpenObserve:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying http client and its pooled connections"""
+        self._client.close()
+
+    def index(self, index: str, document: dict) -> List[dict]:
+        """Index a document in OpenObserve"""
+        document = self._prepare_document(document)
+
+        response_json = self._post_bulk(index, [self._dumps(document)], "index")
+        self._check_index_response(response_json, document)
+        return response_json
+
+    def index_many(
+        self,
+        index: str,
+        documents: Iterable[dict],
+        *,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        chunk_bytes: int = BULK_CHUNK_BYTES,
+        verbosity: int = 0,
+    ) -> Dict[str, int]:
+        """Index many documents in OpenObserve, one request per chunk
+
+        Args:
+          index: target stream
+          documents: iterable or generator of documents, consumed lazily
+          chunk_size: maximum number of documents per request,
+                      replaced by adaptive batch size if configured
+          chunk_bytes: maximum serialized size of request body
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful and failed document counts summed over all requests,
+          and spooled count if a spool is configured
+        """
+        counts = {"successful": 0, "failed": 0}
+        for chunk in self._bulk_chunks(documents, chunk_size, chunk_bytes, index):
+            self._debug(f"index_many {index}: {len(chunk)} documents", verbosity, 2)
+            self._sum_status(self._post_bulk(index, chunk), counts)
+        self._debug(f"index_many {index}: {counts}", verbosity, 1)
+        return counts
+
+    def index_stream(
+        self,
+        index: str,
+        documents: Iterable[dict],
+        *,
+        buffer_bytes: int = 64 * 1024,
+        verbosity: int = 0,
+    ) -> Dict[str, int]:
+        """Index documents with one streamed request to the _multi endpoint
+
+        The newline delimited json body is generated while the request is sent,
+        so memory stays constant whatever the number of documents.
+        Note: the body can't be spooled or retried, use index_many() for that.
+
+        Args:
+          index: target stream
+          documents: iterable or generator of documents, consumed lazily
+          buffer_bytes: size of body chunks written to the connection
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful and failed document counts
+        """
+        headers = {**self.headers, "Content-Type": "application/x-ndjson"}
+        body = self._ndjson_body(documents, buffer_bytes)
+        if self.compression is not None:
+            # body size is unknown upfront, compression threshold doesn't apply
+            headers["Content-Encoding"] = self.compression
+            body = self._compress_stream(body)
+        res = self._client.post(
+            self._stream_url(index, "_multi"),
+            headers=headers,
+            content=body,
+            timeout=self.timeout,
+        )
+        counts = {"successful": 0, "failed": 0}
+        self._sum_status(self._handle_response(res, "index_stream"), counts)
+        self._debug(f"index_stream {index}: {counts}", verbosity, 1)
+        return counts
+
+    def index_dataframe(
+        self,
+        index: str,
+        df: Any,
+        *,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        chunk_bytes: int = BULK_CHUNK_BYTES,
+        verbosity: int = 0,
+    ) -> Dict[str, int]:
+        """Index rows of a pandas or polars DataFrame, one request per chunk
+
+        Datetime columns are sent as epoch microseconds, timezone naive ones
+        being taken as local time like index() does.
+
+        Args:
+          index: target stream
+          df: pandas or polars DataFrame
+          chunk_size: maximum number of rows per request
+          chunk_bytes: maximum serialized size of request body
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful and failed row counts summed over all requests,
+          and spooled count if a spool is configured
+        """
+        counts = {"successful": 0, "failed": 0}
+        for body, count in self._dataframe_bodies(df, chunk_size, chunk_bytes):
+            self._debug(f"index_dataframe {index}: {count} rows", verbosity, 2)
+            self._sum_status(
+                self._post_json(index, body, count, "index_dataframe"), counts
+            )
+        self._debug(f"index_dataframe {index}: {counts}", verbosity, 1)
+        return counts
+
+    def ingest_file(
+        self,
+        index: str,
+        path: Union[str, Path],
+        *,
+        format: Optional[str] = None,  # pylint: disable=redefined-builtin
+        chunk_size: int = BULK_CHUNK_SIZE,
+        chunk_bytes: int = BULK_CHUNK_BYTES,
+        concurrency: int = 4,
+        verbosity: int = 0,
+    ) -> Dict[str, int]:
+        """Index rows of a parquet, arrow ipc or ndjson file
+
+        The file is memory mapped and read by record batch, or by line for
+        ndjson which is sent without being parsed. Up to concurrency requests
+        are sent at the same time, with at most twice as many bodies in memory.
+
+        Args:
+          index: target stream
+          path: file path
+          format: parquet, arrow or ndjson, default: guessed from file suffix
+          chunk_size: maximum number of rows per request
+          chunk_bytes: maximum serialized size of request body
+          concurrency: maximum number of requests in flight
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful and failed row counts summed over all requests,
+          and spooled count if a spool is configured
+        """
+        path = Path(path)
+        file_format = format or file_formats.get(path.suffix.lower(), path.suffix)
+        if file_format not in file_formats.values():
+            raise ValueError(
+                f"Invalid file format {file_format} for {path}, "
+                f"expecting one of {sorted(set(file_formats.values()))}"
+            )
+        counts = {"successful": 0, "failed": 0}
+        pending: Deque[Future] = deque()
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="openobserve-ingest"
+        ) as executor:
+            try:
+                for body, count in self._file_bodies(
+                    path, file_format, chunk_size, chunk_bytes
+                ):
+                    self._debug(f"ingest_file {index}: {count} rows", verbosity, 2)
+                    pending.append(
+                        executor.submit(
+                            self._post_json, index, body, count, "ingest_file"
+                        )
+                    )
+                    while len(pending) >= 2 * concurrency:
+                        self._sum_status(pending.popleft().result(), counts)
+                while pending:
+                    self._sum_status(pending.popleft().result(), counts)
+            finally:
+                for future in pending:
+                    future.cancel()
+        self._debug(f"ingest_file {index} {path}: {counts}", verbosity, 1)
+        return counts
+
+    def index_raw(
+        self,
+        index: str,
+        data: Union[str, bytes, bytearray, memoryview, Iterable[Any]],
+        *,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        chunk_bytes: int = BULK_CHUNK_BYTES,
+        verbosity: int = 0,
+    ) -> Dict[str, int]:
+        """Index already serialized json documents, one request per chunk
+
+        Documents are framed into request bodies as is, without being parsed,
+        flattened or validated: nested objects are flattened by the server and
+        an invalid document fails its whole chunk.
+
+        Args:
+          index: target stream
+          data: newline delimited json as str, bytes, bytearray or memoryview,
+                or iterable of json lines as bytes or str, consumed lazily
+          chunk_size: maximum number of documents per request,
+                      replaced by adaptive batch size if configured
+          chunk_bytes: maximum serialized size of request body
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful and failed document counts summed over all requests,
+          and spooled count if a spool is configured
+        """
+        counts = {"successful": 0, "failed": 0}
+        for chunk in self._raw_chunks(
+            self._raw_lines(data), chunk_size, chunk_bytes, index
+        ):
+            self._debug(f"index_raw {index}: {len(chunk)} documents", verbosity, 2)
+            self._sum_status(self._post_bulk(index, chunk, "index_raw"), counts)
+        self._debug(f"index_raw {index}: {counts}", verbosity, 1)
+        return counts
+
+    def bulk(self, body: bytes, verbosity: int = 0) -> Dict:
+        """Send an Elasticsearch compatible bulk request to the _bulk endpoint
+
+        Args:
+          body: newline delimited json of action and source lines
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          bulk response with one entry per action in items
+        """
+        content, headers = self._request_body(
+            body, {**self.headers, "Content-Type": "application/x-ndjson"}
+        )
+        res = self._client.post(
+            self.openobserve_url.replace("[STREAM]", "_bulk"),
+            headers=headers,
+            content=content,
+            timeout=self.timeout,
+        )
+        response_json = cast(Dict, self._handle_response(res, "bulk"))
+        self._debug(
+            f"bulk: {len(response_json.get('items', []))} item(s), "
+            f"errors: {response_json.get('errors')}",
+            verbosity,
+            2,
+        )
+        return response_json
+
+    def _ingest_chunk(
+        self, index: str, chunk: List[Tuple[dict, bytes]]
+    ) -> List[Tuple[Optional[int], Any]]:
+        """Post documents to the _bulk endpoint, return (status, error) of each
+
+        status is None when the request failed before the server answered.
+        """
+        content, headers = self._ingest_body(index, chunk)
+        try:
+            res = self._client.post(
+                self.openobserve_url.replace("[STREAM]", "_bulk"),
+                headers=headers,
+                content=content,
+                timeout=self.timeout,
+            )
+        except httpx.TransportError as exc:
+            return [(None, str(exc))] * len(chunk)
+        return self._ingest_statuses(res, len(chunk))
+
+    def ingest(
+        self,
+        index: str,
+        documents: Iterable[dict],
+        *,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        chunk_bytes: int = BULK_CHUNK_BYTES,
+        max_retries: int = 0,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        verbosity: int = 0,
+    ) -> Dict[str, Any]:
+        """Index documents with a status per document, retrying failed ones only
+
+        Documents are sent in chunks to the _bulk endpoint which reports each
+        document status. Documents failing on connection error or retryable
+        http status (429, 5xx) are sent again alone after a backoff doubling
+        on each retry, up to max_retries times, then spooled if a spool is
+        configured. Other failures are reported right away.
+
+        Args:
+          index: target stream
+          documents: iterable or generator of documents, consumed lazily
+          chunk_size: maximum number of documents per request
+          chunk_bytes: maximum serialized size of request body
+          max_retries: number of retries of failed documents
+          initial_backoff: seconds before first retry
+          max_backoff: maximum seconds between retries
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          successful, failed and retried document counts, spooled count if a
+          spool is configured, and errors listing document, status and error
+          of each failed document
+        """
+        result = self._ingest_result()
+        for chunk in self._ingest_chunks(index, documents, chunk_size, chunk_bytes):
+            self._ingest_retry(
+                index,
+                chunk,
+                result,
+                max_retries=max_retries,
+                initial_backoff=initial_backoff,
+                max_backoff=max_backoff,
+            )
+        self._debug(
+            f"ingest {index}: "
+            + str({key: val for key, val in result.items() if key != "errors"}),
+            verbosity,
+            1,
+        )
+        return result
+
+    def _ingest_retry(
+        self,
+        index: str,
+        chunk: List[Tuple[dict, bytes]],
+        result: Dict[str, Any],
+        *,
+        max_retries: int,
+        initial_backoff: float,
+        max_backoff: float,
+    ) -> None:
+        """Send chunk with ingest(), retrying retryable failures, update result"""
+        for attempt in range(max_retries + 1):
+            if attempt:
+                time.sleep(min(max_backoff, initial_backoff * 2 ** (attempt - 1)))
+                result["retried"] += len(chunk)
+            retry = self._ingest_sort(chunk, self._ingest_chunk(index, chunk), result)
+            if not retry:
+                return
+            chunk = [entry for entry, _, _ in retry]
+        self._ingest_give_up(index, retry, result)
+
+    def _post_bulk(
+        self, index: str, documents: List[bytes], action: str = "index_many"
+    ) -> Any:
+        """Post serialized documents to stream ingestion endpoint
+
+        With adaptive batch size, batches rejected as too large (413) are split
+        in halves sent again.
+        """
+        response_json = self._post_json(
+            index,
+            self._json_array(documents),
+            len(documents),
+            action,
+            split=len(documents) > 1,
+        )
+        if response_json is not None:
+            return response_json
+        half = len(documents) // 2
+        return {
+            "status": self._post_bulk(index, documents[:half], action)["status"]
+            + self._post_bulk(index, documents[half:], action)["status"]
+        }
+
+    def _post_json(
+        self,
+        index: str,
+        body: bytes,
+        count: int,
+        action: str = "index_many",
+        *,
+        split: bool = False,
+    ) -> Any:
+        """Post json array body of count documents to stream ingestion endpoint
+
+        If a spool is configured, batches failing on connection error or
+        retryable http status are spooled and reported as spooled.
+        With adaptive batch size, request latency, 413 and timeouts adjust the
+        batch size of the stream, and None is returned on 413 if split is set.
+        """
+        content, headers = self._request_body(body)
+        res: Optional[httpx.Response] = None
+        started = time.monotonic()
+        try:
+            res = self._client.post(
+                self._stream_url(index),
+                headers=headers,
+                content=content,
+                timeout=self.timeout,
+            )
+        except httpx.TransportError as exc:
+            self._post_json_error(index, exc)
+        return self._post_json_result(
+            index, body, count, res, started=started, action=action, split=split
+        )
+
+    def replay_spool(self, verbosity: int = 0) -> int:
+        """Send spooled batches again, in order, once the server is back
+
+        Batches rejected with a non retryable status are dropped.
+
+        Args:
+          verbosity: how verbose to run from 0/less to 5/more
+
+        Returns:
+          number of batches replayed
+        """
+        if self.spool is None:
+            return 0
+
+        def send(stream: str, body: bytes) -> None:
+            content, headers = self._request_body(body)
+            res = self._client.post(
+                self._stream_url(stream),
+                headers=headers,
+                content=content,
+                timeout=self.timeout,
+            )
+            self._replay_response(stream, res, verbosity)
+
+        count = self.spool.replay(send)
+        self._debug(f"replay_spool replayed {count} batch(es)", verbosity, 1)
+        return count
+
+    def search(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int] = 0,
+        end_time: Union[datetime, int] = 0,
+        query_size: int = 1000,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
+    ) -> List[Dict]:
+        """
+        OpenObserve search function
+        https://openobserve.ai/docs/api/search/search/
+        https://github.com/openobserve/openobserve/commit/3ccf0be93391885136377b41a4cc2a36d80f904a
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          query_size: maximum number of results returned (default: 1000)
+                      See also ZO_QUERY_DEFAULT_LIMIT
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
+        """
+        query = self._search_query(
+            sql, start_time, end_time, query_size, verbosity, validate=validate
+        )
+        response_json = self._post_search(query, timeout, "search", validate=validate)
+        return self._search_hits(
+            response_json, verbosity, timestamp_conversion_auto, timestamp_columns
+        )
+
+    def _post_search(
+        self,
+        query: dict,
+        timeout: int,
+        action: str = "search",
+        *,
+        cache: bool = True,
+        validate: bool = True,
+    ) -> Any:
+        """Post search query, using search cache if configured and cache is set"""
+        key, cached = (
+            self._cached_search(query, validate=validate) if cache else (None, None)
+        )
+        if cached is not None:
+            return cached
+        content, headers = self._request_body(self._dumps(query))
+        res = self._client.post(
+            f"{self.openobserve_url.replace('/[STREAM]', '')}/_search",
+            content=content,
+            headers=headers,
+            timeout=timeout,
+        )
+        response_json = self._handle_response(res, action)
+        if key is not None:
+            self.search_cache.put(key, res.content)  # type: ignore[union-attr]
+        return response_json
+
+    def search_iter(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int] = 0,
+        end_time: Union[datetime, int] = 0,
+        page_size: int = 1000,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
+    ) -> Iterator[Dict]:
+        """Search and lazily yield all hits, one request per page
+
+        Pages are requested with from/size until a page is shorter than
+        page_size, so memory is bounded by one page whatever the result size.
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          page_size: number of hits per request
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout of each request
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
+        """
+        if page_size < 1:
+            raise ValueError("Expecting page_size >= 1")
+        query = self._search_query(
+            sql, start_time, end_time, page_size, verbosity, validate=validate
+        )
+        return self._search_pages(
+            query,
+            timeout,
+            verbosity,
+            timestamp_conversion_auto,
+            timestamp_columns,
+            validate=validate,
+        )
+
+    def _search_pages(
+        self,
+        query: dict,
+        timeout: int,
+        verbosity: int,
+        timestamp_conversion_auto: bool,
+        timestamp_columns: Union[List[str], None],
+        *,
+        cache: bool = True,
+        validate: bool = True,
+    ) -> Iterator[Dict]:
+        """Yield hits of search query page by page until a short page"""
+        page_size = query["query"]["size"]
+        while True:
+            hits = self._search_hits(
+                self._post_search(
+                    query, timeout, "search_iter", cache=cache, validate=validate
+                ),
+                verbosity,
+                timestamp_conversion_auto,
+                timestamp_columns,
+            )
+            self._debug(
+                f"search_iter: {len(hits)} hits from {query['query']['from']}",
+                verbosity,
+                2,
+            )
+            yield from hits
+            if len(hits) < page_size:
+                return
+            query["query"]["from"] += len(hits)
+            # release page before requesting the next one
+            del hits
+
+    def search_lazy(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int] = 0,
+        end_time: Union[datetime, int] = 0,
+        query_size: int = 1000,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
+    ) -> Iterator[Dict]:
+        """Search and yield hits one at a time while the response is received
+
+        The response body is read in chunks and its hits array is decoded
+        incrementally, so memory is bounded by one hit instead of the whole
+        result. The request is sent on first iteration.
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          query_size: maximum number of results returned (default: 1000)
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
+        """
+        query = self._search_query(
+            sql, start_time, end_time, query_size, verbosity, validate=validate
+        )
+        content, headers = self._request_body(self._dumps(query))
+        with self._client.stream(
+            "POST",
+            f"{self.openobserve_url.replace('/[STREAM]', '')}/_search",
+            content=content,
+            headers=headers,
+            timeout=timeout,
+        ) as res:
+            if res.status_code != httpx.codes.OK:
+                res.read()
+                raise Exception(
+                    f"Openobserve search_lazy returned {res.status_code}. Text: {res.text}"
+                )
+            metadata: Dict[str, Any] = {}
+            for hit in iter_json_array(res.iter_bytes(), "hits", metadata):
+                yield self._convert_hit(
+                    hit, timestamp_conversion_auto, timestamp_columns
+                )
+            self._debug(f"search_lazy: {metadata}", verbosity, 2)
+
+    def search_stream(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int] = 0,
+        end_time: Union[datetime, int] = 0,
+        query_size: int = 1000,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
+    ) -> Iterator[Tuple[str, Any]]:
+        """Search with the streaming endpoint, yield events as they arrive
+
+        The server sends results partition by partition as server-sent events,
+        yielded as (event, data) tuples: ("hits", list of hits), ("metadata",
+        dict), ("progress", dict) and other events with their own name.
+        Closing the generator, or leaving a for loop over it, cancels the
+        search and closes the connection.
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          query_size: maximum number of results returned (default: 1000)
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
+        """
+        query = self._search_query(
+            sql, start_time, end_time, query_size, verbosity, validate=validate
+        )
+        content, headers = self._request_body(
+            self._dumps(query), {**self.headers, "Accept": "text/event-stream"}
+        )
+        with self._client.stream(
+            "POST",
+            f"{self.openobserve_url.replace('/[STREAM]', '')}/_search_stream",
+            content=content,
+            headers=headers,
+            timeout=timeout,
+        ) as res:
+            if res.status_code != httpx.codes.OK:
+                res.read()
+                raise Exception(
+                    f"Openobserve search_stream returned {res.status_code}. "
+                    f"Text: {res.text}"
+                )
+            for event, data in self._sse_events(res.iter_lines()):
+                item = self._search_stream_event(
+                    event,
+                    data,
+                    verbosity,
+                    timestamp_conversion_auto,
+                    timestamp_columns,
+                )
+                if item is None:
+                    return
+                yield item
+
+    def search_partitioned(
+        self,
+        sql: str,
+        *,
+        start_time: Union[datetime, int],
+        end_time: Union[datetime, int],
+        partitions: int = 4,
+        concurrency: int = 4,
+        query_size: int = 1000,
+        verbosity: int = 0,
+        timeout: int = 300,
+        timestamp_conversion_auto: bool = False,
+        timestamp_columns: Union[List[str], None] = None,
+    ) -> Iterator[Dict]:
+        """Search a long interval as concurrent searches of sub-intervals
+
+        The interval is split in partitions sub-intervals searched at most
+        concurrency at a time over the pooled client, each one returning at
+        most query_size hits. Hits are k-way merged on the first ORDER BY
+        expression, _timestamp descending by default, selected as a hidden
+        column if needed, and the first query_size are returned, after OFFSET
+        and within LIMIT of sql.
+        Aggregate queries are rewritten to return partial aggregates of each
+        sub-interval, fetched page by page, which are combined per group
+        before ORDER BY and LIMIT are applied. Supported aggregates are
+        count, sum, min, max and avg, without DISTINCT nor HAVING.
+
+        Args:
+          sql: input sql query
+          start_time: start of search interval, either datetime, either int/epoch
+          end_time: end of search interval, either datetime, either int/epoch
+          partitions: number of sub-intervals
+          concurrency: maximum number of requests in flight
+          query_size: maximum number of results returned
+          verbosity: how verbose to run from 0/less to 5/more
+          timeout: http timeout of each request
+          timestamp_conversion_auto: try to convert automatically column containing time as name
+          timestamp_columns: convert given columns to timestamp
+
+        Returns:
+          iterator of merged hits
+        """
+        # pylint: disable=import-outside-toplevel
+        from python_openobserve.aggregate import PartialAggregate, is_aggregate
+
+        expression = parse_sql(sql)
+        if is_aggregate(expression):
+            return iter(
+                self._search_partitioned_aggregate(
+                    PartialAggregate(expression),
+                    self._time_partitions(start_time, end_time, partitions),
+                    concurrency=concurrency,
+                    page_size=query_size,
+                    verbosity=verbosity,
+                    timeout=timeout,
+                    timestamp_conversion_auto=timestamp_conversion_auto,
+                    timestamp_columns=timestamp_columns,
+                )[:query_size]
+            )
+        sql, intervals, merge = self._partitioned_plan(
+            expression,
+            sql,
+            start_time,
+            end_time,
+            partitions=partitions,
+            query_size=query_size,
+            verbosity=verbosity,
+        )
+
+        def search(interval: Tuple[int, int]) -> List[Dict]:
+            # sub-intervals are not cached, neighbouring ones would share keys
+            query = self._search_query(
+                sql, *interval, merge["offset"] + merge["count"], verbosity
+            )
+            return self._search_hits(
+                self._post_search(query, timeout, "search_partitioned", cache=False),
+                verbosity,
+                timestamp_conversion_auto,
+                timestamp_columns,
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="openobserve-search"
+        ) as executor:
+            results = list(executor.map(search, intervals))
+        return self._partitioned_merge(results, **merge)
 
-        res = httpx.post(
-            f"{self.openobserve_url.replace('/[STREAM]', '')}/_search",
-            json=query,
-            headers=self.headers,
-            verify=self.verify,
-            timeout=timeout,
+    def _search_partitioned_aggregate(
+        self,
+        aggregate: PartialAggregate,
+        intervals: List[Tuple[int, int]],
+        *,
+        concurrency: int,
+        page_size: int,
+        **kwargs: Any,
+    ) -> List[Dict]:
+        """Run partial aggregate query on each sub-interval and combine results"""
+        self._debug(
+            f"search_partitioned: {intervals} partial sql: {aggregate.sql}",
+            kwargs["verbosity"],
+            1,
         )
 
-        response_json = self._handle_response(res, "search")
-        res_hits = response_json["hits"]  # type: ignore[call-overload]
-        self._debug(res_hits, verbosity, 3)
+        def search(interval: Tuple[int, int]) -> List[Dict]:
+            query = self._search_query(
+                aggregate.sql, *interval, page_size, kwargs["verbosity"]
+            )
+            return list(
+                self._search_pages(
+                    query,
+                    kwargs["timeout"],
+                    kwargs["verbosity"],
+                    kwargs["timestamp_conversion_auto"],
+                    kwargs["timestamp_columns"],
+                    cache=False,
+                )
+            )
 
-        if timestamp_conversion_auto or timestamp_columns is not None:
-            # timestamp back convert
-            res_hits = [self.__intts2datetime(x, timestamp_columns) for x in res_hits]
-        return res_hits
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="openobserve-search"
+        ) as executor:
+            return aggregate.merge(executor.map(search, intervals))
 
     def _execute_api_request(
         self,
@@ -307,33 +2391,28 @@ class OpenObserve:
         json_data: Optional[dict] = None,
     ) -> List[Dict]:
         """Execute API request with proper error handling and debugging"""
-        url = self.openobserve_url.replace("[STREAM]", endpoint)
-        if endpoint in ("alerts", "folders", "folders/alerts", "folders/dashboards"):
-            url = url.replace("/api", "/api/v2")
+        url = self._object_url(endpoint)
         self._debug(url, verbosity)
 
         if method == "GET":
-            res = httpx.get(
+            res = self._client.get(
                 url,
                 headers=self.headers,
                 params=params,
-                verify=self.verify,
                 timeout=self.timeout,
             )
         elif method == "POST":
-            res = httpx.post(
+            res = self._client.post(
                 url,
                 headers=self.headers,
                 json=json_data,
-                verify=self.verify,
                 timeout=self.timeout,
             )
         elif method == "PUT":
-            res = httpx.put(
+            res = self._client.put(
                 url,
                 headers=self.headers,
                 json=json_data,
-                verify=self.verify,
                 timeout=self.timeout,
             )
         else:
@@ -352,6 +2431,7 @@ class OpenObserve:
         timeout: int = 300,
         timestamp_conversion_auto: bool = False,
         timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
     ) -> pandas.DataFrame:
         """
         OpenObserve search function with pandas dataframe output
@@ -365,6 +2445,7 @@ class OpenObserve:
           timeout: http timeout
           timestamp_conversion_auto: try to convert automatically column containing time as name
           timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
         """
         res_json_hits = self.search(
             sql,
@@ -374,26 +2455,11 @@ class OpenObserve:
             verbosity=verbosity,
             timeout=timeout,
             timestamp_conversion_auto=timestamp_conversion_auto,
+            validate=validate,
             # leaving conversion to pandas
             # timestamp_columns=timestamp_columns,
         )
-        df_res = pandas.json_normalize(res_json_hits)
-
-        if timestamp_columns is not None:
-            for col in list(
-                set(df_res.columns) & set(["_timestamp"] + timestamp_columns)
-            ):
-                try:
-                    # ensure timestamp format
-                    if col in ["_timestamp"] + timestamp_columns:
-                        df_res[col] = pandas.to_datetime(df_res[col])
-                except Exception as err:
-                    raise Exception(
-                        err,
-                        "query",
-                        f"query column type conversion: {col} -> {df_res[col]}",
-                    ) from err
-        return df_res
+        return self._hits2df(res_json_hits, timestamp_columns)
 
     def search2df_polars(
         self,
@@ -405,6 +2471,7 @@ class OpenObserve:
         timeout: int = 300,
         timestamp_conversion_auto: bool = False,
         timestamp_columns: Union[List[str], None] = None,
+        validate: bool = True,
     ) -> polars.DataFrame:
         """
         OpenObserve search function with polars dataframe output
@@ -417,6 +2484,7 @@ class OpenObserve:
           timeout: http timeout
           timestamp_conversion_auto: try to convert automatically column containing time as name
           timestamp_columns: convert given columns to timestamp
+          validate: check sql syntax before sending, memoized per sql string
         """
         res_json_hits = self.search(
             sql,
@@ -425,108 +2493,11 @@ class OpenObserve:
             verbosity=verbosity,
             timeout=timeout,
             timestamp_conversion_auto=timestamp_conversion_auto,
+            validate=validate,
             # leaving conversion to pandas
             # timestamp_columns=timestamp_columns,
         )
-        df_res = polars.json_normalize(res_json_hits)
-
-        if timestamp_columns is not None:
-            for col in list(
-                set(df_res.columns) & set(["_timestamp"] + timestamp_columns)
-            ):
-                try:
-                    # ensure timestamp format
-                    if col in ["_timestamp"] + timestamp_columns:
-                        df_res = df_res.with_columns(polars.col(col).str.to_datetime())
-                except Exception as err:
-                    raise Exception(
-                        err,
-                        "query",
-                        f"query column type conversion: {col} -> {df_res[col]}",
-                    ) from err
-        return df_res
-
-    # pylint: disable=too-many-branches,too-many-locals
-    def export_objects_split(
-        self,
-        object_type: str,
-        json_data: list[dict],
-        file_path: str,
-        *,
-        verbosity: int = 0,
-        flat: bool = False,
-        strip: bool = False,
-    ):
-        """
-        Export OpenObserve json configuration to split json files
-
-        Args:
-          object_type: what kind of openobserve object to export
-          json_data: object data to be exported
-          file_path: target file path or prefix
-          verbosity: how verbose to run from 0/less to 5/more
-          flat: put all files in a flat directory or tree hierarchy
-          strip: remove variables data like stats or updated_at fields
-        """
-        key = "list"
-        key2 = "name"
-        if object_type == "dashboards":
-            key = "dashboards"
-            key2 = "dashboard_id"
-        if object_type == "users":
-            key = "data"
-            key2 = "email"
-        self._debug(json_data, verbosity, 3)
-        if flat is True:
-            dst_path = f"{file_path}{object_type}-"
-        else:
-            dst_path = f"{file_path}{object_type}/"
-            Path(dst_path).mkdir(parents=True, exist_ok=True)
-        if object_type in ("alerts/destinations", "alerts/templates"):
-            self._debug("json_list set to alerts type", verbosity, 2)
-            json_list = cast(List[Dict], json_data)
-        else:
-            try:
-                json_list = cast(List[Dict], json_data[key])  # type: ignore[call-overload]
-                self._debug(f"json_list set to key {key}: {json_list}", verbosity, 2)
-            except:
-                json_list = cast(List[Dict], [json_data])
-                self._debug(f"json_list set to array: {json_list}", verbosity, 2)
-        for json_object in json_list:
-            self._debug(
-                f"Export json {object_type} {json_object[key2]}...", verbosity, 0
-            )
-            if strip:
-                keys_to_remove = [
-                    # alerts
-                    "last_triggered_at",
-                    "last_satisfied_at",
-                    "updated_at",
-                    "last_edited_by",
-                    # streams
-                    "stats",
-                ]
-                # data = json.loads(json_object)
-                data2 = {
-                    k: v for k, v in json_object.items() if k not in keys_to_remove
-                }
-                # json_object = json.dumps(data2)
-                json_object = data2
-            self._debug(f"json {json_object}", verbosity, 2)
-            try:
-                with open(
-                    f"{dst_path}{json_object[key2]}.json",
-                    "w",
-                    encoding="utf-8",
-                ) as f:
-                    json.dump(json_object, f, ensure_ascii=False, indent=4)
-            except Exception as err:
-                self._debug(
-                    f"Exception on json {object_type} {json_object[key2]}: {err}.",
-                    verbosity,
-                    0,
-                )
-        return True
+        return self._hits2df_polars(res_json_hits, timestamp_columns)
 
     def list_objects(self, object_type: str, verbosity: int = 0) -> List[Dict]:
         """List available objects for given type"""
@@ -540,21 +2511,8 @@ class OpenObserve:
         List available objects for given type
         Output: Dataframe
         """
-        key = key_mapping.get(object_type, "list")
-
         res_json = self.list_objects(object_type=object_type, verbosity=verbosity)
-
-        if object_type in ["alerts/destinations", "alerts/templates"]:
-            return pandas.json_normalize(res_json)
-        if key in res_json:
-            return pandas.json_normalize(res_json[key])  # type: ignore[index,call-overload]
-
-        raise Exception(
-            (
-                f"list_objects2df: can't normalize data {res_json} "
-                f"for object type {object_type} and key {key}"
-            )
-        )
+        return self._objects2df(object_type, res_json)
 
     def config_export(
         self,
@@ -577,65 +2535,23 @@ class OpenObserve:
           strip: remove variables data like stats or updated_at fields
         """
 
+        if outformat not in ("csv", "xlsx") and split is True and flat is True:
+            print("FIXME! Not implemented")
+            sys.exit(1)
+
         # Collect all configuration data
-        object_types = {
-            "functions": "functions",
-            "pipelines": "pipelines",
-            "alerts": "alerts",
-            "alerts-destinations": "alerts/destinations",
-            "alerts-templates": "alerts/templates",
-            "dashboards": "dashboards",
-            "streams": "streams",
-            "users": "users",
+        data = {
+            name: (api_path, self.list_objects(api_path, verbosity=verbosity))
+            for name, api_path in export_mapping.items()
         }
-        if outformat in ("csv", "xlsx"):
-            # Collect all data
-            data = {
-                name: self.list_objects2df(api_path, verbosity=verbosity)
-                for name, api_path in object_types.items()
-            }
-
-            # Export based on format
-            if outformat == "csv":
-                for name, df in data.items():
-                    df.to_csv(f"{file_path}{name}.csv")
-            elif outformat == "xlsx":
-                for name, df in data.items():
-                    df.to_excel(f"{file_path}{name}.xlsx")
-        else:  # default json
-
-            if split is True and flat is False:
-                # split json
-                data = {
-                    name: [
-                        api_path,
-                        self.list_objects(api_path, verbosity=verbosity),
-                    ]  # type: ignore[misc]
-                    for name, api_path in object_types.items()
-                }
-
-                for name, object_data in data.items():
-                    self.export_objects_split(
-                        object_data[0],  # type: ignore[arg-type]
-                        object_data[1],  # type: ignore[arg-type]
-                        file_path,
-                        verbosity=verbosity,
-                        strip=strip,
-                    )
-            elif split is True and flat is True:
-                print("FIXME! Not implemented")
-                sys.exit(1)
-            else:
-                data = {
-                    name: self.list_objects(
-                        api_path, verbosity=verbosity
-                    )  # type: ignore[misc]
-                    for name, api_path in object_types.items()
-                }
-
-                for name, object_data in data.items():
-                    with open(f"{file_path}{name}.json", "w", encoding="utf-8") as f:
-                        json.dump(object_data, f, ensure_ascii=False, indent=4)
+        self._config_export_write(
+            data,
+            file_path,
+            verbosity,
+            outformat=outformat,
+            split=split,
+            strip=strip,
+        )
 
     def create_object(self, object_type: str, object_json: dict, verbosity: int = 0):
         """Create object
@@ -645,19 +2561,14 @@ class OpenObserve:
           object_json: json source object to create
           verbosity: how verbose to run from 0/less to 5/more
         """
-        url = self.openobserve_url.replace("[STREAM]", object_type)
-        if object_type in ("alerts", "folders", "folders/alerts", "folders/dashboards"):
-            url = url.replace("/api", "/api/v2")
-        if object_type == "alerts" and "folder_id" in object_json:
-            url = f"{url}?folder={object_json['folder_id']}"
+        url = self._object_url(object_type, folder_id=object_json.get("folder_id"))
         self._debug(f"Create object {object_type} url: {url}", verbosity, level=1)
         self._debug(f"Create object json input: {object_json}", verbosity, level=2)
 
-        res = httpx.post(
+        res = self._client.post(
             url,
             json=object_json,
             headers=self.headers,
-            verify=self.verify,
             timeout=self.timeout,
         )
         self._debug(f"Return {res.status_code}. Text: {res.text}", verbosity, level=1)
@@ -675,21 +2586,16 @@ class OpenObserve:
           verbosity: how verbose to run from 0/less to 5/more
         """
         key_id = id_mapping.get(object_type, "id")
-        url = self.openobserve_url.replace(
-            "[STREAM]", f"{object_type}/{object_json[key_id]}"
+        url = self._object_url(
+            object_type, object_json[key_id], object_json.get("folder_id")
         )
-        if object_type in ("alerts", "folders", "folders/alerts", "folders/dashboards"):
-            url = url.replace("/api", "/api/v2")
-        if object_type == "alerts" and "folder_id" in object_json:
-            url = f"{url}?folder={object_json['folder_id']}"
         self._debug(f"Update object {object_type} url: {url}", verbosity, level=1)
         self._debug(f"Update object json input: {object_json}", verbosity, level=2)
 
-        res = httpx.put(
+        res = self._client.put(
             url,
             json=object_json,
             headers=self.headers,
-            verify=self.verify,
             timeout=self.timeout,
         )
         self._debug(f"Return {res.status_code}. Text: {res.text}", verbosity, level=3)
@@ -750,15 +2656,12 @@ class OpenObserve:
           object_id: object id (sometimes name) to delete
           verbosity: how verbose to run from 0/less to 5/more
         """
-        url = self.openobserve_url.replace("[STREAM]", f"{object_type}/{object_id}")
-        if object_type in ("alerts", "folders", "folders/alerts", "folders/dashboards"):
-            url = url.replace("/api", "/api/v2")
+        url = self._object_url(object_type, object_id)
         self._debug(f"Delete object {object_type} url: {url}", verbosity, level=1)
 
-        res = httpx.delete(
+        res = self._client.delete(
             url,
             headers=self.headers,
-            verify=self.verify,
             timeout=self.timeout,
         )
         self._debug(f"Return {res.status_code}. Text: {res.text}", verbosity, level=3)
@@ -813,58 +2716,13 @@ class OpenObserve:
           verbosity: how verbose to run from 0/less to 5/more
           force: skip controls like ksuid
         """
-        key2 = name_mapping.get(object_type, "name")
-        file = Path(file_path)
-        if (json_data is None or not json_data) and file.exists():
-            with open(file_path, "r", encoding="utf-8") as json_file:
-                self._debug(
-                    f"Load json data to import from file {file_path}",
-                    verbosity,
-                    level=0,
-                )
-                json_data = json.loads(json_file.read())
-        elif json_data is None:
-            self._debug(
-                "Fatal! import_objects_split(): input json_data None and file_path not exist",
-                verbosity,
-                level=0,
-            )
+        import_json = self._load_import_object(
+            object_type, json_data, file_path, verbosity=verbosity, force=force
+        )
+        if import_json is None:
             return False
-        self._debug(f"json_data: {json_data}", verbosity, level=3)
-        if (
-            not force
-            and object_type in ("alerts")
-            and "id" in json_data
-            and not is_ksuid(json_data["id"])
-        ):
-            raise Exception(f"Invalid input: {json_data['id']} is not a ksuid")
-        if (
-            not force
-            and object_type in ("alerts")
-            and key2 in json_data
-            and not is_name(json_data[key2])
-        ):
-            raise Exception(f"Invalid input: {json_data[key2]} is not a valid name")
-        if object_type == "pipelines":
-            self._debug(
-                f"Try to create {object_type} {json_data['source']['stream_name']}...",
-                verbosity,
-                level=0,
-            )
-        elif key2 in json_data:
-            self._debug(
-                f"Try to create {object_type} {json_data[key2]}...", verbosity, level=0
-            )
-        elif "name" in json_data:
-            self._debug(
-                f"Try to create {object_type} {json_data['name']}...",
-                verbosity,
-                level=0,
-            )
-        else:
-            self._debug(f"Try to create {object_type}...", verbosity, level=0)
         try:
-            res = self.create_object(object_type, json_data, verbosity=verbosity)
+            res = self.create_object(object_type, import_json, verbosity=verbosity)
             self._debug(f"Create returns {res}.", verbosity, level=0)
 
             if res:
@@ -876,7 +2734,7 @@ class OpenObserve:
                     verbosity,
                     level=0,
                 )
-                res = self.update_object(object_type, json_data, verbosity=verbosity)
+                res = self.update_object(object_type, import_json, verbosity=verbosity)
                 self._debug(f"Update returns {res}.", verbosity, level=0)
                 return res
 
@@ -905,68 +2763,36 @@ class OpenObserve:
           verbosity: how verbose to run from 0/less to 5/more
           split: separate list of objects json in one file per object
         """
-        # Determine key mappings based on object type
-        key_mappings = {
-            "dashboards": ("dashboards", "dashboardId"),
-            "users": ("data", "email"),
-            "alerts/destinations": (None, "name"),
-            "alerts/templates": (None, "name"),
-        }
-        list_key, id_key = key_mappings.get(object_type, ("list", "name"))
-
         if split is True:
-            self._debug(
-                f"import_objects: search files in {file_path}", verbosity, level=2
-            )
-            # functions
-            # for file in glob.iglob(file_path + "functions/*.json"):
-            for file in os.listdir(f"{file_path}"):
-                if not file.endswith(".json"):
-                    continue
-                self._debug(f"import_objects: file {file}", verbosity, level=1)
+            for file in self._import_split_files(file_path, verbosity):
                 self.import_objects_split(
                     object_type,
                     {},
-                    f"{file_path}/{file}",
+                    file,
                     overwrite=overwrite,
                     verbosity=verbosity,
                 )
             return True
 
-        with open(file_path, "r", encoding="utf-8") as json_file:
-            json_data = json.load(json_file)
-            self._debug(json_data, verbosity, level=3)
-
-            # Handle special cases or use standard list extraction
-            if object_type in ["alerts/destinations", "alerts/templates"]:
-                json_list = json_data
-            else:
-                try:
-                    json_list = json_data[list_key] if list_key else [json_data]
-                except:
-                    json_list = [json_data]
+        json_list, id_key = self._load_import_list(object_type, file_path, verbosity)
 
-            # Process each object
-            for json_object in json_list:
-                object_id = json_object.get(id_key, "unknown")
-                self._debug(f"Try to create {object_type} {object_id}...", verbosity)
-                self._debug(json_object, verbosity, level=2)
+        # Process each object
+        for json_object in json_list:
+            object_id = json_object.get(id_key, "unknown")
+            self._debug(f"Try to create {object_type} {object_id}...", verbosity)
+            self._debug(json_object, verbosity, level=2)
 
-                try:
-                    res = self.create_object(
+            try:
+                res = self.create_object(object_type, json_object, verbosity=verbosity)
+                self._debug(f"Create returns {res}.", verbosity)
+                return res
+            except Exception:
+                if overwrite and "name" in json_object:
+                    print(f"Overwrite enabled. Updating object {json_object['name']}")
+                    res = self.update_object(
                         object_type, json_object, verbosity=verbosity
                     )
-                    self._debug(f"Create returns {res}.", verbosity)
-                    return res
-                except Exception:
-                    if overwrite and "name" in json_object:
-                        print(
-                            f"Overwrite enabled. Updating object {json_object['name']}"
-                        )
-                        res = self.update_object(
-                            object_type, json_object, verbosity=verbosity
-                        )
-                        self._debug(f"Update returns {res}.", verbosity)
+                    self._debug(f"Update returns {res}.", verbosity)
         return True
 
     def config_import(
@@ -988,51 +2814,13 @@ class OpenObserve:
           split: separate list of objects json in one file per object
         """
 
-        if object_type == "all" and split is True:
-            importable_types = [
-                "functions",
-                "pipelines",
-                "alerts",
-                "alerts/destinations",
-                "alerts/templates",
-                "dashboards",
-                # 'streams' and 'users' are not supported by the API
-                # No CreateStream, only CreateStreamSettings
-                # self.import_objects('streams', f"{file_path}streams.json", overwrite, verbosity)
-                # "Return 400. Text:
-                # Json deserialize error: missing field `password` at line 1" = Extra field required
-                # self.import_objects('users', f"{file_path}users.json", overwrite, verbosity)
-            ]
-
-            for item in importable_types:
-                file_suffix = item.replace("/", "-")
-                self.import_objects(
-                    item,
-                    f"{file_path}{item}",
-                    overwrite=overwrite,
-                    verbosity=verbosity,
-                    split=split,
-                )
-
-        elif object_type == "all":
-            importable_types = [
-                "functions",
-                "pipelines",
-                "alerts",
-                "alerts/destinations",
-                "alerts/templates",
-                "dashboards",
-            ]
-
-            for item in importable_types:
-                file_suffix = item.replace("/", "-")
-                self.import_objects(
-                    item,
-                    f"{file_path}{file_suffix}.json",
-                    overwrite=overwrite,
-                    verbosity=verbosity,
-                )
-        else:
+        for item, item_path, item_split in self._config_import_plan(
+            object_type, file_path, split
+        ):
             self.import_objects(
-                object_type, file_path, overwrite=overwrite, verbosity=verbosity
+                item,
+                item_path,
+                overwrite=overwrite,
+                verbosity=verbosity,
+                split=item_split,
             )
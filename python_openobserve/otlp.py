@@ -0,0 +1,371 @@
+"""
+OpenObserve OTLP logs and traces export module
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+# pylint: disable=too-many-arguments,too-many-instance-attributes,too-many-return-statements,broad-exception-raised,no-member,protected-access
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+import httpx  # type: ignore
+
+from python_openobserve.openobserve import OpenObserve
+
+try:
+    from opentelemetry.proto.collector.logs.v1 import logs_service_pb2  # type: ignore
+    from opentelemetry.proto.collector.trace.v1 import trace_service_pb2  # type: ignore
+    from opentelemetry.proto.common.v1 import common_pb2  # type: ignore
+    from opentelemetry.proto.logs.v1 import logs_pb2  # type: ignore
+    from opentelemetry.proto.resource.v1 import resource_pb2  # type: ignore
+    from opentelemetry.proto.trace.v1 import trace_pb2  # type: ignore
+
+    HAVE_MODULE_OTLP = True
+except ImportError:
+    HAVE_MODULE_OTLP = False
+
+# OTLP severity numbers of python and OpenTelemetry level names
+severity_numbers = {
+    "TRACE": 1,
+    "DEBUG": 5,
+    "INFO": 9,
+    "WARN": 13,
+    "WARNING": 13,
+    "ERROR": 17,
+    "FATAL": 21,
+    "CRITICAL": 21,
+}
+span_kinds = {
+    "unspecified": 0,
+    "internal": 1,
+    "server": 2,
+    "client": 3,
+    "producer": 4,
+    "consumer": 5,
+}
+status_codes = {"unset": 0, "ok": 1, "error": 2}
+
+
+def unix_nano(timestamp: Union[datetime, int, None]) -> int:
+    """Convert datetime to nanoseconds since epoch, integers are kept as is
+
+    Args:
+      timestamp: datetime, integer nanoseconds, or None for now
+    """
+    if timestamp is None:
+        return time.time_ns()
+    if isinstance(timestamp, datetime):
+        return int(timestamp.timestamp() * 1000000) * 1000
+    return timestamp
+
+
+def otlp_id(value: Union[bytes, str, None], length: int) -> bytes:
+    """Return trace or span id as bytes
+
+    Args:
+      value: id as bytes or hex string
+      length: expected number of bytes, 16 for trace ids and 8 for span ids
+    """
+    if value is None:
+        return b""
+    if isinstance(value, str):
+        value = bytes.fromhex(value)
+    if len(value) != length:
+        raise ValueError(f"Expecting {length} bytes id, got {len(value)}")
+    return value
+
+
+def any_value(value: Any) -> Any:
+    """Convert python value to OTLP AnyValue"""
+    if isinstance(value, bool):
+        return common_pb2.AnyValue(bool_value=value)
+    if isinstance(value, int):
+        return common_pb2.AnyValue(int_value=value)
+    if isinstance(value, float):
+        return common_pb2.AnyValue(double_value=value)
+    if isinstance(value, str):
+        return common_pb2.AnyValue(string_value=value)
+    if isinstance(value, bytes):
+        return common_pb2.AnyValue(bytes_value=value)
+    if isinstance(value, (list, tuple)):
+        return common_pb2.AnyValue(
+            array_value=common_pb2.ArrayValue(values=[any_value(x) for x in value])
+        )
+    if isinstance(value, dict):
+        return common_pb2.AnyValue(
+            kvlist_value=common_pb2.KeyValueList(values=key_values(value))
+        )
+    if value is None:
+        return common_pb2.AnyValue()
+    if isinstance(value, datetime):
+        return common_pb2.AnyValue(int_value=unix_nano(value))
+    return common_pb2.AnyValue(string_value=str(value))
+
+
+def key_values(attributes: Optional[Dict[str, Any]]) -> List[Any]:
+    """Convert dict to OTLP KeyValue list"""
+    if not attributes:
+        return []
+    return [
+        common_pb2.KeyValue(key=str(key), value=any_value(value))
+        for key, value in attributes.items()
+    ]
+
+
+class OtlpExporter:
+    """
+    Batching OTLP exporter
+
+    add_log() and add_span() buffer records, which are sent as one binary
+    protobuf request to /api/{org}/v1/logs and /api/{org}/v1/traces when
+    chunk_size records are buffered or on flush(). Requests go through the
+    client connection pool and compression settings. Records of a failed
+    request are buffered again for the next flush and the error is raised.
+    """
+
+    def __init__(
+        self,
+        client: OpenObserve,
+        *,
+        service_name: str = "python_openobserve",
+        resource: Optional[Dict[str, Any]] = None,
+        stream: Optional[str] = None,
+        chunk_size: int = 1000,
+        verbosity: int = 0,
+    ) -> None:
+        """Class __init__
+
+        Args:
+          client: OpenObserve instance used to send batches
+          service_name: service.name resource attribute
+          resource: additional resource attributes
+          stream: target stream, server default stream if None
+          chunk_size: maximum number of records per request
+          verbosity: how verbose to run from 0/less to 5/more
+        """
+        if not HAVE_MODULE_OTLP:
+            raise ValueError("OTLP export requires opentelemetry-proto module")
+        self.client = client
+        self.resource = resource_pb2.Resource(
+            attributes=key_values({"service.name": service_name, **(resource or {})})
+        )
+        self.scope = common_pb2.InstrumentationScope(name="python_openobserve")
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.verbosity = verbosity
+        self.stats = {"logs": 0, "spans": 0, "rejected": 0, "requests": 0}
+        self._logs: List[Any] = []
+        self._spans: List[Any] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> OtlpExporter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.flush()
+
+    def add_log(
+        self,
+        body: Any,
+        *,
+        timestamp: Union[datetime, int, None] = None,
+        severity: str = "INFO",
+        attributes: Optional[Dict[str, Any]] = None,
+        trace_id: Union[bytes, str, None] = None,
+        span_id: Union[bytes, str, None] = None,
+    ) -> None:
+        """Buffer a log record
+
+        Args:
+          body: log message or structured value
+          timestamp: datetime or integer nanoseconds, now if None
+          severity: level name, TRACE to FATAL or python logging names
+          attributes: record attributes
+          trace_id: 16 bytes trace id, bytes or hex
+          span_id: 8 bytes span id, bytes or hex
+        """
+        observed = time.time_ns()
+        record = logs_pb2.LogRecord(
+            time_unix_nano=unix_nano(timestamp) if timestamp is not None else observed,
+            observed_time_unix_nano=observed,
+            severity_number=severity_numbers.get(severity.upper(), 0),  # type: ignore[arg-type]
+            severity_text=severity,
+            body=any_value(body),
+            attributes=key_values(attributes),
+            trace_id=otlp_id(trace_id, 16),
+            span_id=otlp_id(span_id, 8),
+        )
+        with self._lock:
+            self._logs.append(record)
+            full = len(self._logs) >= self.chunk_size
+        if full:
+            self.flush_logs()
+
+    def add_span(
+        self,
+        name: str,
+        *,
+        trace_id: Union[bytes, str],
+        span_id: Union[bytes, str],
+        start_time: Union[datetime, int],
+        end_time: Union[datetime, int],
+        parent_span_id: Union[bytes, str, None] = None,
+        kind: str = "internal",
+        attributes: Optional[Dict[str, Any]] = None,
+        status: str = "unset",
+        status_message: str = "",
+    ) -> None:
+        """Buffer a span
+
+        Args:
+          name: span name
+          trace_id: 16 bytes trace id, bytes or hex
+          span_id: 8 bytes span id, bytes or hex
+          start_time: datetime or integer nanoseconds
+          end_time: datetime or integer nanoseconds
+          parent_span_id: 8 bytes parent span id, bytes or hex
+          kind: internal, server, client, producer or consumer
+          attributes: span attributes
+          status: unset, ok or error
+          status_message: status description
+        """
+        if kind not in span_kinds:
+            raise ValueError(
+                f"Invalid span kind {kind}, expecting one of {tuple(span_kinds)}"
+            )
+        if status not in status_codes:
+            raise ValueError(
+                f"Invalid span status {status}, expecting one of {tuple(status_codes)}"
+            )
+        span = trace_pb2.Span(
+            trace_id=otlp_id(trace_id, 16),
+            span_id=otlp_id(span_id, 8),
+            parent_span_id=otlp_id(parent_span_id, 8),
+            name=name,
+            kind=span_kinds[kind],  # type: ignore[arg-type]
+            start_time_unix_nano=unix_nano(start_time),
+            end_time_unix_nano=unix_nano(end_time),
+            attributes=key_values(attributes),
+            status=trace_pb2.Status(
+                code=status_codes[status], message=status_message  # type: ignore[arg-type]
+            ),
+        )
+        with self._lock:
+            self._spans.append(span)
+            full = len(self._spans) >= self.chunk_size
+        if full:
+            self.flush_spans()
+
+    def flush(self) -> None:
+        """Send all buffered log records and spans"""
+        self.flush_logs()
+        self.flush_spans()
+
+    def flush_logs(self) -> int:
+        """Send buffered log records, return number of records rejected by server"""
+        with self._lock:
+            records, self._logs = self._logs, []
+        if not records:
+            return 0
+        request = logs_service_pb2.ExportLogsServiceRequest(
+            resource_logs=[
+                logs_pb2.ResourceLogs(
+                    resource=self.resource,
+                    scope_logs=[
+                        logs_pb2.ScopeLogs(scope=self.scope, log_records=records)
+                    ],
+                )
+            ]
+        )
+        try:
+            rejected = self._export(
+                "v1/logs",
+                request.SerializeToString(),
+                logs_service_pb2.ExportLogsServiceResponse,
+                "rejected_log_records",
+            )
+        except Exception:
+            # keep batch for next flush
+            with self._lock:
+                self._logs = records + self._logs
+            raise
+        self.stats["logs"] += len(records) - rejected
+        return rejected
+
+    def flush_spans(self) -> int:
+        """Send buffered spans, return number of spans rejected by server"""
+        with self._lock:
+            spans, self._spans = self._spans, []
+        if not spans:
+            return 0
+        request = trace_service_pb2.ExportTraceServiceRequest(
+            resource_spans=[
+                trace_pb2.ResourceSpans(
+                    resource=self.resource,
+                    scope_spans=[trace_pb2.ScopeSpans(scope=self.scope, spans=spans)],
+                )
+            ]
+        )
+        try:
+            rejected = self._export(
+                "v1/traces",
+                request.SerializeToString(),
+                trace_service_pb2.ExportTraceServiceResponse,
+                "rejected_spans",
+            )
+        except Exception:
+            # keep batch for next flush
+            with self._lock:
+                self._spans = spans + self._spans
+            raise
+        self.stats["spans"] += len(spans) - rejected
+        return rejected
+
+    def _export(
+        self, endpoint: str, body: bytes, response_type: Any, rejected_field: str
+    ) -> int:
+        """Post protobuf request, return number of records rejected by server"""
+        headers = {**self.client.headers, "Content-Type": "application/x-protobuf"}
+        if self.stream is not None:
+            headers["stream-name"] = self.stream
+        content, headers = self.client._request_body(body, headers)
+        res = self.client._client.post(
+            self.client.openobserve_url.replace("[STREAM]", endpoint),
+            content=content,
+            headers=headers,
+        )
+        self.stats["requests"] += 1
+        if res.status_code != httpx.codes.OK:
+            raise Exception(
+                f"Openobserve otlp {endpoint} returned {res.status_code}. Text: {res.text}"
+            )
+        rejected, error = 0, ""
+        if "protobuf" in res.headers.get("content-type", ""):
+            response = response_type.FromString(res.content)
+            rejected = getattr(response.partial_success, rejected_field)
+            error = response.partial_success.error_message
+        elif res.content:
+            partial = self.client.json_codec.loads(res.content).get(
+                "partialSuccess", {}
+            )
+            rejected = int(partial.get(_camel_case(rejected_field), 0))
+            error = partial.get("errorMessage", "")
+        if rejected:
+            self.stats["rejected"] += rejected
+            self.client._debug(
+                f"Openobserve otlp {endpoint} rejected {rejected} records: {error}",
+                self.verbosity,
+                0,
+            )
+        return rejected
+
+
+def _camel_case(name: str) -> str:
+    """Return OTLP json field name of protobuf field name"""
+    first, *rest = name.split("_")
+    return first + "".join(x.capitalize() for x in rest)
@@ -0,0 +1,197 @@
+"""
+OpenObserve ingestion spool module
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import (
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# record header: stream name length, body length
+_HEADER = struct.Struct(">II")
+
+
+class Spool:
+    """
+    Durable on-disk spool of ingestion batches
+
+    Batches are appended to segment files as (stream, serialized body) records.
+    replay() sends them back in order reading one record at a time, stores the
+    acknowledged offset of each segment and deletes fully acknowledged segments.
+    replay_async() does the same with a coroutine sending batches.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        segment_bytes: int = 64 * 1024 * 1024,
+        fsync: bool = False,
+    ) -> None:
+        """Class __init__
+
+        Args:
+          path: spool directory, created if missing
+          segment_bytes: size after which a new segment file is started
+          fsync: fsync segment file after each append
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._replay_lock = threading.Lock()
+        self._file: Optional[BinaryIO] = None
+
+    def _segments(self) -> List[Path]:
+        """List segment files, oldest first"""
+        return sorted(self.path.glob("*.seg"))
+
+    def _roll(self) -> None:
+        """Close current segment, next append starts a new one"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def append(self, stream: str, body: bytes) -> None:
+        """Append one batch to the spool
+
+        Args:
+          stream: target stream
+          body: serialized request body
+        """
+        name = stream.encode("utf-8")
+        record = _HEADER.pack(len(name), len(body)) + name + body
+        with self._lock:
+            if (
+                self._file is not None
+                and self._file.tell() > 0
+                and self._file.tell() + len(record) > self.segment_bytes
+            ):
+                self._roll()
+            if self._file is None:
+                segments = self._segments()
+                seq = int(segments[-1].stem) + 1 if segments else 0
+                # pylint: disable=consider-using-with
+                self._file = open(self.path / f"{seq:012d}.seg", "ab")
+            self._file.write(record)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def pending(self) -> bool:
+        """Is there spooled data not acknowledged yet?"""
+        return any(
+            segment.stat().st_size > self._acked(segment)
+            for segment in self._segments()
+        )
+
+    def close(self) -> None:
+        """Close current segment file"""
+        with self._lock:
+            self._roll()
+
+    def _acked(self, segment: Path) -> int:
+        """Acknowledged offset of segment"""
+        try:
+            return int(segment.with_suffix(".ack").read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _ack(self, segment: Path, offset: int) -> None:
+        """Store acknowledged offset of segment"""
+        tmp = segment.with_suffix(".tmp")
+        tmp.write_text(str(offset), encoding="utf-8")
+        os.replace(tmp, segment.with_suffix(".ack"))
+
+    def _records(self) -> Generator[Tuple[str, bytes], None, None]:
+        """Yield spooled (stream, body) batches in order
+
+        Each batch is acknowledged when the next one is requested, and fully
+        acknowledged segments are deleted.
+        """
+        with self._lock:
+            # appends during replay go to a new segment
+            self._roll()
+            segments = self._segments()
+        for segment in segments:
+            offset = self._acked(segment)
+            with open(segment, "rb") as f:
+                f.seek(offset)
+                while True:
+                    header = f.read(_HEADER.size)
+                    if len(header) < _HEADER.size:
+                        break
+                    name_len, body_len = _HEADER.unpack(header)
+                    stream = f.read(name_len).decode("utf-8")
+                    body = f.read(body_len)
+                    if len(body) < body_len:
+                        # torn record from an interrupted append
+                        break
+                    yield stream, body
+                    offset = f.tell()
+                    self._ack(segment, offset)
+            segment.unlink()
+            segment.with_suffix(".ack").unlink(missing_ok=True)
+
+    def replay(self, send: Callable[[str, bytes], object]) -> int:
+        """Send spooled batches in order and compact acknowledged segments
+
+        Stops at the first exception of send, keeping the batch for next replay.
+
+        Args:
+          send: called with stream and body of each batch, raises on failure
+
+        Returns:
+          number of batches sent
+        """
+        if not self._replay_lock.acquire(blocking=False):  # pylint: disable=R1732
+            return 0
+        try:
+            count = 0
+            with closing(self._records()) as records:
+                for stream, body in records:
+                    send(stream, body)
+                    count += 1
+            return count
+        finally:
+            self._replay_lock.release()
+
+    async def replay_async(
+        self, send: Callable[[str, bytes], Awaitable[object]]
+    ) -> int:
+        """Coroutine version of replay(), send being a coroutine function
+
+        Args:
+          send: awaited with stream and body of each batch, raises on failure
+
+        Returns:
+          number of batches sent
+        """
+        if not self._replay_lock.acquire(blocking=False):  # pylint: disable=R1732
+            return 0
+        try:
+            count = 0
+            with closing(self._records()) as records:
+                for stream, body in records:
+                    await send(stream, body)
+                    count += 1
+            return count
+        finally:
+            self._replay_lock.release()
@@ -0,0 +1,45 @@
+"""
+OpenObserve sql parsing module
+
+sqlglot is imported on first use, so processes which only ingest data don't
+pay its import time and memory.
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+# pylint: disable=import-outside-toplevel
+from functools import lru_cache
+from typing import Any, Optional
+
+# number of distinct sql strings whose normalized form is kept
+SQL_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=SQL_CACHE_SIZE)
+def normalize_sql(sql: str) -> str:
+    """Validate sql syntax and return it normalized, memoized per sql string
+
+    Raises:
+      sqlglot.errors.ParseError: invalid sql, not memoized
+    """
+    import sqlglot  # type: ignore
+
+    return sqlglot.transpile(sql)[0]
+
+
+def parse_sql(sql: str) -> Any:
+    """Parse sql into a sqlglot expression, a new one on each call"""
+    import sqlglot  # type: ignore
+
+    return sqlglot.parse_one(sql)
+
+
+def clause_int(expression: Any, arg: str) -> Optional[int]:
+    """Integer value of LIMIT or OFFSET clause of parsed sql, None if absent"""
+    clause = expression.args.get(arg)
+    if clause is None:
+        return None
+    return int(clause.expression.name)
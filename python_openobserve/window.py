@@ -0,0 +1,140 @@
+"""
+OpenObserve incremental rolling window query module
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+from __future__ import annotations
+
+# pylint: disable=too-many-arguments,too-many-instance-attributes,protected-access,too-few-public-methods
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Union
+
+from python_openobserve.aggregate import is_aggregate
+from python_openobserve.openobserve import HAVE_MODULE_PANDAS, OpenObserve
+from python_openobserve.sql import parse_sql
+
+if HAVE_MODULE_PANDAS:
+    import pandas
+
+
+class RollingWindow:
+    """
+    Rolling time window query refreshed incrementally
+
+    refresh() returns the rows of sql over the last window, like search2df().
+    Rows of the previous refresh are kept: only rows since the previous
+    refresh are fetched, and rows which fell out of the window are dropped.
+    Aggregate queries and queries with LIMIT can't be merged and are fetched
+    over the whole window on each refresh.
+    Rows are expected to be ingested within delay of their _timestamp, later
+    ones are missed by incremental refreshes.
+    """
+
+    def __init__(
+        self,
+        client: OpenObserve,
+        sql: str,
+        *,
+        window: timedelta = timedelta(minutes=15),
+        delay: timedelta = timedelta(0),
+        page_size: int = 10000,
+        timeout: int = 300,
+        timestamp_columns: Union[List[str], None] = None,
+        verbosity: int = 0,
+    ) -> None:
+        """Class __init__
+
+        Args:
+          client: OpenObserve instance used to search
+          sql: input sql query
+          window: length of the time window ending at refresh time
+          delay: window ends delay before refresh time, leaving time to ingest rows
+          page_size: number of rows per request
+          timeout: http timeout of each request
+          timestamp_columns: convert given columns to timestamp
+          verbosity: how verbose to run from 0/less to 5/more
+        """
+        if not HAVE_MODULE_PANDAS:
+            raise ValueError("RollingWindow requires pandas module")
+        expression = parse_sql(sql)
+        self.client = client
+        self.sql = sql
+        self.window = int(window.total_seconds() * 1000000)
+        self.delay = int(delay.total_seconds() * 1000000)
+        self.page_size = page_size
+        self.timeout = timeout
+        self.timestamp_columns = timestamp_columns
+        self.verbosity = verbosity
+        self.incremental = (
+            not is_aggregate(expression) and expression.args.get("limit") is None
+        )
+        self.order = client._merge_order(expression)
+        self.end: Optional[int] = None
+        self.stats = {"refreshes": 0, "full": 0, "fetched": 0, "dropped": 0}
+        self._frame: Any = None
+
+    def _fetch(self, start_time: int, end_time: int) -> pandas.DataFrame:
+        """Fetch all rows of sql within [start_time, end_time)"""
+        query = self.client._search_query(
+            self.sql, start_time, end_time, self.page_size, self.verbosity
+        )
+        # a cached response of a neighbouring time range would break slices
+        hits = list(
+            self.client._search_pages(
+                query, self.timeout, self.verbosity, False, None, cache=False
+            )
+        )
+        self.stats["fetched"] += len(hits)
+        frame = pandas.json_normalize(hits)
+        if self.incremental and len(frame) and "_timestamp" not in frame.columns:
+            raise ValueError("RollingWindow requires _timestamp in query results")
+        return frame
+
+    def _merge(self, frame: pandas.DataFrame, start_time: int) -> pandas.DataFrame:
+        """Drop rows before start_time and add newly fetched frame"""
+        old = self._frame
+        if len(old):
+            kept = old[old["_timestamp"] >= start_time]
+            self.stats["dropped"] += len(old) - len(kept)
+            old = kept
+        column, descending = self.order
+        frames = [x for x in ([frame, old] if descending else [old, frame]) if len(x)]
+        if not frames:
+            return frame
+        merged = pandas.concat(frames, ignore_index=True)
+        if column != "_timestamp" and column in merged.columns:
+            merged = merged.sort_values(
+                column, ascending=not descending, kind="stable", ignore_index=True
+            )
+        return merged
+
+    def refresh(self, now: Optional[datetime] = None) -> pandas.DataFrame:
+        """Return rows of the window ending at now, fetching only new ones
+
+        Args:
+          now: end of window before delay, default: current time
+        """
+        end_time = int((now or datetime.now()).timestamp() * 1000000) - self.delay
+        start_time = end_time - self.window
+        self.stats["refreshes"] += 1
+        if (
+            not self.incremental
+            or self._frame is None
+            or self.end is None
+            or self.end <= start_time
+        ):
+            self._frame = self._fetch(start_time, end_time)
+            self.stats["full"] += 1
+        elif self.end < end_time:
+            self._frame = self._merge(self._fetch(self.end, end_time), start_time)
+        else:
+            self._frame = self._merge(self._frame.iloc[0:0], start_time)
+        self.end = end_time
+        self.client._debug(
+            f"RollingWindow refresh: {len(self._frame)} rows, {self.stats}",
+            self.verbosity,
+            1,
+        )
+        return self.client._df_timestamps(self._frame.copy(), self.timestamp_columns)
@@ -0,0 +1,70 @@
+"""
+Benchmark for python-openobserve - request body compression, offline
+
+Measures encoding time and size of ingestion bodies for each compression
+setting. Run with: python -m tests.benchmark_compression
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=protected-access
+import random
+import time
+from datetime import datetime, timedelta
+from python_openobserve.openobserve import HAVE_MODULE_ZSTANDARD, OpenObserve
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+# (compression, level) settings compared
+SETTINGS = [(None, None), ("gzip", 1), ("gzip", 6), ("gzip", 9)] + (
+    [("zstd", 1), ("zstd", 3), ("zstd", 9)] if HAVE_MODULE_ZSTANDARD else []
+)
+
+
+def log_documents(count: int) -> list:
+    """Generate log like documents"""
+    rnd = random.Random(42)  # nosec B311
+    start = datetime(2025, 1, 1)
+    return [
+        {
+            "_timestamp": start + timedelta(milliseconds=n),
+            "level": rnd.choice(["INFO", "INFO", "INFO", "WARNING", "ERROR"]),
+            "logger": rnd.choice(["app.api", "app.db", "app.worker"]),
+            "message": f"request {rnd.randint(0, 10**6)} served in "
+            f"{rnd.random() * 100:.2f} ms for user{rnd.randint(0, 500)}",
+            "host": f"web-{rnd.randint(1, 8):02d}",
+            "status": rnd.choice([200, 200, 200, 404, 500]),
+        }
+        for n in range(count)
+    ]
+
+
+def main(count: int = 1000, rounds: int = 20) -> None:
+    """Print body size, ratio and encoding time of one index_many() chunk"""
+    documents = log_documents(count)
+    print(f"{count} documents per body, {rounds} rounds")
+    print(f"{'compression':<12}{'bytes':>10}{'ratio':>8}{'ms/body':>10}{'MB/s':>9}")
+    for compression, level in SETTINGS:
+        oo_conn = OpenObserve(
+            host=OO_HOST,
+            user=OO_USER,
+            password=OO_PASS,
+            compression=compression,
+            compression_level=level,
+        )
+        body = oo_conn._json_array([oo_conn._encode_document(x) for x in documents])
+        started = time.perf_counter()
+        for _ in range(rounds):
+            content, _ = oo_conn._request_body(body)
+        elapsed = (time.perf_counter() - started) / rounds
+        name = f"{compression}-{level}" if compression else "none"
+        print(
+            f"{name:<12}{len(content):>10}{len(body) / len(content):>8.1f}"
+            f"{elapsed * 1000:>10.2f}{len(body) / elapsed / 1e6:>9.0f}"
+        )
+        oo_conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark for python-openobserve - json codecs, offline
+
+Measures document encoding and search response decoding time for each
+available json codec. Run with: python -m tests.benchmark_json_codec
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=protected-access
+import time
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.json_codec import get_codec, json_codecs
+from tests.benchmark_compression import log_documents
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+
+def main(count: int = 10000, rounds: int = 5) -> None:
+    """Print encoding and decoding time of count documents"""
+    documents = log_documents(count)
+    print(f"{count} documents, {rounds} rounds")
+    print(f"{'codec':<10}{'encode ms':>11}{'decode ms':>11}")
+    for name in json_codecs:
+        try:
+            codec = get_codec(name)
+        except ValueError:
+            continue
+        oo_conn = OpenObserve(
+            host=OO_HOST, user=OO_USER, password=OO_PASS, json_codec=codec
+        )
+        started = time.perf_counter()
+        for _ in range(rounds):
+            body = oo_conn._json_array([oo_conn._encode_document(x) for x in documents])
+        encode = (time.perf_counter() - started) / rounds
+        response = b'{"took":1,"hits":' + body + b"}"
+        started = time.perf_counter()
+        for _ in range(rounds):
+            codec.loads(response)
+        decode = (time.perf_counter() - started) / rounds
+        print(f"{name:<10}{encode * 1000:>11.1f}{decode * 1000:>11.1f}")
+        oo_conn.close()
+
+
+if __name__ == "__main__":
+    main()
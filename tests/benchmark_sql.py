@@ -0,0 +1,50 @@
+"""
+Benchmark for python-openobserve - search sql validation, offline
+
+Measures the time to build a search query with uncached, memoized and
+skipped sql validation. Run with: python -m tests.benchmark_sql
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=protected-access
+import time
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.sql import normalize_sql
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+QUERIES = [
+    "SELECT * FROM \"default\" WHERE level = 'error'",
+    'SELECT log_file_name, count(*) AS n FROM "default" '
+    "WHERE status >= 500 GROUP BY log_file_name ORDER BY n DESC LIMIT 10",
+]
+
+
+def main(rounds: int = 2000) -> None:
+    """Print microseconds per search query built for each validation mode"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    print(f"{rounds} rounds")
+    print(
+        f"{'validation':<12}" + "".join(f"{'us/query ' + str(n):>14}" for n in (1, 2))
+    )
+    for name, validate, memoized in [
+        ("uncached", True, False),
+        ("memoized", True, True),
+        ("skipped", False, True),
+    ]:
+        timings = []
+        for sql in QUERIES:
+            started = time.perf_counter()
+            for _ in range(rounds):
+                if not memoized:
+                    normalize_sql.cache_clear()
+                oo_conn._search_query(sql, 0, 1, 100, 0, validate=validate)
+            timings.append((time.perf_counter() - started) / rounds)
+        print(f"{name:<12}" + "".join(f"{x * 1e6:>14.1f}" for x in timings))
+    oo_conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Pytest file for python-openobserve - adaptive batch size, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code,too-few-public-methods
+import json
+from unittest.mock import patch
+import httpx  # type: ignore
+import pytest  # type: ignore
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.adaptive import AdaptiveBatchSize
+from python_openobserve.bulk import BulkIndexer
+from tests.test_openobserve_api_offline import mock_post_index
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+
+def mock_post413(*args, **kwargs):
+    """MockResponse function for openobserve calls of httpx.post - 413 over 4 documents"""
+
+    class MockResponse:
+        """MockResponse class for openobserve calls of httpx.post"""
+
+        def __init__(self, json_data, status_code, text):
+            self.json_data = json_data
+            self.status_code = status_code
+            self.text = text
+            self.content = json.dumps(json_data).encode("utf-8")
+
+        def json(self):
+            return self.json_data
+
+    if len(json.loads(kwargs["content"])) > 4:
+        return MockResponse({}, 413, "Payload Too Large")
+    return mock_post_index(*args, **kwargs)
+
+
+def test_adaptive_batch_size():
+    """Ensure batch size grows on fast full batches and shrinks otherwise"""
+    controller = AdaptiveBatchSize(100, min_size=10, max_size=200, target_latency=1)
+    assert controller.size("pytest") == 100
+    controller.record("pytest", 100, 0.1)
+    assert controller.size("pytest") == 125
+    # partial batch, size kept
+    controller.record("pytest", 10, 0.1)
+    assert controller.size("pytest") == 125
+    controller.record("pytest", 125, 2.0)
+    assert controller.size("pytest") == 62
+    assert controller.shrink("pytest", "too_large") == 31
+    for _ in range(5):
+        controller.shrink("pytest", "timeouts")
+    assert controller.size("pytest") == 10
+    for _ in range(20):
+        controller.record("pytest", 1000, 0.1)
+    assert controller.size("pytest") == 200
+    assert controller.size("other") == 100
+    metrics = controller.metrics()
+    assert metrics["batch_size"] == {"pytest": 200}
+    assert metrics["too_large"] == 1
+    assert metrics["timeouts"] == 5
+    with pytest.raises(ValueError):
+        AdaptiveBatchSize(5, min_size=10)
+
+
+@patch("httpx.Client.post", side_effect=mock_post413)
+def test_adaptive_index_many(mock_post413):
+    """Ensure batches rejected with 413 are split and batch size halved"""
+    controller = AdaptiveBatchSize(16, min_size=1)
+    oo_conn = OpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, adaptive_batch_size=controller
+    )
+    res = oo_conn.index_many("pytest", ({"n": n} for n in range(40)), chunk_size=1000)
+    assert res == {"successful": 40, "failed": 0}
+    sent = [
+        json.loads(x.kwargs["content"])
+        for x in mock_post413.call_args_list
+        if len(json.loads(x.kwargs["content"])) <= 4
+    ]
+    assert sorted(doc["n"] for docs in sent for doc in docs) == list(range(40))
+    # 16 -> 8 -> 4, then grows on fast full batches up to next 413
+    assert controller.stats["too_large"] >= 2
+    assert controller.size("pytest") in (4, 5)
+
+
+def test_adaptive_timeout():
+    """Ensure timeouts halve batch size"""
+    controller = AdaptiveBatchSize(100)
+    oo_conn = OpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, adaptive_batch_size=controller
+    )
+    with patch("httpx.Client.post", side_effect=httpx.ReadTimeout("timed out")):
+        with pytest.raises(httpx.ReadTimeout):
+            oo_conn.index_many("pytest", [{"n": 0}])
+    assert controller.size("pytest") == 50
+    assert controller.metrics()["timeouts"] == 1
+
+
+@patch("httpx.Client.post", side_effect=mock_post413)
+def test_adaptive_bulk_indexer(mock_post413):
+    """Ensure BulkIndexer batches follow adaptive batch size"""
+    controller = AdaptiveBatchSize(8, min_size=1, growth=1.01)
+    oo_conn = OpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, adaptive_batch_size=controller
+    )
+    with BulkIndexer(oo_conn, chunk_size=1000, flush_interval=60) as indexer:
+        for n in range(20):
+            indexer.add("pytest", {"n": n})
+        indexer.flush()
+        assert indexer.stats["successful"] == 20
+    sizes = [len(json.loads(x.kwargs["content"])) for x in mock_post413.call_args_list]
+    assert sizes[:3] == [8, 4, 4]
+    assert max(sizes[3:]) <= 5
+    assert controller.stats["too_large"] == sizes.count(5) + 1
@@ -0,0 +1,156 @@
+"""
+Pytest file for python-openobserve - partitioned aggregate queries, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code,too-few-public-methods
+import json
+import sqlite3
+from unittest.mock import patch
+import pytest  # type: ignore
+import sqlglot  # type: ignore
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.aggregate import PartialAggregate
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+# _timestamp 0 to 99, value NULL every 7 rows
+ROWS = [
+    (n, f"file{n % 3}", None if n % 7 == 0 else (n * 37) % 11, n % 2)
+    for n in range(100)
+]
+
+
+def query_rows(sql, start_time=0, end_time=100):
+    """Run sql on ROWS within time range with sqlite, return rows as dicts"""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE data (_timestamp, log_file_name, value, level)")
+    conn.executemany("INSERT INTO data VALUES (?, ?, ?, ?)", ROWS)
+    conn.execute(
+        "CREATE TEMP VIEW pytest AS SELECT * FROM data "
+        f"WHERE _timestamp >= {start_time} AND _timestamp < {end_time}"
+    )
+    rows = [dict(x) for x in conn.execute(sql)]
+    conn.close()
+    return rows
+
+
+def mock_post_sqlite(*args, **kwargs):
+    """MockResponse function for openobserve calls of httpx.post - sqlite search"""
+
+    class MockResponse:
+        """MockResponse class for openobserve calls of httpx.post"""
+
+        def __init__(self, json_data, status_code, text):
+            self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
+            self.status_code = status_code
+            self.text = text
+
+        def json(self):
+            return self.json_data
+
+    query = json.loads(kwargs["content"])["query"]
+    hits = query_rows(
+        f"{query['sql']} LIMIT {query['size']} OFFSET {query['from']}",
+        query["start_time"],
+        query["end_time"],
+    )
+    return MockResponse({"took": 1, "hits": hits}, 200, "")
+
+
+def test_partial_aggregate_sql():
+    """Ensure aggregates are rewritten to partial ones"""
+    aggregate = PartialAggregate(
+        sqlglot.parse_one(
+            "SELECT log_file_name, count(*), avg(value) AS mean FROM pytest "
+            "WHERE level = 1 GROUP BY log_file_name ORDER BY mean DESC LIMIT 2"
+        )
+    )
+    assert aggregate.sql == (
+        'SELECT log_file_name AS "log_file_name", COUNT(*) AS "_p1", '
+        'SUM(value) AS "_p2_sum", COUNT(value) AS "_p2_count" FROM pytest '
+        'WHERE level = 1 GROUP BY log_file_name ORDER BY "log_file_name"'
+    )
+    assert aggregate.order == [("mean", True)]
+    assert aggregate.limit == 2
+    rows = aggregate.merge(
+        [
+            [{"log_file_name": "a", "_p1": 2, "_p2_sum": 4, "_p2_count": 2}],
+            [
+                {"log_file_name": "a", "_p1": 1, "_p2_sum": None, "_p2_count": 0},
+                {"log_file_name": "b", "_p1": 3, "_p2_sum": 9, "_p2_count": 2},
+                {"log_file_name": "c", "_p1": 3, "_p2_sum": None, "_p2_count": 0},
+            ],
+        ]
+    )
+    assert rows == [
+        {"log_file_name": "b", "count(*)": 3, "mean": 4.5},
+        {"log_file_name": "a", "count(*)": 3, "mean": 2},
+    ]
+
+
+def test_partial_aggregate_hidden_keys():
+    """Ensure GROUP BY expressions which are not selected still split groups"""
+    aggregate = PartialAggregate(
+        sqlglot.parse_one("SELECT a, count(*) AS c FROM s GROUP BY a, b")
+    )
+    assert aggregate.sql == (
+        'SELECT a AS "a", COUNT(*) AS "_p1", b AS "_g1" FROM s '
+        'GROUP BY a, b ORDER BY "a", "_g1"'
+    )
+    rows = aggregate.merge(
+        [
+            [{"a": "x", "_g1": 1, "_p1": 2}, {"a": "x", "_g1": 2, "_p1": 3}],
+            [{"a": "x", "_g1": 1, "_p1": 1}],
+        ]
+    )
+    assert rows == [{"a": "x", "c": 3}, {"a": "x", "c": 3}]
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT count(*) AS n, min(value) AS lo, max(value) AS hi FROM pytest",
+        "SELECT log_file_name, count(*) AS n, sum(value) AS total FROM pytest "
+        "GROUP BY log_file_name ORDER BY log_file_name",
+        "SELECT log_file_name, level, avg(value) AS mean, count(value) AS n "
+        "FROM pytest WHERE _timestamp > 10 GROUP BY log_file_name, level "
+        "ORDER BY mean DESC, level LIMIT 4",
+        "SELECT level, count(*) FROM pytest GROUP BY level "
+        "ORDER BY count(*) DESC, level LIMIT 1 OFFSET 1",
+        "SELECT log_file_name, count(*) AS n FROM pytest "
+        "GROUP BY log_file_name, level ORDER BY n DESC, log_file_name",
+    ],
+)
+@patch("httpx.Client.post", side_effect=mock_post_sqlite)
+def test_search_partitioned_aggregate(mock_post_sqlite, sql):
+    """Ensure partitioned aggregates give the results of a single query"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    hits = list(
+        oo_conn.search_partitioned(
+            sql, start_time=0, end_time=100, partitions=7, query_size=2
+        )
+    )
+    expected = query_rows(sql)
+    assert hits == [pytest.approx(x) for x in expected[:2]]
+    # pages of 2 groups from each of the 7 partitions
+    assert mock_post_sqlite.call_count >= 7
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT count(DISTINCT level) FROM pytest",
+        "SELECT approx_percentile_cont(value, 0.5) FROM pytest",
+        "SELECT level, count(*) FROM pytest GROUP BY level HAVING count(*) > 1",
+        "SELECT level, count(*) FROM pytest GROUP BY level ORDER BY sum(value)",
+    ],
+)
+def test_partial_aggregate_invalid(sql):
+    """Ensure non decomposable aggregate queries are refused"""
+    with pytest.raises(ValueError, match="Can't split aggregate"):
+        PartialAggregate(sqlglot.parse_one(sql))
@@ -0,0 +1,132 @@
+"""
+Pytest file for python-openobserve - background bulk indexer, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code
+import json
+import queue
+import threading
+import time
+from unittest.mock import patch
+import pytest  # type: ignore
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.bulk import BulkIndexer
+from tests.test_openobserve_api_offline import mock_post_index, mock_post500
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+
+def posted(mock_post):
+    """Return (stream url, documents) of each mocked post"""
+    return [
+        (x.args[0], json.loads(x.kwargs["content"])) for x in mock_post.call_args_list
+    ]
+
+
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_bulk_indexer_size(mock_post_index):
+    """Ensure documents are batched per stream and sent on size"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with BulkIndexer(oo_conn, chunk_size=10, flush_interval=60) as indexer:
+        for n in range(25):
+            indexer.add("pytest", {"n": n})
+        indexer.add("pytest2", {"n": 0})
+        indexer.flush()
+        assert indexer.stats["successful"] == 26
+        res = posted(mock_post_index)
+        assert [len(docs) for url, docs in res if url.endswith("/pytest/_json")] == [
+            10,
+            10,
+            5,
+        ]
+        assert [docs for url, docs in res if "pytest2" in url] == [[{"n": 0}]]
+
+
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_bulk_indexer_bytes(mock_post_index):
+    """Ensure batches are bounded by serialized size"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with BulkIndexer(oo_conn, chunk_bytes=250, flush_interval=60) as indexer:
+        for _ in range(10):
+            indexer.add("pytest", {"log": "x" * 100})
+    assert indexer.stats["successful"] == 10
+    assert mock_post_index.call_count == 5
+    # nothing left to send once closed
+    indexer.flush()
+    assert mock_post_index.call_count == 5
+
+
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_bulk_indexer_interval(mock_post_index):
+    """Ensure documents are sent after flush interval without flush()"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with BulkIndexer(oo_conn, flush_interval=0.1) as indexer:
+        indexer.add("pytest", {"n": 1})
+        for _ in range(50):
+            if mock_post_index.call_count:
+                break
+            time.sleep(0.05)
+        assert mock_post_index.call_count == 1
+
+
+@patch("httpx.Client.post", side_effect=mock_post500)
+def test_bulk_indexer_error(mock_post500):
+    """Ensure failed batches are counted and given to on_error"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    failed = []
+    with BulkIndexer(
+        oo_conn, on_error=lambda stream, docs, exc: failed.append((stream, docs))
+    ) as indexer:
+        indexer.add("pytest", {"n": 1})
+        indexer.add("pytest", {"n": 2})
+    assert indexer.stats["errors"] == 1
+    assert indexer.stats["failed"] == 2
+    assert failed == [("pytest", [b'{"n":1}', b'{"n":2}'])]
+    with pytest.raises(Exception, match="BulkIndexer is closed"):
+        indexer.add("pytest", {"n": 3})
+
+
+def blocking_post(event):
+    """Return mocked post waiting for event"""
+
+    def post(*args, **kwargs):
+        event.wait(5)
+        return mock_post_index(*args, **kwargs)
+
+    return post
+
+
+@pytest.mark.parametrize("overflow", ["drop_oldest", "raise"])
+def test_bulk_indexer_overflow(overflow):
+    """Ensure full queue drops oldest documents or raises"""
+    event = threading.Event()
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with patch("httpx.Client.post", side_effect=blocking_post(event)) as mock_post:
+        indexer = BulkIndexer(oo_conn, chunk_size=1, queue_size=2, overflow=overflow)
+        indexer.add("pytest", {"n": 0})
+        # wait for worker to block sending first document
+        for _ in range(50):
+            if mock_post.call_count:
+                break
+            time.sleep(0.05)
+        indexer.add("pytest", {"n": 1})
+        indexer.add("pytest", {"n": 2})
+        if overflow == "raise":
+            with pytest.raises(queue.Full):
+                indexer.add("pytest", {"n": 3})
+        else:
+            indexer.add("pytest", {"n": 3})
+            assert indexer.stats["dropped"] == 1
+        event.set()
+        indexer.close()
+    sent = [doc["n"] for _, docs in posted(mock_post) for doc in docs]
+    assert sent == ([0, 2, 3] if overflow == "drop_oldest" else [0, 1, 2])
+
+
+def test_bulk_indexer_invalid_policy():
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with pytest.raises(ValueError, match="Invalid overflow policy"):
+        BulkIndexer(oo_conn, overflow="invalid")
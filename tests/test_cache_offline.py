@@ -0,0 +1,126 @@
+"""
+Pytest file for python-openobserve - search result cache, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code
+import json
+import time
+from unittest.mock import patch
+import pytest  # type: ignore
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.cache import SearchCache
+from tests.test_openobserve_api_offline import mock_post
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+MINUTE = 60 * 1000000
+NOW = 1674213225158000
+
+
+@patch("httpx.Client.post", side_effect=mock_post)
+def test_search_cache(mock_post):
+    """Ensure repeated searches are served from cache"""
+    cache = SearchCache(bucket=60)
+    oo_conn = OpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, search_cache=cache
+    )
+    first = oo_conn.search(
+        'SELECT * FROM "default"',
+        start_time=NOW - 15 * MINUTE,
+        end_time=NOW,
+        timestamp_columns=["_timestamp"],
+    )
+    # same query formatted differently, a few seconds later
+    second = oo_conn.search(
+        'select *\n  from "default"',
+        start_time=NOW - 15 * MINUTE + 3000000,
+        end_time=NOW + 3000000,
+    )
+    assert mock_post.call_count == 1
+    # requested time range is sent as is
+    query = json.loads(mock_post.call_args.kwargs["content"])["query"]
+    assert (query["start_time"], query["end_time"]) == (NOW - 15 * MINUTE, NOW)
+    # timestamp conversion of first result didn't alter the cached response
+    assert second[0]["_timestamp"] == 1674213225158000
+    assert first[0]["_timestamp"] != second[0]["_timestamp"]
+    assert cache.metrics()["hits"] == 1
+    assert cache.metrics()["misses"] == 1
+
+    oo_conn.search2df('SELECT * FROM "default"', start_time=NOW - MINUTE, end_time=NOW)
+    oo_conn.search(
+        'SELECT * FROM "default"', start_time=NOW - 15 * MINUTE, end_time=NOW
+    )
+    oo_conn.search(
+        'SELECT * FROM "default"',
+        start_time=NOW - 15 * MINUTE,
+        end_time=NOW,
+        query_size=10,
+    )
+    assert mock_post.call_count == 3
+    assert cache.metrics()["entries"] == 3
+
+    # interval shorter than a bucket is not cached
+    for _ in range(2):
+        oo_conn.search('SELECT * FROM "default"', start_time=NOW - 1000, end_time=NOW)
+    assert mock_post.call_count == 5
+    query = json.loads(mock_post.call_args.kwargs["content"])["query"]
+    assert (query["start_time"], query["end_time"]) == (NOW - 1000, NOW)
+
+
+@patch("httpx.Client.post", side_effect=mock_post)
+def test_search_cache_eviction(mock_post):
+    """Ensure responses are evicted by total size and age"""
+    size = len(mock_post("/api/default/_search").content)
+    mock_post.reset_mock()
+    cache = SearchCache(max_bytes=2 * size, ttl=0.2)
+    oo_conn = OpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, search_cache=cache
+    )
+
+    def search(minutes):
+        oo_conn.search(
+            'SELECT * FROM "default"', start_time=NOW - minutes * MINUTE, end_time=NOW
+        )
+
+    for minutes in (1, 2, 1, 3, 1, 2):
+        search(minutes)
+    # 2 evicted by 3, then 3 by 2, 1 being most recently used
+    assert mock_post.call_count == 4
+    metrics = cache.metrics()
+    assert metrics["entries"] == 2
+    assert metrics["bytes"] == 2 * size
+    assert metrics["evictions"] == 2
+    time.sleep(0.3)
+    search(1)
+    assert mock_post.call_count == 5
+    assert cache.metrics()["expired"] == 1
+    cache.clear()
+    assert cache.metrics()["bytes"] == 0
+    with pytest.raises(ValueError):
+        SearchCache(ttl=0)
+
+
+@patch("httpx.Client.post", side_effect=mock_post)
+def test_search_cache_shared(mock_post):
+    """Ensure a cache shared by clients keys on their url, and skips parsing"""
+    cache = SearchCache()
+    clients = [
+        OpenObserve(host=host, user=OO_USER, password=OO_PASS, search_cache=cache)
+        for host in ("http://oo1", "http://oo2")
+    ]
+    for oo_conn in clients * 2:
+        oo_conn.search(
+            'SELECT * FROM "default"', start_time=NOW - 15 * MINUTE, end_time=NOW
+        )
+    assert mock_post.call_count == 2
+    assert cache.metrics()["hits"] == 2
+
+    # not validated sql is not parsed for the key either
+    for _ in range(2):
+        clients[0].search(
+            "SELECT (", start_time=NOW - 15 * MINUTE, end_time=NOW, validate=False
+        )
+    assert mock_post.call_count == 3
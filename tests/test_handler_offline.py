@@ -0,0 +1,61 @@
+"""
+Pytest file for python-openobserve - logging handler, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code
+import json
+import logging
+from unittest.mock import patch
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.handler import OpenObserveHandler
+from tests.test_openobserve_api_offline import mock_post_index
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_handler(mock_post_index):
+    """Ensure log records are sent in one batch as flat documents"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    handler = OpenObserveHandler(oo_conn, "pytestlogs", flush_interval=60)
+    logger = logging.getLogger("pytest.handler")
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    try:
+        logger.info("hello %s", "world", extra={"user": "root", "obj": object()})
+        logger.debug("not sent")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        assert mock_post_index.call_count == 0
+        handler.flush()
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    assert mock_post_index.call_count == 1
+    assert mock_post_index.call_args.args[0].endswith("/pytestlogs/_json")
+    documents = json.loads(mock_post_index.call_args.kwargs["content"])
+    assert len(documents) == 2
+    assert documents[0]["message"] == "hello world"
+    assert documents[0]["level"] == "INFO"
+    assert documents[0]["logger"] == "pytest.handler"
+    assert documents[0]["user"] == "root"
+    assert documents[0]["obj"].startswith("<object")
+    assert isinstance(documents[0]["_timestamp"], int)
+    assert "ValueError: boom" in documents[1]["exception"]
+
+
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_handler_close(mock_post_index):
+    """Ensure queued records are sent on close"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    handler = OpenObserveHandler(oo_conn, "pytestlogs", flush_interval=60)
+    handler.emit(logging.makeLogRecord({"msg": "last words"}))
+    handler.close()
+    documents = json.loads(mock_post_index.call_args.kwargs["content"])
+    assert documents[0]["message"] == "last words"
@@ -0,0 +1,198 @@
+"""
+Pytest file for python-openobserve - elasticsearch compatible bulk helpers, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code,too-few-public-methods
+import json
+from datetime import datetime
+from unittest.mock import patch
+import pytest  # type: ignore
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.helpers import (
+    BulkIndexError,
+    bulk,
+    expand_action,
+    parallel_bulk,
+    streaming_bulk,
+)
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+
+def mock_post_bulk(*args, **kwargs):
+    """MockResponse function for openobserve calls of httpx.post - _bulk
+
+    Documents with a "fail" field are rejected with the status it holds.
+    """
+
+    class MockResponse:
+        """MockResponse class for openobserve calls of httpx.post"""
+
+        def __init__(self, json_data, status_code, text):
+            self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
+            self.status_code = status_code
+            self.text = text
+
+        def json(self):
+            return self.json_data
+
+    lines = [json.loads(line) for line in kwargs["content"].splitlines()]
+    items = []
+    while lines:
+        action = lines.pop(0)
+        op_type, meta = next(iter(action.items()))
+        status = 200
+        if op_type != "delete":
+            status = lines.pop(0).get("fail", 200)
+        item = {"_index": meta["_index"], "status": status}
+        if status != 200:
+            item["error"] = {"type": "rejected", "reason": "mock"}
+        items.append({op_type: item})
+    errors = any(next(iter(item.values()))["status"] != 200 for item in items)
+    return MockResponse({"took": 1, "errors": errors, "items": items}, 200, "")
+
+
+def test_expand_action():
+    """Ensure ES style action dicts are split into action line and source"""
+    assert expand_action({"_index": "s", "_id": "1", "a": 1}) == (
+        {"index": {"_index": "s", "_id": "1"}},
+        {"a": 1},
+    )
+    assert expand_action({"_op_type": "create", "_source": {"a": 1}}, "d") == (
+        {"create": {"_index": "d"}},
+        {"a": 1},
+    )
+    assert expand_action({"_op_type": "delete", "_index": "s", "_id": "1"}) == (
+        {"delete": {"_index": "s", "_id": "1"}},
+        None,
+    )
+    with pytest.raises(ValueError, match="no _index"):
+        expand_action({"a": 1})
+    with pytest.raises(ValueError, match="Invalid bulk operation"):
+        expand_action({"_op_type": "upsert", "_index": "s"})
+
+
+@patch("httpx.Client.post", side_effect=mock_post_bulk)
+def test_streaming_bulk(mock_post_bulk):
+    """Ensure actions are chunked as ndjson and results reported per action"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    actions = [
+        {"_index": "pytest", "n": n, "date": datetime(2025, 1, 1)} for n in range(5)
+    ]
+    results = list(streaming_bulk(oo_conn, actions, chunk_size=2))
+    assert [ok for ok, _ in results] == [True] * 5
+    assert results[0][1] == {"index": {"_index": "pytest", "status": 200}}
+    assert mock_post_bulk.call_count == 3
+    assert mock_post_bulk.call_args.args[0].endswith("/api/default/_bulk")
+    headers = mock_post_bulk.call_args.kwargs["headers"]
+    assert headers["Content-Type"] == "application/x-ndjson"
+    lines = mock_post_bulk.call_args_list[0].kwargs["content"].splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"index": {"_index": "pytest"}},
+        {"n": 0, "date": int(datetime(2025, 1, 1).timestamp() * 1000000)},
+        {"index": {"_index": "pytest"}},
+        {"n": 1, "date": int(datetime(2025, 1, 1).timestamp() * 1000000)},
+    ]
+
+
+@patch("httpx.Client.post", side_effect=mock_post_bulk)
+def test_bulk_errors(mock_post_bulk):
+    """Ensure failed items are raised, or returned with their source"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    actions = [{"n": 0}, {"n": 1, "fail": 400}, {"n": 2}]
+    with pytest.raises(BulkIndexError) as exc:
+        bulk(oo_conn, actions, index="pytest")
+    assert len(exc.value.errors) == 1
+
+    success, errors = bulk(oo_conn, actions, index="pytest", raise_on_error=False)
+    assert success == 2
+    assert errors == [
+        {
+            "index": {
+                "_index": "pytest",
+                "status": 400,
+                "error": {"type": "rejected", "reason": "mock"},
+                "data": {"n": 1, "fail": 400},
+            }
+        }
+    ]
+    assert bulk(
+        oo_conn, actions, index="pytest", raise_on_error=False, stats_only=True
+    ) == (2, 1)
+
+
+def test_bulk_retry():
+    """Ensure actions rejected with 429 are retried alone"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    calls = []
+
+    def mock_post_busy(*args, **kwargs):
+        calls.append(kwargs["content"])
+        if len(calls) > 1:
+            kwargs["content"] = kwargs["content"].replace(b',"fail":429', b"")
+        return mock_post_bulk(*args, **kwargs)
+
+    actions = [{"n": 0}, {"n": 1, "fail": 429}]
+    with patch("httpx.Client.post", side_effect=mock_post_busy):
+        res = bulk(oo_conn, actions, index="pytest", max_retries=2, initial_backoff=0)
+    assert res == (2, [])
+    assert len(calls) == 2
+    assert calls[1].count(b"\n") == 2
+
+
+def test_bulk_exception():
+    """Ensure request errors are reported per action when not raised"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with patch("httpx.Client.post", side_effect=Exception("server down")):
+        with pytest.raises(Exception, match="server down"):
+            bulk(oo_conn, [{"n": 0}], index="pytest")
+        results = list(
+            streaming_bulk(
+                oo_conn,
+                [{"n": 0}, {"n": 1}],
+                index="pytest",
+                raise_on_error=False,
+                raise_on_exception=False,
+            )
+        )
+    assert [ok for ok, _ in results] == [False, False]
+    assert results[1][1]["index"]["error"] == "server down"
+    assert results[1][1]["index"]["data"] == {"n": 1}
+
+
+def test_bulk_missing_items():
+    """Ensure actions without item in bulk response are reported as failed"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+
+    def mock_post_truncated(*args, **kwargs):
+        res = mock_post_bulk(*args, **kwargs)
+        res.json_data["items"] = res.json_data["items"][:1]
+        res.content = json.dumps(res.json_data).encode("utf-8")
+        return res
+
+    with patch("httpx.Client.post", side_effect=mock_post_truncated):
+        success, errors = bulk(
+            oo_conn, [{"n": 0}, {"n": 1}], index="pytest", raise_on_error=False
+        )
+    assert success == 1
+    assert errors[0]["index"]["error"] == "no item in bulk response"
+    assert errors[0]["index"]["data"] == {"n": 1}
+
+
+@patch("httpx.Client.post", side_effect=mock_post_bulk)
+def test_parallel_bulk(mock_post_bulk):
+    """Ensure chunks are sent from threads and results kept in order"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    actions = ({"_index": f"pytest{n}", "n": n} for n in range(100))
+    results = list(
+        parallel_bulk(oo_conn, actions, thread_count=3, chunk_size=7, queue_size=1)
+    )
+    assert mock_post_bulk.call_count == 15
+    assert [item["index"]["_index"] for _, item in results] == [
+        f"pytest{n}" for n in range(100)
+    ]
+    assert all(ok for ok, _ in results)
@@ -0,0 +1,105 @@
+"""
+Pytest file for python-openobserve - json codecs, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code,protected-access
+import json
+from datetime import datetime
+from unittest.mock import patch
+import pytest  # type: ignore
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.json_codec import (
+    JsonCodec,
+    get_codec,
+    iter_json_array,
+    json_codecs,
+)
+from tests.test_openobserve_api_offline import mock_post_index
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+DATE = datetime(2025, 1, 1, 12, 30)
+DATE_INT = int(DATE.timestamp() * 1000000)
+
+
+def available_codecs():
+    codecs = []
+    for name in json_codecs:
+        try:
+            codecs.append(get_codec(name))
+        except ValueError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda x: x.name)
+def test_codec(codec):
+    """Ensure codecs output compact utf-8 json and encode nested datetimes"""
+    encoded = codec.dumps({"message": "héllo", "n": 1, "list": [1, 2]})
+    assert isinstance(encoded, bytes)
+    assert encoded == '{"message":"héllo","n":1,"list":[1,2]}'.encode("utf-8")
+    assert codec.loads(encoded) == json.loads(encoded)
+    assert codec.loads(encoded.decode("utf-8")) == json.loads(encoded)
+    if codec.native_datetime:
+        assert json.loads(codec.dumps({"nested": [{"date": DATE}]})) == {
+            "nested": [{"date": DATE_INT}]
+        }
+    with pytest.raises(TypeError):
+        codec.dumps({"obj": object()})
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda x: x.name)
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_codec_index(mock_post_index, codec):
+    """Ensure documents are sent with datetimes as microseconds whatever the codec"""
+    oo_conn = OpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, json_codec=codec
+    )
+    res = oo_conn.index_many("pytest", [{"n": n, "date": DATE} for n in range(3)])
+    assert res == {"successful": 3, "failed": 0}
+    assert json.loads(mock_post_index.call_args.kwargs["content"]) == [
+        {"n": n, "date": DATE_INT} for n in range(3)
+    ]
+
+
+def test_get_codec():
+    """Ensure codecs are selected by name, instance or availability"""
+    assert get_codec("json").name == "json"
+    codec = JsonCodec()
+    assert get_codec(codec) is codec
+    assert get_codec().name == available_codecs()[0].name
+    with pytest.raises(ValueError, match="Invalid json codec"):
+        get_codec("simplejson")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+def test_iter_json_array(chunk_size):
+    """Ensure array items are decoded incrementally whatever the chunk boundaries"""
+    document = {
+        "took": 12,
+        "hits": [
+            {"n": n, "msg": 'héllo "}]', "x": 1.5e10, "ok": None} for n in range(20)
+        ],
+        "total": 12345,
+    }
+    encoded = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    chunks = (encoded[i : i + chunk_size] for i in range(0, len(encoded), chunk_size))
+    metadata = {}
+    assert list(iter_json_array(chunks, "hits", metadata)) == document["hits"]
+    assert metadata == {"took": 12, "total": 12345}
+    assert not list(iter_json_array([b'{"hits": [ ] }'], "hits"))
+    with pytest.raises(ValueError, match="Truncated"):
+        list(iter_json_array([encoded[:-30]], "hits"))
+
+
+def test_iter_json_array_numbers():
+    """Ensure numbers split before their fraction or exponent are decoded whole"""
+    encoded = b'{"took":1.25,"hits":[1.5,-2e-3,10,3.0E+2,7],"scale":12.5e1}'
+    for i in range(1, len(encoded)):
+        metadata = {}
+        hits = list(iter_json_array([encoded[:i], encoded[i:]], "hits", metadata))
+        assert hits == [1.5, -2e-3, 10, 300.0, 7], i
+        assert metadata == {"took": 1.25, "scale": 125.0}, i
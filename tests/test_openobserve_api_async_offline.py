@@ -0,0 +1,357 @@
+"""
+Pytest file for python-openobserve - asyncio client, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code
+import asyncio
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+import httpx  # type: ignore
+import pytest  # type: ignore
+import jmespath
+from python_openobserve.adaptive import AdaptiveBatchSize
+from python_openobserve.async_openobserve import AsyncOpenObserve
+from python_openobserve.spool import Spool
+from tests.test_adaptive_offline import mock_post413
+from tests.test_openobserve_api_offline import (
+    mock_delete,
+    mock_get,
+    mock_get401,
+    mock_post,
+    mock_post_index,
+    mock_post_pages,
+    mock_post_users,
+    mock_post502,
+)
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+
+@patch("httpx.AsyncClient.get", side_effect=mock_get)
+def test_async_list_object_streams(mock_get):
+    """Ensure can list streams and have 'default' one (list_objects)"""
+
+    async def run():
+        async with AsyncOpenObserve(
+            host=OO_HOST, user=OO_USER, password=OO_PASS
+        ) as oo_conn:
+            return await oo_conn.list_objects("streams", verbosity=5)
+
+    res = asyncio.run(run())
+    assert jmespath.search("list[?name=='default']", res)
+
+
+@patch("httpx.AsyncClient.get", side_effect=mock_get401)
+def test_async_list_object_streams401(mock_get):
+    """Ensure http errors are raised like the sync client"""
+
+    async def run():
+        async with AsyncOpenObserve(
+            host=OO_HOST, user="invalid@example.com", password=""  # nosec B106
+        ) as oo_conn:
+            await oo_conn.list_objects("streams")
+
+    with pytest.raises(
+        Exception,
+        match="Openobserve GET_streams returned 401. Text: Unauthorized Access",
+    ):
+        asyncio.run(run())
+
+
+@patch("httpx.AsyncClient.post", side_effect=mock_post)
+def test_async_search_concurrent(mock_post):
+    """Ensure concurrent searches share one client and return hits/dataframe"""
+
+    async def run():
+        async with AsyncOpenObserve(
+            host=OO_HOST, user=OO_USER, password=OO_PASS
+        ) as oo_conn:
+            sql = 'SELECT * FROM "default"'
+            start_timeperiod = datetime.now() - timedelta(days=7)
+            end_timeperiod = datetime.now()
+            hits = await asyncio.gather(
+                *[
+                    oo_conn.search(
+                        sql, start_time=start_timeperiod, end_time=end_timeperiod
+                    )
+                    for _ in range(10)
+                ]
+            )
+            df_res = await oo_conn.search2df(
+                sql,
+                start_time=start_timeperiod,
+                end_time=end_timeperiod,
+                timestamp_conversion_auto=True,
+            )
+            return hits, df_res
+
+    hits, df_res = asyncio.run(run())
+    assert len(hits) == 10
+    assert all(x[0]["stream"] == "stderr" for x in hits)
+    assert mock_post.call_count == 11
+    assert df_res["_timestamp"].dtypes == "datetime64[ns]"
+
+
+@patch("httpx.AsyncClient.post", side_effect=mock_post_index)
+def test_async_index(mock_post_index):
+    """Ensure can index document"""
+
+    async def run():
+        async with AsyncOpenObserve(
+            host=OO_HOST, user=OO_USER, password=OO_PASS
+        ) as oo_conn:
+            return await oo_conn.index("pytest", {"action": "buy"})
+
+    res = asyncio.run(run())
+    assert res["status"][0]["successful"] == 1
+    assert mock_post_index.call_args.args[0] == "MOCK_INPUT/api/default/pytest/_json"
+    assert json.loads(mock_post_index.call_args.kwargs["content"]) == [
+        {"action": "buy"}
+    ]
+
+
+@patch("httpx.AsyncClient.post", side_effect=mock_post_index)
+def test_async_index_raw(mock_post_index):
+    """Ensure can index serialized json lines"""
+
+    async def run():
+        async with AsyncOpenObserve(
+            host=OO_HOST, user=OO_USER, password=OO_PASS
+        ) as oo_conn:
+            return await oo_conn.index_raw(
+                "pytest", b'{"n":0}\n{"n":1}\n{"n":2}\n', chunk_size=2
+            )
+
+    assert asyncio.run(run()) == {"successful": 3, "failed": 0}
+    assert mock_post_index.call_count == 2
+
+
+@patch("httpx.AsyncClient.post", side_effect=mock_post_index)
+def test_async_index_raw_str(mock_post_index):
+    """Ensure a str payload is split into lines, not characters"""
+
+    async def run():
+        async with AsyncOpenObserve(
+            host=OO_HOST, user=OO_USER, password=OO_PASS
+        ) as oo_conn:
+            return await oo_conn.index_raw("pytest", '{"a":1}\n{"a":2}')
+
+    assert asyncio.run(run()) == {"successful": 2, "failed": 0}
+    assert json.loads(mock_post_index.call_args.kwargs["content"]) == [
+        {"a": 1},
+        {"a": 2},
+    ]
+
+
+@patch("httpx.AsyncClient.post", side_effect=mock_post_pages)
+def test_async_search_iter(mock_post_pages):
+    """Ensure search_iter() yields all hits page by page"""
+
+    async def run():
+        async with AsyncOpenObserve(
+            host=OO_HOST, user=OO_USER, password=OO_PASS
+        ) as oo_conn:
+            return [
+                x["n"]
+                async for x in oo_conn.search_iter("select * from pytest", page_size=10)
+            ]
+
+    assert asyncio.run(run()) == list(range(25))
+    assert mock_post_pages.call_count == 3
+
+
+@patch("httpx.AsyncClient.delete", side_effect=mock_delete)
+@patch("httpx.AsyncClient.post", side_effect=mock_post_users)
+def test_async_create_delete_object_users(mock_post_users, mock_delete, capsys):
+    """Ensure can create and delete user"""
+
+    async def run():
+        async with AsyncOpenObserve(
+            host=OO_HOST, user=OO_USER, password=OO_PASS
+        ) as oo_conn:
+            res = await oo_conn.create_object(
+                "users", {"email": "pytest@example.com"}, verbosity=3
+            )
+            res2 = await oo_conn.delete_object(
+                "users", "pytest@example.com", verbosity=3
+            )
+            return res, res2
+
+    res, res2 = asyncio.run(run())
+    captured = capsys.readouterr()
+    assert res
+    assert res2
+    assert "Create object completed" in captured.out
+    assert "Delete object completed" in captured.out
+
+
+@patch("httpx.AsyncClient.get", side_effect=mock_get)
+def test_async_config_export(mock_get, tmp_path):
+    """Ensure config export writes one json per object type"""
+
+    async def run():
+        async with AsyncOpenObserve(
+            host=OO_HOST, user=OO_USER, password=OO_PASS
+        ) as oo_conn:
+            await oo_conn.config_export(f"{tmp_path}/")
+
+    asyncio.run(run())
+    assert (tmp_path / "streams.json").exists()
+    assert (tmp_path / "users.json").exists()
+
+
+def test_async_sync_context_manager():
+    """Ensure sync context manager is refused"""
+    oo_conn = AsyncOpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with pytest.raises(TypeError, match="async with"):
+        with oo_conn:
+            pass
+    asyncio.run(oo_conn.close())
+
+
+async def mock_handler(request):
+    """httpx.MockTransport handler of ingestion and search endpoints"""
+    body = await request.aread()
+    path = request.url.path
+    if path.endswith("/_bulk"):
+        items = [
+            {"index": {"_index": "pytest", "status": 200}}
+            for _ in body.splitlines()[1::2]
+        ]
+        return httpx.Response(200, json={"errors": False, "items": items})
+    if path.endswith("/_json") or path.endswith("/_multi"):
+        count = (
+            len(json.loads(body)) if path.endswith("/_json") else len(body.splitlines())
+        )
+        return httpx.Response(
+            200,
+            json={
+                "code": 200,
+                "status": [{"name": "pytest", "successful": count, "failed": 0}],
+            },
+        )
+    query = json.loads(body)["query"]
+    hits = [
+        {"_timestamp": query["end_time"] - n, "n": n}
+        for n in range(min(3, query["size"]))
+    ]
+    if path.endswith("/_search_stream"):
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=(
+                f"event: search_response_hits\ndata: {json.dumps({'hits': hits})}\n\n"
+                'event: progress\ndata: {"percent": 100}\n\n'
+                "event: end\ndata: [[DONE]]\n\n"
+            ).encode("utf-8"),
+        )
+    return httpx.Response(200, json={"took": 1, "hits": hits, "total": len(hits)})
+
+
+def test_async_network_methods(tmp_path):
+    """Ensure ingestion and streamed/partitioned search are coroutines"""
+    path = tmp_path / "pytest.ndjson"
+    path.write_bytes(b"".join(b'{"n": %d}\n' % n for n in range(5)))
+
+    async def run():
+        async with AsyncOpenObserve(
+            host="http://oo", user=OO_USER, password=OO_PASS
+        ) as oo_conn:
+            documents = [{"n": n} for n in range(5)]
+            return (
+                await oo_conn.ingest("pytest", documents, chunk_size=2),
+                await oo_conn.bulk(b'{"index": {"_index": "pytest"}}\n{"n": 0}\n'),
+                await oo_conn.index_stream("pytest", documents, buffer_bytes=8),
+                await oo_conn.ingest_file("pytest", path, chunk_size=2, concurrency=2),
+                [x["n"] async for x in oo_conn.search_lazy("SELECT * FROM pytest")],
+                [x async for x in oo_conn.search_stream("SELECT * FROM pytest")],
+                await oo_conn.search_partitioned(
+                    "SELECT * FROM pytest",
+                    start_time=0,
+                    end_time=100,
+                    partitions=2,
+                    query_size=4,
+                ),
+            )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(mock_handler))
+    with patch.object(AsyncOpenObserve, "_create_client", return_value=client):
+        ingest, bulk, stream, ingest_file, lazy, events, partitioned = asyncio.run(
+            run()
+        )
+    assert ingest == {"successful": 5, "failed": 0, "retried": 0, "errors": []}
+    assert bulk["items"][0]["index"]["status"] == 200
+    assert stream == {"successful": 5, "failed": 0}
+    assert ingest_file == {"successful": 5, "failed": 0}
+    assert lazy == [0, 1, 2]
+    assert [event for event, _ in events] == ["hits", "progress"]
+    assert [x["n"] for x in events[0][1]] == [0, 1, 2]
+    assert [x["_timestamp"] for x in partitioned] == [100, 99, 98, 50]
+
+
+def test_async_index_many_spool(tmp_path):
+    """Ensure batches failing on server outage are spooled then replayed"""
+    oo_conn = AsyncOpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, spool=Spool(tmp_path)
+    )
+    documents = [{"n": n} for n in range(5)]
+    with patch("httpx.AsyncClient.post", side_effect=mock_post502):
+        res = asyncio.run(oo_conn.index_many("pytest", documents, chunk_size=2))
+    assert res == {"successful": 0, "failed": 0, "spooled": 5}
+
+    with patch(
+        "httpx.AsyncClient.post", side_effect=httpx.ConnectError("connection refused")
+    ):
+        res = asyncio.run(oo_conn.index("pytest", {"n": 5}))
+        assert res["status"][0]["spooled"] == 1
+
+    with patch("httpx.AsyncClient.post", side_effect=mock_post_index) as mock_post:
+        assert asyncio.run(oo_conn.replay_spool()) == 4
+        sent = [json.loads(x.kwargs["content"]) for x in mock_post.call_args_list]
+    assert sent == [[{"n": 0}, {"n": 1}], [{"n": 2}, {"n": 3}], [{"n": 4}], [{"n": 5}]]
+    assert not oo_conn.spool.pending()
+
+
+@patch("httpx.AsyncClient.post", side_effect=mock_post413)
+def test_async_adaptive_index_many(mock_post413):
+    """Ensure batches rejected with 413 are split and batch size halved"""
+    controller = AdaptiveBatchSize(16, min_size=1)
+    oo_conn = AsyncOpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, adaptive_batch_size=controller
+    )
+    res = asyncio.run(
+        oo_conn.index_many("pytest", ({"n": n} for n in range(40)), chunk_size=1000)
+    )
+    assert res == {"successful": 40, "failed": 0}
+    assert controller.stats["too_large"] >= 2
+    assert controller.size("pytest") in (4, 5)
+
+
+def test_async_incorrect_params():
+    """Ensure argument errors name the async class"""
+    with pytest.raises(
+        TypeError,
+        match=(
+            r"AsyncOpenObserve.__init__\(\) missing 2 required positional arguments:"
+            " 'user' and 'password'"
+        ),
+    ):
+        # pylint: disable=no-value-for-parameter
+        AsyncOpenObserve()
+
+
+def test_async_config_export_flat_split(tmp_path):
+    """Ensure unsupported config export raises instead of exiting"""
+
+    async def run():
+        async with AsyncOpenObserve(
+            host=OO_HOST, user=OO_USER, password=OO_PASS
+        ) as oo_conn:
+            await oo_conn.config_export(f"{tmp_path}/", split=True, flat=True)
+
+    with pytest.raises(NotImplementedError):
+        asyncio.run(run())
@@ -67,3 +67,19 @@ def test_search1_df():
     assert not df_search_results.columns.empty
     assert "log_file_name" in df_search_results.columns
     assert "count(*)" in df_search_results.columns
+
+
+@pytest.mark.limit_memory("10 MB")
+def test_search_lazy_large():
+    """Ensure memory stays bounded while reading a large search result"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    sql = 'SELECT * FROM "default"'
+    start_timeperiod = datetime.now() - timedelta(days=7)
+    end_timeperiod = datetime.now()
+    count = 0
+    for hit in oo_conn.search_lazy(
+        sql, start_time=start_timeperiod, end_time=end_timeperiod, query_size=1000000
+    ):
+        assert "_timestamp" in hit
+        count += 1
+    assert count
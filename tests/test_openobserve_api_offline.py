@@ -5,14 +5,26 @@ SPDX-FileCopyrightText: 2025 The python_openobserve authors
 SPDX-License-Identifier: GPL-3.0-or-later
 """
 
-# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,too-few-public-methods,no-else-return,duplicate-code,too-many-lines
-from datetime import datetime, timedelta
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,too-few-public-methods,no-else-return,duplicate-code,too-many-lines,protected-access
+import gzip
+import json
+import os
+import subprocess  # nosec B404
+import sys
+import time
+from datetime import datetime, timedelta, timezone
 from pprint import pprint
 from unittest.mock import patch
+import httpx  # type: ignore
 import pytest  # type: ignore
 import sqlglot  # type: ignore
 import jmespath
-from python_openobserve.openobserve import OpenObserve
+import pandas
+import polars  # type: ignore
+from python_openobserve.openobserve import OpenObserve, flatten
+from python_openobserve.spool import Spool
+from python_openobserve.sql import normalize_sql
+from tests.test_helpers_offline import mock_post_bulk
 
 # os.environ["REQUESTS_CA_BUNDLE"] = (
 #     os.environ["HOME"] + "/tmp/ca-bundle.pem"
@@ -34,6 +46,7 @@ def mock_get(*args, **kwargs):
 
         def __init__(self, json_data, status_code):
             self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
             self.status_code = status_code
 
         def json(self):
@@ -83,6 +96,7 @@ def mock_get401(*args, **kwargs):
 
         def __init__(self, json_data, status_code, text):
             self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
             self.status_code = status_code
             self.text = text
 
@@ -114,6 +128,7 @@ def mock_post(*args, **kwargs):
 
         def __init__(self, json_data, status_code, text):
             self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
             self.status_code = status_code
             self.text = text
 
@@ -172,6 +187,34 @@ def mock_post(*args, **kwargs):
     return MockResponse({"id": 1, "name": "John Doe"}, 200, "text")
 
 
+def mock_post_index(*args, **kwargs):
+    """MockResponse function for openobserve calls of httpx.post - ingestion"""
+
+    class MockResponse:
+        """MockResponse class for openobserve calls of httpx.post"""
+
+        def __init__(self, json_data, status_code, text):
+            self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
+            self.status_code = status_code
+            self.text = text
+
+        def json(self):
+            return self.json_data
+
+    documents = kwargs.get("json")
+    if documents is None:
+        documents = json.loads(kwargs.get("content") or b"[]")
+    return MockResponse(
+        {
+            "code": 200,
+            "status": [{"name": "pytest", "successful": len(documents), "failed": 0}],
+        },
+        200,
+        "",
+    )
+
+
 def mock_post502(*args, **kwargs):
     """MockResponse 502 function for openobserve calls of httpx.post"""
     url = args[0]
@@ -181,6 +224,7 @@ def mock_post502(*args, **kwargs):
 
         def __init__(self, json_data, status_code, text, url):
             self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
             self.status_code = status_code
             self.text = text
             self.url = url
@@ -203,6 +247,7 @@ def mock_post500(*args, **kwargs):
 
         def __init__(self, json_data, status_code, text, url):
             self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
             self.status_code = status_code
             self.text = text
             self.url = url
@@ -228,7 +273,22 @@ def test_connection_settings():
     assert OO_PASS
 
 
-@patch("httpx.get", side_effect=mock_get)
+def test_client_pool():
+    """Ensure one pooled http client is reused and closed with the context manager"""
+    with OpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, max_connections=4
+    ) as oo_conn:
+        client = oo_conn._client  # pylint: disable=protected-access
+        assert oo_conn.limits.max_connections == 4
+        assert not client.is_closed
+        with patch("httpx.Client.get", side_effect=mock_get):
+            oo_conn.list_objects("streams")
+            oo_conn.list_objects("users")
+        assert oo_conn._client is client  # pylint: disable=protected-access
+    assert client.is_closed
+
+
+@patch("httpx.Client.get", side_effect=mock_get)
 def test_list_object_streams(mock_get):
     """Ensure can list streams and have 'default' one (list_objects)"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -238,7 +298,7 @@ def test_list_object_streams(mock_get):
     assert default_stream
 
 
-@patch("httpx.get", side_effect=mock_get401)
+@patch("httpx.Client.get", side_effect=mock_get401)
 def test_list_object_streams401(mock_get):
     """Ensure can list streams and have 'default' one (list_objects)"""
     oo_conn = OpenObserve(
@@ -251,7 +311,7 @@ def test_list_object_streams401(mock_get):
         oo_conn.list_objects("streams", verbosity=5)
 
 
-@patch("httpx.get", side_effect=mock_get)
+@patch("httpx.Client.get", side_effect=mock_get)
 def test_list_object_users(mock_get):
     """Ensure can list users and have 'root@example.com' one (list_objects)"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -261,7 +321,424 @@ def test_list_object_users(mock_get):
     assert user
 
 
-@patch("httpx.post", side_effect=mock_post)
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_index(mock_post_index):
+    """Ensure can index one document (flattened, datetime converted)"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    res = oo_conn.index("pytest", {"time": datetime(2025, 1, 1), "action": "buy"})
+    assert res["status"][0]["successful"] == 1
+    assert mock_post_index.call_args.args[0] == "MOCK_INPUT/api/default/pytest/_json"
+    document = json.loads(mock_post_index.call_args.kwargs["content"])[0]
+    assert isinstance(document["time"], int)
+
+
+def test_flatten():
+    """Ensure nested dicts are flattened at any depth, lists kept as is"""
+    document = {
+        "action": "buy",
+        "portfolio": {"USD": 1.5, "crypto": {"BTC": 0.1, "ETH": {}}},
+        "tags": [{"a": 1}],
+    }
+    expected = {
+        "action": "buy",
+        "portfolio.USD": 1.5,
+        "portfolio.crypto.BTC": 0.1,
+        "portfolio.crypto.ETH": {},
+        "tags": [{"a": 1}],
+    }
+    assert flatten(document) == expected
+    # same shape, keys from cache
+    assert flatten(document) == expected
+    assert flatten({"portfolio": "none"}) == {"portfolio": "none"}
+    assert flatten({"a": {"b": 1}}, "root", "_") == {"root_a_b": 1}
+
+
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_index_many(mock_post_index):
+    """Ensure index_many consumes a generator in count-bounded chunks"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    documents = (
+        {"time": datetime(2025, 1, 1), "action": "buy", "n": n} for n in range(25)
+    )
+    res = oo_conn.index_many("pytest", documents, chunk_size=10)
+    assert res == {"successful": 25, "failed": 0}
+    assert mock_post_index.call_count == 3
+    bodies = [json.loads(x.kwargs["content"]) for x in mock_post_index.call_args_list]
+    assert [len(x) for x in bodies] == [10, 10, 5]
+    assert bodies[2][4]["n"] == 24
+    assert isinstance(bodies[0][0]["time"], int)
+
+
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_index_many_bytes(mock_post_index):
+    """Ensure index_many chunks are bounded by serialized size"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    documents = [{"log": "x" * 100} for _ in range(10)]
+    res = oo_conn.index_many("pytest", documents, chunk_bytes=250)
+    assert res == {"successful": 10, "failed": 0}
+    assert mock_post_index.call_count == 5
+    assert all(len(x.kwargs["content"]) <= 250 for x in mock_post_index.call_args_list)
+
+    # oversized document is sent alone
+    mock_post_index.reset_mock()
+    oo_conn.index_many("pytest", documents[:3], chunk_bytes=10)
+    assert mock_post_index.call_count == 3
+
+
+def test_index_stream():
+    """Ensure index_stream sends a lazily generated ndjson body to _multi"""
+    consumed = []
+
+    def documents():
+        for n in range(2000):
+            consumed.append(n)
+            yield {"n": n, "time": datetime(2025, 1, 1)}
+
+    def mock_post_multi(*args, **kwargs):
+        assert args[0] == "MOCK_INPUT/api/default/pytest/_multi"
+        assert kwargs["headers"]["Content-Type"] == "application/x-ndjson"
+        # nothing serialized before the request body is read
+        assert not consumed
+        chunks = list(kwargs["content"])
+        assert len(chunks) > 1
+        lines = b"".join(chunks).splitlines()
+        kwargs["json"] = [json.loads(x) for x in lines]
+        return mock_post_index(*args, **kwargs)
+
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with patch("httpx.Client.post", side_effect=mock_post_multi):
+        res = oo_conn.index_stream("pytest", documents(), buffer_bytes=1024)
+    assert res == {"successful": 2000, "failed": 0}
+
+
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_index_dataframe(mock_post_index):
+    """Ensure pandas dataframe rows are sent in chunks with epoch datetimes"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    df = pandas.DataFrame(
+        {
+            "n": range(5),
+            "amount": [n / 3 for n in range(5)],
+            "time": pandas.date_range("2025-01-01", periods=5, freq="s"),
+            "action": ["buy", None, "sell", "buy", "sell"],
+        }
+    )
+    res = oo_conn.index_dataframe("pytest", df, chunk_size=2)
+    assert res == {"successful": 5, "failed": 0}
+    assert mock_post_index.call_count == 3
+    rows = [
+        row
+        for call in mock_post_index.call_args_list
+        for row in json.loads(call.kwargs["content"])
+    ]
+    assert rows[1] == {
+        "n": 1,
+        "amount": 1 / 3,
+        "time": int(datetime(2025, 1, 1, 0, 0, 1).timestamp() * 1000000),
+        "action": None,
+    }
+
+    # chunks over chunk_bytes are split
+    mock_post_index.reset_mock()
+    res = oo_conn.index_dataframe("pytest", df, chunk_bytes=200)
+    assert res == {"successful": 5, "failed": 0}
+    assert mock_post_index.call_count > 1
+
+    # without polars, pandas json output is used
+    mock_post_index.reset_mock()
+    with patch("python_openobserve.openobserve.HAVE_MODULE_POLARS", False):
+        res = oo_conn.index_dataframe("pytest", df)
+    assert res == {"successful": 5, "failed": 0}
+    row = json.loads(mock_post_index.call_args.kwargs["content"])[1]
+    assert row["time"] == int(datetime(2025, 1, 1, 0, 0, 1).timestamp() * 1000000)
+    # floats keep their precision
+    assert row["amount"] == 1 / 3
+
+    # numpy columns go through polars without pyarrow
+    mock_post_index.reset_mock()
+    with (
+        patch("python_openobserve.openobserve.HAVE_MODULE_PYARROW", False),
+        patch("polars.from_pandas", wraps=polars.from_pandas) as from_pandas,
+    ):
+        res = oo_conn.index_dataframe("pytest", df[["n", "amount", "time"]])
+    assert res == {"successful": 5, "failed": 0}
+    assert from_pandas.call_count == 1
+    assert json.loads(mock_post_index.call_args.kwargs["content"])[1] == {
+        key: val for key, val in rows[1].items() if key != "action"
+    }
+
+    with pytest.raises(Exception, match="expects a pandas or polars DataFrame"):
+        oo_conn.index_dataframe("pytest", [{"n": 1}])
+
+
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_index_dataframe_polars(mock_post_index):
+    """Ensure polars dataframe rows are sent with epoch datetimes"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    df = polars.DataFrame(
+        {
+            "n": [0, 1],
+            "time": [datetime(2025, 1, 1), datetime(2025, 1, 1, 0, 0, 1)],
+        }
+    )
+    assert oo_conn.index_dataframe("pytest", df) == {"successful": 2, "failed": 0}
+    assert json.loads(mock_post_index.call_args.kwargs["content"]) == [
+        {"n": 0, "time": int(datetime(2025, 1, 1).timestamp() * 1000000)},
+        {"n": 1, "time": int(datetime(2025, 1, 1, 0, 0, 1).timestamp() * 1000000)},
+    ]
+
+
+@pytest.fixture
+def local_time_zone():
+    """Run test in a time zone with daylight saving time"""
+    previous = os.environ.get("TZ")
+    os.environ["TZ"] = "Europe/Paris"
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = previous
+    time.tzset()
+
+
+@pytest.mark.parametrize(
+    "route", ["polars", "pandas_polars", "pandas_no_pyarrow", "pandas_no_polars"]
+)
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_index_dataframe_local_time(mock_post_index, local_time_zone, route):
+    """Ensure naive datetimes are sent as local time like index(), aware ones as is"""
+    if route == "pandas_polars":
+        # aware pandas datetimes need pyarrow to go through polars
+        pytest.importorskip("pyarrow")
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    naive = [datetime(2025, 1, 1, 12), datetime(2025, 7, 1, 12, 0, 0, 5), None]
+    aware = [datetime(2025, 7, 1, 12, tzinfo=timezone.utc)] * 3
+    data = {"naive": naive, "aware": aware}
+    df = polars.DataFrame(data) if route == "polars" else pandas.DataFrame(data)
+    with (
+        patch(
+            "python_openobserve.openobserve.HAVE_MODULE_PYARROW",
+            route != "pandas_no_pyarrow",
+        ),
+        patch(
+            "python_openobserve.openobserve.HAVE_MODULE_POLARS",
+            route != "pandas_no_polars",
+        ),
+    ):
+        oo_conn.index_dataframe("pytest", df)
+    rows = json.loads(mock_post_index.call_args.kwargs["content"])
+    expected = [
+        json.loads(oo_conn._encode_document({"naive": x}))["naive"] for x in naive[:2]
+    ]
+    assert [row["naive"] for row in rows] == expected + [None]
+    # one hour apart from UTC in winter, two in summer
+    assert [x - y for x, y in zip(expected, [1735732800000000, 1751371200000005])] == [
+        -3600000000,
+        -7200000000,
+    ]
+    assert {row["aware"] for row in rows} == {1751371200000000}
+
+
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_index_raw(mock_post_index):
+    """Ensure serialized json lines are framed into bodies without parsing"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    data = b"".join(b'{"n":%d,"nested":{"a":1}}\r\n' % n for n in range(25)) + b"\n  \n"
+    res = oo_conn.index_raw("pytest", memoryview(data), chunk_size=10)
+    assert res == {"successful": 25, "failed": 0}
+    bodies = [x.kwargs["content"] for x in mock_post_index.call_args_list]
+    assert bodies[0] == b"[" + b",".join(data.split(b"\r\n")[:10]) + b"]"
+    assert [len(json.loads(x)) for x in bodies] == [10, 10, 5]
+
+    mock_post_index.reset_mock()
+    lines = ['{"msg":"héllo"}\n', b'{"n":1}', bytearray(b' {"n":2} '), ""]
+    res = oo_conn.index_raw("pytest", iter(lines), chunk_bytes=20)
+    assert res == {"successful": 3, "failed": 0}
+    assert [
+        json.loads(x.kwargs["content"]) for x in mock_post_index.call_args_list
+    ] == [[{"msg": "héllo"}], [{"n": 1}, {"n": 2}]]
+
+
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_index_raw_str(mock_post_index):
+    """Ensure a str payload is split into lines, not characters"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    res = oo_conn.index_raw("pytest", '{"a":1}\n{"a":"é"}\n')
+    assert res == {"successful": 2, "failed": 0}
+    assert json.loads(mock_post_index.call_args.kwargs["content"]) == [
+        {"a": 1},
+        {"a": "é"},
+    ]
+
+
+def test_ingest_file_ndjson(tmp_path):
+    """Ensure ndjson lines are sent unparsed in chunks"""
+    path = tmp_path / "dump.jsonl"
+    path.write_bytes(b"".join(b'{"n":%d}\n' % n for n in range(25)) + b"\n")
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with patch("httpx.Client.post", side_effect=mock_post_index) as mock_post:
+        res = oo_conn.ingest_file("pytest", path, chunk_size=10, concurrency=2)
+        bodies = [json.loads(x.kwargs["content"]) for x in mock_post.call_args_list]
+    assert res == {"successful": 25, "failed": 0}
+    assert sorted(len(x) for x in bodies) == [5, 10, 10]
+    assert sorted(row["n"] for body in bodies for row in body) == list(range(25))
+
+    empty = tmp_path / "empty.ndjson"
+    empty.touch()
+    assert oo_conn.ingest_file("pytest", empty) == {"successful": 0, "failed": 0}
+    with pytest.raises(ValueError, match="Invalid file format .csv"):
+        oo_conn.ingest_file("pytest", tmp_path / "dump.csv")
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+@patch("httpx.Client.post", side_effect=mock_post_index)
+def test_ingest_file_arrow(mock_post_index, tmp_path, file_format):
+    """Ensure parquet and arrow files are sent by batch with epoch datetimes"""
+    pytest.importorskip("pyarrow")
+    df = polars.DataFrame(
+        {
+            "n": range(25),
+            "time": [datetime(2025, 1, 1)] * 25,
+        }
+    )
+    path = tmp_path / f"dump.{file_format}"
+    if file_format == "parquet":
+        df.write_parquet(path)
+    else:
+        df.write_ipc(path)
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    res = oo_conn.ingest_file("pytest", path, chunk_size=10)
+    assert res == {"successful": 25, "failed": 0}
+    rows = [
+        row
+        for call in mock_post_index.call_args_list
+        for row in json.loads(call.kwargs["content"])
+    ]
+    assert sorted(row["n"] for row in rows) == list(range(25))
+    assert rows[0]["time"] == int(datetime(2025, 1, 1).timestamp() * 1000000)
+
+
+@patch("httpx.Client.post", side_effect=mock_post_bulk)
+def test_ingest(mock_post_bulk):
+    """Ensure ingest reports each failed document"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    documents = [{"n": 0}, {"n": 1, "fail": 400}, {"n": 2}]
+    res = oo_conn.ingest("pytest", documents, chunk_size=2)
+    assert mock_post_bulk.call_count == 2
+    assert mock_post_bulk.call_args.args[0].endswith("/api/default/_bulk")
+    assert res == {
+        "successful": 2,
+        "failed": 1,
+        "retried": 0,
+        "errors": [
+            {
+                "document": {"n": 1, "fail": 400},
+                "status": 400,
+                "error": {"type": "rejected", "reason": "mock"},
+            }
+        ],
+    }
+
+
+def test_ingest_retry(tmp_path):
+    """Ensure only failed documents are retried, then spooled"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    calls = []
+
+    def mock_post_busy(*args, **kwargs):
+        calls.append(kwargs["content"])
+        if len(calls) > 1:
+            kwargs["content"] = kwargs["content"].replace(b',"fail":503', b"")
+        return mock_post_bulk(*args, **kwargs)
+
+    documents = [{"n": 0}, {"n": 1, "fail": 503}, {"n": 2}]
+    with patch("httpx.Client.post", side_effect=mock_post_busy):
+        res = oo_conn.ingest("pytest", documents, max_retries=2, initial_backoff=0)
+    assert res == {"successful": 3, "failed": 0, "retried": 1, "errors": []}
+    assert len(calls) == 2
+    assert calls[1].count(b"\n") == 2
+
+    oo_conn = OpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, spool=Spool(tmp_path)
+    )
+    with patch(
+        "httpx.Client.post", side_effect=httpx.ConnectError("connection refused")
+    ) as mock_post:
+        res = oo_conn.ingest("pytest", documents, max_retries=1, initial_backoff=0)
+    assert mock_post.call_count == 2
+    assert res == {
+        "successful": 0,
+        "failed": 0,
+        "retried": 3,
+        "spooled": 3,
+        "errors": [],
+    }
+    with patch("httpx.Client.post", side_effect=mock_post_index) as mock_post:
+        assert oo_conn.replay_spool() == 1
+        assert json.loads(mock_post.call_args.kwargs["content"]) == documents
+
+
+def test_compression_gzip():
+    """Ensure request bodies above threshold are gzip encoded"""
+    oo_conn = OpenObserve(
+        host=OO_HOST,
+        user=OO_USER,
+        password=OO_PASS,
+        compression="gzip",
+        compression_threshold=100,
+    )
+    documents = [{"n": n, "message": "repeated log line"} for n in range(50)]
+    with patch("httpx.Client.post", side_effect=mock_post_index) as mock_post:
+        oo_conn.index("pytest", {"n": 0})
+        assert "Content-Encoding" not in mock_post.call_args.kwargs["headers"]
+        assert json.loads(mock_post.call_args.kwargs["content"]) == [{"n": 0}]
+
+        def mock_post_gzip(*args, **kwargs):
+            assert kwargs["headers"]["Content-Encoding"] == "gzip"
+            kwargs["content"] = gzip.decompress(kwargs["content"])
+            return mock_post_index(*args, **kwargs)
+
+        mock_post.side_effect = mock_post_gzip
+        assert oo_conn.index_many("pytest", documents) == {
+            "successful": 50,
+            "failed": 0,
+        }
+        body = mock_post.call_args.kwargs["content"]
+        assert len(body) < len(
+            oo_conn._json_array([oo_conn._dumps(d) for d in documents])
+        )
+
+        def mock_post_multi(*args, **kwargs):
+            assert kwargs["headers"]["Content-Encoding"] == "gzip"
+            lines = gzip.decompress(b"".join(kwargs["content"])).splitlines()
+            kwargs["json"] = [json.loads(x) for x in lines]
+            return mock_post_index(*args, **kwargs)
+
+        mock_post.side_effect = mock_post_multi
+        res = oo_conn.index_stream("pytest", documents, buffer_bytes=100)
+    assert res == {"successful": 50, "failed": 0}
+
+
+def test_compression_zstd():
+    """Ensure request bodies can be zstd encoded"""
+    zstandard = pytest.importorskip("zstandard")
+    oo_conn = OpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, compression="zstd"
+    )
+    body = oo_conn._json_array([b'{"n":0}'] * 1000)
+    content, headers = oo_conn._request_body(body)
+    assert headers["Content-Encoding"] == "zstd"
+    assert zstandard.ZstdDecompressor().decompress(content) == body
+
+
+def test_compression_invalid():
+    """Ensure unknown compression is refused"""
+    with pytest.raises(ValueError, match="Invalid compression"):
+        OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS, compression="br")
+
+
+@patch("httpx.Client.post", side_effect=mock_post)
 def test_search1(mock_post):
     """Ensure can do logs search (default stream)"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -275,7 +752,7 @@ def test_search1(mock_post):
     assert search_results
 
 
-@patch("httpx.post", side_effect=mock_post)
+@patch("httpx.Client.post", side_effect=mock_post)
 def test_search1_df(mock_post):
     """Ensure can do logs search (default stream, dataframe output)"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -296,7 +773,7 @@ def test_search1_df(mock_post):
     assert "_timestamp" in df_search_results.columns
 
 
-@patch("httpx.post", side_effect=mock_post)
+@patch("httpx.Client.post", side_effect=mock_post)
 def test_search1_dftypes(mock_post):
     """Ensure can do logs search (default stream, dataframe output, timestamp type)"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -331,7 +808,7 @@ def test_search1_dftypes(mock_post):
     assert df_search_results["_timestamp"].dtypes == "datetime64[ns]"
 
 
-@patch("httpx.post", side_effect=mock_post502)
+@patch("httpx.Client.post", side_effect=mock_post502)
 def test_search_sql_invalid1(mock_post502):
     """Ensure error on invalid sql input"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -344,7 +821,7 @@ def test_search_sql_invalid1(mock_post502):
         )
 
 
-@patch("httpx.post", side_effect=mock_post500)
+@patch("httpx.Client.post", side_effect=mock_post500)
 def test_search_sql_invalid2(mock_post500):
     """Ensure error on invalid sql input"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -363,7 +840,7 @@ def test_search_sql_invalid2(mock_post500):
         )
 
 
-@patch("httpx.post", side_effect=mock_post500)
+@patch("httpx.Client.post", side_effect=mock_post500)
 def test_search_sql_invalid3(mock_post500):
     """Ensure error on invalid sql input"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -379,7 +856,7 @@ def test_search_sql_invalid3(mock_post500):
         )
 
 
-@patch("httpx.post", side_effect=mock_post500)
+@patch("httpx.Client.post", side_effect=mock_post500)
 def test_search_sql_invalid4(mock_post500):
     """Ensure error on invalid sql input"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -395,6 +872,246 @@ def test_search_sql_invalid4(mock_post500):
         )
 
 
+def mock_post_pages(*args, **kwargs):
+    """MockResponse function for openobserve calls of httpx.post - 25 hits by page"""
+
+    class MockResponse:
+        """MockResponse class for openobserve calls of httpx.post"""
+
+        def __init__(self, json_data, status_code, text):
+            self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
+            self.status_code = status_code
+            self.text = text
+
+        def json(self):
+            return self.json_data
+
+    query = json.loads(kwargs["content"])["query"]
+    hits = [
+        {"_timestamp": 1674213225158000 + n, "n": n}
+        for n in range(25)[query["from"] : query["from"] + query["size"]]
+    ]
+    return MockResponse({"took": 1, "hits": hits, "total": 25}, 200, "")
+
+
+@pytest.mark.parametrize("page_size, requests", [(10, 3), (5, 6), (100, 1)])
+@patch("httpx.Client.post", side_effect=mock_post_pages)
+def test_search_iter(mock_post_pages, page_size, requests):
+    """Ensure search_iter() yields all hits lazily page by page"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    hits = oo_conn.search_iter(
+        "select * from pytest", page_size=page_size, timestamp_columns=["_timestamp"]
+    )
+    assert next(hits)["n"] == 0
+    assert mock_post_pages.call_count == 1
+    assert [x["n"] for x in hits] == list(range(1, 25))
+    assert mock_post_pages.call_count == requests
+    queries = [json.loads(x.kwargs["content"]) for x in mock_post_pages.call_args_list]
+    assert [x["query"]["from"] for x in queries] == [
+        page_size * n for n in range(requests)
+    ]
+    assert all(x["query"]["size"] == page_size for x in queries)
+    with pytest.raises(ValueError):
+        next(oo_conn.search_iter("select * from pytest", page_size=0))
+
+
+def mock_post_partitions(*args, **kwargs):
+    """MockResponse function for openobserve calls of httpx.post - hits in time range"""
+
+    class MockResponse:
+        """MockResponse class for openobserve calls of httpx.post"""
+
+        def __init__(self, json_data, status_code, text):
+            self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
+            self.status_code = status_code
+            self.text = text
+
+        def json(self):
+            return self.json_data
+
+    query = json.loads(kwargs["content"])["query"]
+    # two hits per timestamp, 0 to 99
+    hits = [
+        {"_timestamp": n // 2, "n": n}
+        for n in range(200)
+        if query["start_time"] <= n // 2 < query["end_time"]
+    ]
+    if "ASC" not in query["sql"]:
+        hits.reverse()
+    return MockResponse({"took": 1, "hits": hits[: query["size"]]}, 200, "")
+
+
+@patch("httpx.Client.post", side_effect=mock_post_partitions)
+def test_search_partitioned(mock_post_partitions):
+    """Ensure sub-interval searches are merged in _timestamp order"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    sql = "SELECT * FROM pytest"
+    hits = list(
+        oo_conn.search_partitioned(
+            sql, start_time=0, end_time=100, partitions=4, query_size=1000
+        )
+    )
+    assert mock_post_partitions.call_count == 4
+    queries = sorted(
+        (x["start_time"], x["end_time"])
+        for x in (
+            json.loads(call.kwargs["content"])["query"]
+            for call in mock_post_partitions.call_args_list
+        )
+    )
+    assert queries == [(0, 25), (25, 50), (50, 75), (75, 100)]
+    assert [x["n"] for x in hits] == list(reversed(range(200)))
+
+    hits = oo_conn.search_partitioned(
+        f"{sql} ORDER BY _timestamp ASC",
+        start_time=10,
+        end_time=17,
+        partitions=3,
+        query_size=5,
+    )
+    assert [x["n"] for x in hits] == [20, 21, 22, 23, 24]
+
+    hits = oo_conn.search_partitioned(
+        f"{sql} ORDER BY n DESC", start_time=0, end_time=3, partitions=5
+    )
+    assert [x["n"] for x in hits] == [5, 4, 3, 2, 1, 0]
+
+    with pytest.raises(ValueError, match="HAVING"):
+        oo_conn.search_partitioned(
+            "SELECT n, count(*) FROM pytest GROUP BY n HAVING count(*) > 1",
+            start_time=0,
+            end_time=10,
+        )
+    with pytest.raises(ValueError, match="end_time > start_time"):
+        oo_conn.search_partitioned(sql, start_time=10, end_time=10)
+
+
+@patch("httpx.Client.post", side_effect=mock_post_partitions)
+def test_search_partitioned_limit(mock_post_partitions):
+    """Ensure LIMIT and OFFSET apply to merged hits, not to each sub-interval"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    hits = oo_conn.search_partitioned(
+        "SELECT * FROM pytest LIMIT 10 OFFSET 5",
+        start_time=0,
+        end_time=100,
+        partitions=4,
+    )
+    assert [x["n"] for x in hits] == list(range(194, 184, -1))
+    for call in mock_post_partitions.call_args_list:
+        query = json.loads(call.kwargs["content"])["query"]
+        assert "LIMIT" not in query["sql"] and "OFFSET" not in query["sql"]
+        assert query["size"] == 15
+
+
+def test_search_partitioned_null():
+    """Ensure NULL values of the ORDER BY column are merged like the server sorts them"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    values = [3, None, 1, 7, None, 5, 2, 8]
+
+    def post_search(query, *args, **kwargs):
+        query = query["query"]
+        hits = [
+            {"_timestamp": t, "v": v}
+            for t, v in enumerate(values)
+            if query["start_time"] <= t < query["end_time"]
+        ]
+        descending = "DESC" in query["sql"]
+        # NULL sorts after any value
+        hits.sort(key=lambda x: (x["v"] is None, x["v"]), reverse=descending)
+        return {"hits": hits[: query["size"]]}
+
+    with patch.object(oo_conn, "_post_search", side_effect=post_search):
+        for order, expected in [
+            ("DESC", [None, None, 8, 7, 5, 3, 2, 1]),
+            ("ASC", [1, 2, 3, 5, 7, 8, None, None]),
+        ]:
+            hits = oo_conn.search_partitioned(
+                f"SELECT * FROM pytest ORDER BY v {order}",
+                start_time=0,
+                end_time=len(values),
+                partitions=3,
+            )
+            assert [x["v"] for x in hits] == expected
+
+
+def test_search_partitioned_hidden_order():
+    """Ensure hits are merged on an ORDER BY column which is not selected"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    rows = [(0, 3, "a"), (1, 1, "b"), (2, 4, "c"), (3, 2, "d")]
+    sqls = []
+
+    def post_search(query, *args, **kwargs):
+        query = query["query"]
+        sqls.append(query["sql"])
+        hits = [
+            {"msg": msg, "_o1": level}
+            for t, level, msg in sorted(rows, key=lambda x: x[1])
+            if query["start_time"] <= t < query["end_time"]
+        ]
+        if '"_o1"' not in query["sql"]:
+            hits = [{"msg": x["msg"]} for x in hits]
+        return {"hits": hits[: query["size"]]}
+
+    with patch.object(oo_conn, "_post_search", side_effect=post_search):
+        hits = list(
+            oo_conn.search_partitioned(
+                "SELECT msg FROM s ORDER BY level LIMIT 2",
+                start_time=0,
+                end_time=4,
+                partitions=2,
+            )
+        )
+    assert hits == [{"msg": "b"}, {"msg": "d"}]
+    assert sqls == ['SELECT msg, level AS "_o1" FROM s ORDER BY level'] * 2
+
+
+def mock_stream_search(*args, **kwargs):
+    """Mock function for openobserve calls of httpx.stream - 200000 hits"""
+
+    class MockResponse:
+        """MockResponse class for openobserve calls of httpx.stream"""
+
+        status_code = 200
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def iter_bytes(self):
+            yield b'{"took":155,"hits":['
+            for n in range(0, 200000, 1000):
+                yield b",".join(
+                    b'{"_timestamp":%d,"n":%d,"log":"%s"}'
+                    % (1674213225158000 + i, i, b"x" * 64)
+                    for i in range(n, n + 1000)
+                ) + (b"," if n < 199000 else b"")
+            yield b'],"total":200000,"from":0,"size":200000}'
+
+    return MockResponse()
+
+
+@pytest.mark.limit_memory("20 MB")
+@patch("httpx.Client.stream", side_effect=mock_stream_search)
+def test_search_lazy(mock_stream_search):
+    """Ensure hits of a large response are decoded one at a time"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    hits = oo_conn.search_lazy(
+        "SELECT * FROM pytest", query_size=200000, timestamp_columns=["_timestamp"]
+    )
+    first = next(hits)
+    assert first["n"] == 0
+    assert isinstance(first["_timestamp"], datetime)
+    assert sum(1 for _ in hits) == 199999
+    assert mock_stream_search.call_args.args[:2] == (
+        "POST",
+        "MOCK_INPUT/api/default/_search",
+    )
+
+
 def test_search_sql_parse_error1():
     """Ensure par error on sql input"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -410,6 +1127,34 @@ def test_search_sql_parse_error1():
         )
 
 
+@patch("httpx.Client.post", side_effect=mock_post)
+def test_search_sql_validate(mock_post):
+    """Ensure sql validation is memoized and can be skipped"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    sql = 'SELECT log_file_name,count(*) FROM "default" GROUP BY log_file_name'
+    normalize_sql.cache_clear()
+    with patch("sqlglot.transpile", wraps=sqlglot.transpile) as transpile:
+        for _ in range(3):
+            oo_conn.search(sql, start_time=0, end_time=1)
+        assert transpile.call_count == 1
+        for _ in range(2):
+            with pytest.raises(sqlglot.errors.ParseError):
+                oo_conn.search("SELECT (", start_time=0, end_time=1)
+        assert transpile.call_count == 3
+        oo_conn.search("SELECT (", start_time=0, end_time=1, validate=False)
+        assert transpile.call_count == 3
+    assert mock_post.call_count == 4
+
+
+def test_sql_lazy_import():
+    """Ensure importing the client doesn't import sqlglot"""
+    code = (
+        "import sys, python_openobserve.openobserve, python_openobserve.helpers;"
+        "sys.exit('sqlglot' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
+
+
 def test_search_time_invalid1():
     """Ensure error on invalid time input (float)"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -442,6 +1187,7 @@ def mock_post_kunai(*args, **kwargs):
 
         def __init__(self, json_data, status_code):
             self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
             self.status_code = status_code
 
         def json(self):
@@ -531,7 +1277,7 @@ def mock_post_kunai(*args, **kwargs):
 # fixed bug: failed attempt to convert journald field 'body___monotonic_timestamp',
 # 'body__runtime_scope', and kunai 'info_utc_time' from __intts2datetime just
 # detecting 'time' in key
-@patch("httpx.post", side_effect=mock_post_kunai)
+@patch("httpx.Client.post", side_effect=mock_post_kunai)
 def test_search_time_conversion1(mock_post_kunai, capsys):
     """Repeat time conversion issue"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -550,7 +1296,7 @@ def test_search_time_conversion1(mock_post_kunai, capsys):
     assert "could not convert timestamp:" in captured.out
 
 
-@patch("httpx.post", side_effect=mock_post_kunai)
+@patch("httpx.Client.post", side_effect=mock_post_kunai)
 def test_search_time_conversion2(mock_post_kunai, capsys):
     """Ensure no time conversion issue if no auto conversion"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -564,7 +1310,7 @@ def test_search_time_conversion2(mock_post_kunai, capsys):
     assert "could not convert timestamp:" not in captured.out
 
 
-@patch("httpx.post", side_effect=mock_post_kunai)
+@patch("httpx.Client.post", side_effect=mock_post_kunai)
 def test_search_time_conversion3(mock_post_kunai, capsys):
     """Ensure correct explicit time conversion with search2df()"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -596,6 +1342,7 @@ def mock_delete404(*args, **kwargs):
 
         def __init__(self, json_data, status_code, text, url):
             self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
             self.status_code = status_code
             self.text = text
             self.url = url
@@ -614,7 +1361,7 @@ def mock_delete404(*args, **kwargs):
     return MockResponse({}, 404, "", "https://openobserve.example.com")
 
 
-@patch("httpx.delete", side_effect=mock_delete404)
+@patch("httpx.Client.delete", side_effect=mock_delete404)
 def test_delete_object_users1(mock_delete404):
     """Ensure can delete users - invalid/non-existent"""
     # pylint: disable=no-member
@@ -637,6 +1384,7 @@ def mock_post_users(*args, **kwargs):
 
         def __init__(self, json_data, status_code, text, url):
             self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
             self.status_code = status_code
             self.text = text
             self.url = url
@@ -664,6 +1412,7 @@ def mock_delete(*args, **kwargs):
 
         def __init__(self, json_data, status_code, text, url):
             self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
             self.status_code = status_code
             self.text = text
             self.url = url
@@ -682,7 +1431,7 @@ def mock_delete(*args, **kwargs):
     return MockResponse({}, 200, "", "https://openobserve.example.com")
 
 
-@patch("httpx.post", side_effect=mock_post_users)
+@patch("httpx.Client.post", side_effect=mock_post_users)
 def test_create_object_users(mock_post_users, capsys):
     """Ensure can create and delete user"""
     # pylint: disable=no-member
@@ -716,6 +1465,7 @@ def mock_post_alert1(*args, **kwargs):
 
         def __init__(self, json_data, status_code, text, url):
             self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
             self.status_code = status_code
             self.text = text
             self.url = url
@@ -734,7 +1484,7 @@ def mock_post_alert1(*args, **kwargs):
     return MockResponse({}, 200, "", "https://openobserve.example.com")
 
 
-@patch("httpx.post", side_effect=mock_post_alert1)
+@patch("httpx.Client.post", side_effect=mock_post_alert1)
 def test_import_alert1(mock_post_alert1, capsys):
     """Ensure import alert works"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -830,7 +1580,7 @@ def test_import_alert6():
         )
 
 
-@patch("httpx.post", side_effect=mock_post)
+@patch("httpx.Client.post", side_effect=mock_post)
 def test_import_user1(capsys):
     """Ensure import user works"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -859,7 +1609,7 @@ def test_import_user1(capsys):
     # assert "Create returns True" in captured.out
 
 
-@patch("httpx.delete", side_effect=mock_delete)
+@patch("httpx.Client.delete", side_effect=mock_delete)
 def test_delete_object_users(mock_delete, capsys):
     """Ensure can create and delete user"""
     # pylint: disable=no-member
@@ -873,7 +1623,7 @@ def test_delete_object_users(mock_delete, capsys):
     assert "Delete object completed" in captured.out
 
 
-@patch("httpx.post", side_effect=mock_post)
+@patch("httpx.Client.post", side_effect=mock_post)
 def test_import_function1(capsys):
     """Ensure import function works"""
     oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
@@ -910,7 +1660,7 @@ def test_import_function1(capsys):
     # assert "Create returns True" in captured.out
 
 
-@patch("httpx.post", side_effect=mock_post)
+@patch("httpx.Client.post", side_effect=mock_post)
 def test_import_pipeline1(capsys):
     """
     Ensure import pipeline works
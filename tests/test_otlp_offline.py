@@ -0,0 +1,175 @@
+"""
+Pytest file for python-openobserve - OTLP export, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code,too-few-public-methods,no-member
+import gzip
+from datetime import datetime
+from unittest.mock import patch
+import httpx  # type: ignore
+import pytest  # type: ignore
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.otlp import OtlpExporter
+
+logs_service_pb2 = pytest.importorskip(
+    "opentelemetry.proto.collector.logs.v1.logs_service_pb2"
+)
+trace_service_pb2 = pytest.importorskip(
+    "opentelemetry.proto.collector.trace.v1.trace_service_pb2"
+)
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+SPAN_ID = "b7ad6b7169203331"
+
+
+def mock_post_otlp(*args, **kwargs):
+    """MockResponse function for openobserve otlp calls of httpx.post"""
+
+    class MockResponse:
+        """MockResponse class for openobserve otlp calls of httpx.post"""
+
+        def __init__(self, content, status_code):
+            self.content = content
+            self.status_code = status_code
+            self.text = ""
+            self.headers = {"content-type": "application/x-protobuf"}
+
+    content = kwargs["content"]
+    if kwargs["headers"].get("Content-Encoding") == "gzip":
+        content = gzip.decompress(content)
+    if args[0].endswith("/v1/logs"):
+        request = logs_service_pb2.ExportLogsServiceRequest.FromString(content)
+        records = request.resource_logs[0].scope_logs[0].log_records
+        response = logs_service_pb2.ExportLogsServiceResponse()
+        # records with a reject attribute are refused
+        response.partial_success.rejected_log_records = sum(
+            1 for x in records if any(a.key == "reject" for a in x.attributes)
+        )
+        return MockResponse(response.SerializeToString(), 200)
+    return MockResponse(
+        trace_service_pb2.ExportTraceServiceResponse().SerializeToString(), 200
+    )
+
+
+@patch("httpx.Client.post", side_effect=mock_post_otlp)
+def test_otlp_logs(mock_post_otlp):
+    """Ensure log records are protobuf encoded and sent in batches"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with OtlpExporter(
+        oo_conn, service_name="pytest", stream="pytest", chunk_size=4
+    ) as exporter:
+        for n in range(5):
+            exporter.add_log(
+                f"message {n}",
+                timestamp=datetime(2025, 1, 1, 12, 30),
+                severity="warning",
+                attributes={"n": n, "ok": True, "tags": ["a", "b"], "ctx": {"x": 1.5}},
+                trace_id=TRACE_ID,
+                span_id=SPAN_ID,
+            )
+        exporter.add_log({"structured": 1}, attributes={"reject": 1})
+        assert mock_post_otlp.call_count == 1
+    assert mock_post_otlp.call_count == 2
+    call = mock_post_otlp.call_args_list[0]
+    assert call.args[0] == "MOCK_INPUT/api/default/v1/logs"
+    assert call.kwargs["headers"]["Content-Type"] == "application/x-protobuf"
+    assert call.kwargs["headers"]["stream-name"] == "pytest"
+    request = logs_service_pb2.ExportLogsServiceRequest.FromString(
+        call.kwargs["content"]
+    )
+    resource_logs = request.resource_logs[0]
+    assert resource_logs.resource.attributes[0].key == "service.name"
+    assert resource_logs.resource.attributes[0].value.string_value == "pytest"
+    records = resource_logs.scope_logs[0].log_records
+    assert [x.body.string_value for x in records] == [f"message {n}" for n in range(4)]
+    record = records[1]
+    assert record.time_unix_nano == int(datetime(2025, 1, 1, 12, 30).timestamp()) * (
+        10**9
+    )
+    assert record.severity_number == 13
+    assert record.trace_id.hex() == TRACE_ID
+    assert record.span_id.hex() == SPAN_ID
+    attributes = {x.key: x.value for x in record.attributes}
+    assert attributes["n"].int_value == 1
+    assert attributes["ok"].bool_value is True
+    assert [x.string_value for x in attributes["tags"].array_value.values] == ["a", "b"]
+    assert attributes["ctx"].kvlist_value.values[0].value.double_value == 1.5
+    assert exporter.stats == {"logs": 5, "spans": 0, "rejected": 1, "requests": 2}
+
+
+@patch("httpx.Client.post", side_effect=mock_post_otlp)
+def test_otlp_traces(mock_post_otlp):
+    """Ensure spans are protobuf encoded, compressed and sent on flush"""
+    oo_conn = OpenObserve(
+        host=OO_HOST,
+        user=OO_USER,
+        password=OO_PASS,
+        compression="gzip",
+        compression_threshold=0,
+    )
+    exporter = OtlpExporter(oo_conn)
+    for n in range(3):
+        exporter.add_span(
+            f"span {n}",
+            trace_id=bytes.fromhex(TRACE_ID),
+            span_id=f"{n:016x}",
+            parent_span_id=SPAN_ID,
+            start_time=1000,
+            end_time=2000,
+            kind="server",
+            status="error",
+            status_message="failed",
+        )
+    assert mock_post_otlp.call_count == 0
+    exporter.flush()
+    exporter.flush()
+    assert mock_post_otlp.call_count == 1
+    call = mock_post_otlp.call_args
+    assert call.args[0] == "MOCK_INPUT/api/default/v1/traces"
+    assert call.kwargs["headers"]["Content-Encoding"] == "gzip"
+    request = trace_service_pb2.ExportTraceServiceRequest.FromString(
+        gzip.decompress(call.kwargs["content"])
+    )
+    spans = request.resource_spans[0].scope_spans[0].spans
+    assert [x.name for x in spans] == ["span 0", "span 1", "span 2"]
+    assert spans[2].span_id == bytes(7) + b"\x02"
+    assert spans[2].parent_span_id.hex() == SPAN_ID
+    assert (spans[2].start_time_unix_nano, spans[2].end_time_unix_nano) == (1000, 2000)
+    assert spans[2].kind == 2
+    assert (spans[2].status.code, spans[2].status.message) == (2, "failed")
+    assert exporter.stats["spans"] == 3
+    with pytest.raises(ValueError, match="Invalid span kind"):
+        exporter.add_span(
+            "bad",
+            trace_id=TRACE_ID,
+            span_id=SPAN_ID,
+            start_time=0,
+            end_time=0,
+            kind="x",
+        )
+    with pytest.raises(ValueError, match="Expecting 8 bytes id"):
+        exporter.add_log("bad", span_id=TRACE_ID)
+
+
+def test_otlp_failure():
+    """Ensure records of a failed request are sent by the next flush"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    exporter = OtlpExporter(oo_conn)
+    exporter.add_log("first")
+    with patch("httpx.Client.post", side_effect=httpx.ConnectError("down")):
+        with pytest.raises(httpx.ConnectError):
+            exporter.flush_logs()
+    exporter.add_log("second")
+    with patch("httpx.Client.post", side_effect=mock_post_otlp) as mock_post:
+        exporter.flush()
+    request = logs_service_pb2.ExportLogsServiceRequest.FromString(
+        mock_post.call_args.kwargs["content"]
+    )
+    records = request.resource_logs[0].scope_logs[0].log_records
+    assert [x.body.string_value for x in records] == ["first", "second"]
+    assert exporter.stats["logs"] == 2
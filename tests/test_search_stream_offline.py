@@ -0,0 +1,120 @@
+"""
+Pytest file for python-openobserve - streaming search, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code
+import json
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest  # type: ignore
+from python_openobserve.openobserve import OpenObserve
+
+OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+
+class SSEHandler(BaseHTTPRequestHandler):
+    """Fake _search_stream endpoint sending one hits event per partition"""
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((self.path, query))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        sql = query["query"]["sql"]
+        events = [("search_response_metadata", {"results": {"total": 30}})]
+        for partition in range(3):
+            events.append(("progress", {"percent": partition * 33}))
+            events.append(
+                (
+                    "search_response_hits",
+                    {
+                        "hits": [
+                            {"_timestamp": 1674213225158000, "n": partition * 10 + i}
+                            for i in range(10)
+                        ]
+                    },
+                )
+            )
+        if "error" in sql:
+            events.append(("error", {"code": 500, "message": "query failed"}))
+        events.append(("end", "[[DONE]]"))
+        try:
+            for event, data in events:
+                if not isinstance(data, str):
+                    data = json.dumps(data)
+                self.wfile.write(f"event: {event}\ndata: {data}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                time.sleep(self.server.delay)
+        except (BrokenPipeError, ConnectionResetError):
+            self.server.cancelled.set()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def sse_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SSEHandler)
+    server.requests = []
+    server.delay = 0
+    server.cancelled = threading.Event()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def oo_client(server):
+    return OpenObserve(
+        host=f"http://127.0.0.1:{server.server_address[1]}",
+        user=OO_USER,
+        password=OO_PASS,
+    )
+
+
+def test_search_stream(sse_server):
+    """Ensure hits batches and progress events are yielded as they arrive"""
+    oo_conn = oo_client(sse_server)
+    events = list(
+        oo_conn.search_stream(
+            "SELECT * FROM pytest", query_size=30, timestamp_columns=["_timestamp"]
+        )
+    )
+    assert [event for event, _ in events] == ["metadata"] + ["progress", "hits"] * 3
+    assert events[0][1] == {"results": {"total": 30}}
+    assert [x["n"] for event, data in events if event == "hits" for x in data] == list(
+        range(30)
+    )
+    assert isinstance(events[2][1][0]["_timestamp"], datetime)
+    path, query = sse_server.requests[0]
+    assert path == "/api/default/_search_stream"
+    assert query["query"]["size"] == 30
+
+
+def test_search_stream_cancel(sse_server):
+    """Ensure leaving the loop cancels the search midway"""
+    sse_server.delay = 0.5
+    oo_conn = oo_client(sse_server)
+    started = time.monotonic()
+    for event, data in oo_conn.search_stream("SELECT * FROM pytest"):
+        if event == "hits":
+            first = data
+            break
+    assert [x["n"] for x in first] == list(range(10))
+    assert time.monotonic() - started < 2
+    assert sse_server.cancelled.wait(5)
+
+
+def test_search_stream_error(sse_server):
+    """Ensure error events raise"""
+    oo_conn = oo_client(sse_server)
+    with pytest.raises(Exception, match="search_stream returned error"):
+        for _ in oo_conn.search_stream("SELECT error FROM pytest"):
+            pass
@@ -0,0 +1,129 @@
+"""
+Pytest file for python-openobserve - ingestion spool, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code
+import json
+from unittest.mock import patch
+import httpx  # type: ignore
+import pytest  # type: ignore
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.bulk import BulkIndexer
+from python_openobserve.spool import Spool
+from tests.test_openobserve_api_offline import mock_post_index, mock_post502
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+
+def test_spool_replay_order(tmp_path):
+    """Ensure batches are replayed in order across segments and compacted"""
+    spool = Spool(tmp_path, segment_bytes=64)
+    for n in range(10):
+        spool.append(f"stream{n % 2}", f'[{{"n":{n}}}]'.encode())
+    assert len(list(tmp_path.glob("*.seg"))) > 1
+    assert spool.pending()
+
+    sent = []
+    assert spool.replay(lambda stream, body: sent.append((stream, body))) == 10
+    assert sent == [(f"stream{n % 2}", f'[{{"n":{n}}}]'.encode()) for n in range(10)]
+    assert not spool.pending()
+    assert not list(tmp_path.iterdir())
+
+
+def test_spool_replay_failure(tmp_path):
+    """Ensure failed batch and following ones are kept for next replay"""
+    spool = Spool(tmp_path)
+    for n in range(5):
+        spool.append("pytest", str(n).encode())
+
+    sent = []
+
+    def send(stream, body):
+        if body == b"2":
+            raise ConnectionError("server down")
+        sent.append(body)
+
+    with pytest.raises(ConnectionError, match="server down"):
+        spool.replay(send)
+    assert sent == [b"0", b"1"]
+
+    # appends after replay go to a new segment, replayed after older ones
+    spool.append("pytest", b"5")
+    sent = []
+    assert spool.replay(lambda stream, body: sent.append(body)) == 4
+    assert sent == [b"2", b"3", b"4", b"5"]
+
+
+def test_spool_torn_record(tmp_path):
+    """Ensure a partially written record is ignored"""
+    spool = Spool(tmp_path)
+    spool.append("pytest", b"complete")
+    spool.close()
+    segment = next(tmp_path.glob("*.seg"))
+    with open(segment, "ab") as f:
+        f.write(b"\x00\x00\x00\x06\x00\x00\x01\x00pytest[{")
+    sent = []
+    assert spool.replay(lambda stream, body: sent.append(body)) == 1
+    assert sent == [b"complete"]
+
+
+def test_index_many_spool(tmp_path):
+    """Ensure batches failing on server outage are spooled then replayed"""
+    oo_conn = OpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, spool=Spool(tmp_path)
+    )
+    documents = [{"n": n} for n in range(5)]
+    with patch("httpx.Client.post", side_effect=mock_post502):
+        res = oo_conn.index_many("pytest", documents, chunk_size=2)
+    assert res == {"successful": 0, "failed": 0, "spooled": 5}
+
+    with patch(
+        "httpx.Client.post", side_effect=httpx.ConnectError("connection refused")
+    ):
+        res = oo_conn.index("pytest", {"n": 5})
+        assert res["status"][0]["spooled"] == 1
+        with pytest.raises(httpx.ConnectError):
+            oo_conn.replay_spool()
+
+    with patch("httpx.Client.post", side_effect=mock_post_index) as mock_post:
+        assert oo_conn.replay_spool() == 4
+        sent = [json.loads(x.kwargs["content"]) for x in mock_post.call_args_list]
+    assert sent == [[{"n": 0}, {"n": 1}], [{"n": 2}, {"n": 3}], [{"n": 4}], [{"n": 5}]]
+    assert not oo_conn.spool.pending()
+
+
+@patch("httpx.Client.post", side_effect=mock_post502)
+def test_index_no_spool(mock_post502):
+    """Ensure errors are still raised without spool"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with pytest.raises(Exception, match="Openobserve index returned 502"):
+        oo_conn.index("pytest", {"n": 0})
+
+
+def test_bulk_indexer_spool(tmp_path):
+    """Ensure BulkIndexer spools failed batches and replays them"""
+    oo_conn = OpenObserve(
+        host=OO_HOST, user=OO_USER, password=OO_PASS, spool=Spool(tmp_path)
+    )
+    with patch("httpx.Client.post", side_effect=mock_post502):
+        with BulkIndexer(oo_conn, replay_interval=0) as indexer:
+            indexer.add("pytest", {"n": 0})
+            indexer.flush()
+            assert indexer.stats["spooled"] == 1
+    with patch("httpx.Client.post", side_effect=mock_post_index) as mock_post:
+        with BulkIndexer(oo_conn, replay_interval=0) as indexer:
+            indexer.add("pytest", {"n": 1})
+        sent = [json.loads(x.kwargs["content"]) for x in mock_post.call_args_list]
+    assert [{"n": 0}] in sent
+    assert [{"n": 1}] in sent
+    assert not oo_conn.spool.pending()
+
+
+def test_bulk_indexer_spool_policy():
+    """Ensure spool overflow policy requires a spool"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with pytest.raises(ValueError, match="requires a client with a spool"):
+        BulkIndexer(oo_conn, overflow="spool")
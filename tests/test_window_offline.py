@@ -0,0 +1,117 @@
+"""
+Pytest file for python-openobserve - rolling window queries, offline
+
+SPDX-FileCopyrightText: 2025 The python_openobserve authors
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+# pylint: disable=unused-argument,redefined-outer-name,missing-function-docstring,duplicate-code,too-few-public-methods
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+import pandas
+from python_openobserve.openobserve import OpenObserve
+from python_openobserve.window import RollingWindow
+
+OO_HOST = OO_USER = OO_PASS = "MOCK_INPUT"  # nosec B105
+
+NOW = datetime(2025, 1, 1, 12, 0)
+SECOND = 1000000
+
+
+def mock_post_seconds(*args, **kwargs):
+    """MockResponse function for openobserve calls of httpx.post - one row per second"""
+
+    class MockResponse:
+        """MockResponse class for openobserve calls of httpx.post"""
+
+        def __init__(self, json_data, status_code, text):
+            self.json_data = json_data
+            self.content = json.dumps(json_data).encode("utf-8")
+            self.status_code = status_code
+            self.text = text
+
+        def json(self):
+            return self.json_data
+
+    query = json.loads(kwargs["content"])["query"]
+    first = -(-query["start_time"] // SECOND) * SECOND
+    hits = [
+        {"_timestamp": timestamp, "level": "info" if timestamp % 3 else "error"}
+        for timestamp in range(first, query["end_time"], SECOND)
+    ]
+    if "count" in query["sql"]:
+        hits = [{"n": len(hits)}]
+    elif "ASC" not in query["sql"]:
+        hits.reverse()
+    hits = hits[query["from"] : query["from"] + query["size"]]
+    return MockResponse({"took": 1, "hits": hits}, 200, "")
+
+
+def full_window(oo_conn, sql, now, window):
+    end = int(now.timestamp() * SECOND)
+    return pandas.json_normalize(
+        oo_conn.search(
+            sql, start_time=end - int(window.total_seconds()) * SECOND, end_time=end
+        )
+    )
+
+
+@patch("httpx.Client.post", side_effect=mock_post_seconds)
+def test_rolling_window(mock_post_seconds):
+    """Ensure refreshes fetch only new rows and match a full query"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    sql = "SELECT * FROM pytest"
+    window = timedelta(minutes=15)
+    rolling = RollingWindow(oo_conn, sql, window=window, page_size=500)
+    df = rolling.refresh(NOW)
+    assert len(df) == 900
+    assert rolling.stats["fetched"] == 900
+    for seconds in (30, 60, 61, 61, 2000, 2030):
+        now = NOW + timedelta(seconds=seconds)
+        df = rolling.refresh(now)
+        pandas.testing.assert_frame_equal(df, full_window(oo_conn, sql, now, window))
+    # full fetch on first refresh and after the window was left behind
+    assert rolling.stats["full"] == 2
+    assert rolling.stats["fetched"] == 900 + 30 + 30 + 1 + 900 + 30
+    assert rolling.stats["dropped"] == 30 + 30 + 1 + 30
+
+    rolling = RollingWindow(
+        oo_conn,
+        f"{sql} ORDER BY _timestamp ASC",
+        window=timedelta(seconds=10),
+        timestamp_columns=["_timestamp"],
+    )
+    rolling.refresh(NOW)
+    df = rolling.refresh(NOW + timedelta(seconds=4))
+    assert len(df) == 10
+    assert df["_timestamp"].is_monotonic_increasing
+    assert df["_timestamp"].dtype.kind == "M"
+
+
+@patch("httpx.Client.post", side_effect=mock_post_seconds)
+def test_rolling_window_aggregate(mock_post_seconds):
+    """Ensure aggregate queries are fetched over the whole window"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    rolling = RollingWindow(
+        oo_conn,
+        "SELECT count(*) AS n FROM pytest",
+        window=timedelta(minutes=1),
+        delay=timedelta(seconds=10),
+    )
+    assert rolling.refresh(NOW)["n"].tolist() == [60]
+    assert rolling.refresh(NOW + timedelta(seconds=5))["n"].tolist() == [60]
+    assert rolling.stats["full"] == 2
+    query = json.loads(mock_post_seconds.call_args.kwargs["content"])["query"]
+    assert query["end_time"] == int(NOW.timestamp() * SECOND) - 5 * SECOND
+
+
+def test_rolling_window_empty():
+    """Ensure refreshes of a window without rows return empty frames"""
+    oo_conn = OpenObserve(host=OO_HOST, user=OO_USER, password=OO_PASS)
+    with patch.object(oo_conn, "_post_search", return_value={"hits": []}):
+        rolling = RollingWindow(oo_conn, "SELECT * FROM pytest")
+        for seconds in (0, 0, 10):
+            df = rolling.refresh(NOW + timedelta(seconds=seconds))
+            assert df.empty
+    assert rolling.stats["full"] == 1